@@ -0,0 +1,67 @@
+"""
+Measures the memory footprint of game states retained in history.
+
+Random games are played with the full history kept by the GameStateMachine,
+the memory allocated (as traced by tracemalloc) is then divided by the
+number of distinct game states retained.
+"""
+import sys
+import tracemalloc
+
+from dgisim.src.agents import RandomAgent
+from dgisim.src.game_state_machine import GameStateMachine
+from dgisim.src.state.game_state import GameState
+
+
+def _shallow_size(obj: object) -> int:
+    """ size of the object itself plus its attribute dict if any """
+    size = sys.getsizeof(obj)
+    if hasattr(obj, "__dict__"):
+        size += sys.getsizeof(obj.__dict__)
+    return size
+
+
+def _shallow_sizes(game_state: GameState) -> dict[str, int]:
+    player = game_state.get_player1()
+    characters = player.get_characters()
+    character = characters.get_characters()[0]
+    return {
+        "GameState": _shallow_size(game_state),
+        "PlayerState": _shallow_size(player),
+        "Characters": _shallow_size(characters),
+        "Character": _shallow_size(character),
+        "Statuses": _shallow_size(player.get_combat_statuses()),
+        "Summons": _shallow_size(player.get_summons()),
+        "Supports": _shallow_size(player.get_supports()),
+    }
+
+
+def _memory_per_state(repeats: int) -> tuple[float, int]:
+    """ returns (bytes per retained state, number of retained states) """
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    machines: list[GameStateMachine] = []
+    for _ in range(repeats):
+        state_machine = GameStateMachine(
+            GameState.from_default(),
+            RandomAgent(),
+            RandomAgent(),
+        )
+        state_machine.run()
+        machines.append(state_machine)
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    num_states = len(set(
+        id(game_state)
+        for state_machine in machines
+        for game_state in state_machine.get_history()
+    ))
+    return (after - before) / num_states, num_states
+
+
+if __name__ == "__main__":
+    repeats = 10
+    for name, size in _shallow_sizes(GameState.from_default()).items():
+        print(f"{name:>12}: {size} bytes (shallow)")
+    bytes_per_state, num_states = _memory_per_state(repeats)
+    print(f"{num_states} states retained, {bytes_per_state:.0f} bytes per state on average")
@@ -25,6 +25,12 @@ def _dummy_fill_helper(_a: ActionGenerator, _b: DecidedChoiceType) -> ActionGene
     raise NotImplementedError("You are supposed to override this if needed")
 
 
+def _dummy_distinct_choices_helper(
+        _: ActionGenerator
+) -> tuple[tuple[DecidedChoiceType, int], ...]:
+    raise NotImplementedError("Distinct choices are not provided by this action generator")
+
+
 @dataclass(frozen=True, kw_only=True)
 class ActionGenerator:
     """
@@ -43,6 +49,12 @@ class ActionGenerator:
     # action generator representing the next phase of choice, otherwise raise
     # Exception
     _fill_helper: Callable[[Self, DecidedChoiceType], Self] = _dummy_fill_helper  # type: ignore
+    # optionally provides one choice per class of choices leading to the same
+    # game state, with the number of choices in the class
+    _distinct_choices_helper: Callable[
+        [Self],
+        tuple[tuple[DecidedChoiceType, int], ...]
+    ] = _dummy_distinct_choices_helper  # type: ignore
 
     def _action_filled(self) -> bool:
         return self.action is None \
@@ -71,6 +83,18 @@ class ActionGenerator:
         assert not self.filled()
         return self._choices_helper(self)
 
+    def distinct_choices(self) -> tuple[tuple[DecidedChoiceType, int], ...]:
+        """
+        Returns (choice, multiplicity) pairs where each choice can be chosen
+        directly, and multiplicity is the number of choices (e.g. which copy of
+        a card or which of the dices of the same element) equivalent to it.
+
+        Only available for the generators of card selection, dices selection
+        and card playing, raises NotImplementedError otherwise.
+        """
+        assert not self.filled()
+        return self._distinct_choices_helper(self)
+
     def dices_available(self) -> ActualDices:
         return self.game_state.get_player(self.pid).get_dices()
 
@@ -9,7 +9,7 @@ from typing import TYPE_CHECKING
 
 from ..dices import ActualDices
 from ..element import Element
-from ..helper.quality_of_life import just
+from ..helper.quality_of_life import just, weighted_sub_multisets
 from ..character.enums import CharacterSkill
 
 from .action_generator import ActionGenerator
@@ -30,7 +30,6 @@ __all__ = [
     "SwapActGenGenerator",
 ]
 
-
 class CardActGenGenerator(ABC):
     """
     This generates an ActionGenerator allowing the agent to choose which card to
@@ -41,12 +40,23 @@ class CardActGenGenerator(ABC):
     @classmethod
     def _choices_helper(cls, action_generator: ActionGenerator) -> GivenChoiceType:
         assert not action_generator.filled()
-        game_state = action_generator.game_state
+        card_checker = action_generator.game_state.card_checker()
         pid = action_generator.pid
         return tuple(
             card_type
             for card_type in action_generator.hand_cards_available()
-            if card_type.strictly_usable(game_state, pid)
+            if card_checker.strictly_usable(pid, card_type)
+        )
+
+    @classmethod
+    def _distinct_choices_helper(
+            cls,
+            action_generator: ActionGenerator,
+    ) -> tuple[tuple[DecidedChoiceType, int], ...]:
+        hand_cards = action_generator.hand_cards_available()
+        return tuple(
+            (card_type, hand_cards[card_type])  # type: ignore
+            for card_type in cls._choices_helper(action_generator)
         )
 
     @classmethod
@@ -80,6 +90,7 @@ class CardActGenGenerator(ABC):
             pid=pid,
             _choices_helper=cls._choices_helper,
             _fill_helper=cls._fill_helper,
+            _distinct_choices_helper=cls._distinct_choices_helper,
         )
 
 
@@ -106,6 +117,22 @@ class CardsSelectionActGenGenerator(ABC):
             )
         return hand_cards
 
+    @classmethod
+    def _distinct_choices_helper(
+            cls,
+            action_generator: ActionGenerator,
+    ) -> tuple[tuple[DecidedChoiceType, int], ...]:
+        from ..card.cards import Cards
+        choices = cls._choices_helper(action_generator)
+        if not isinstance(choices, Cards):  # pragma: no cover
+            return tuple((choice, 1) for choice in choices)  # type: ignore
+        return tuple(
+            (Cards(cards), num)
+            for cards, num in weighted_sub_multisets(
+                (card, choices[card]) for card in choices
+            )
+        )
+
     @classmethod
     def _fill_helper(
         cls,
@@ -136,6 +163,7 @@ class CardsSelectionActGenGenerator(ABC):
             action=CardsSelectAction._all_none(),
             _choices_helper=cls._choices_helper,
             _fill_helper=cls._fill_helper,
+            _distinct_choices_helper=cls._distinct_choices_helper,
         )
 
 
@@ -151,6 +179,20 @@ class DicesSelectionActGenGenerator(ABC):
         pid = action_generator.pid
         return game_state.get_player(pid).get_dices()
 
+    @classmethod
+    def _distinct_choices_helper(
+            cls,
+            action_generator: ActionGenerator,
+    ) -> tuple[tuple[DecidedChoiceType, int], ...]:
+        dices = cls._choices_helper(action_generator)
+        assert isinstance(dices, ActualDices)
+        return tuple(
+            (ActualDices(selected_dices), num)
+            for selected_dices, num in weighted_sub_multisets(
+                (elem, dices[elem]) for elem in dices
+            )
+        )
+
     @classmethod
     def _fill_helper(
         cls,
@@ -180,6 +222,7 @@ class DicesSelectionActGenGenerator(ABC):
             action=DicesSelectAction._all_none(),
             _choices_helper=cls._choices_helper,
             _fill_helper=cls._fill_helper,
+            _distinct_choices_helper=cls._distinct_choices_helper,
         )
 
 
@@ -0,0 +1,267 @@
+"""
+This file contains ActionSpace, a fixed flat indexing of the actions of a mode,
+for agents with a fixed-size policy output.
+
+The space is split into segments, one per kind of action:
+
+- end_round: EndRoundAction
+- skill: SkillAction, per CharacterSkill
+- swap, death_swap, character_select: the corresponding action, per position
+  of the target character
+- elemental_tuning: ElementalTuningAction, per card type and dice element
+- card: CardAction, per card type and target (no target, or the position of a
+  character, summon or support of either player)
+- dices_select: DicesSelectAction rerolling all the dices of a set of elements,
+  per set of elements
+- cards_select: CardsSelectAction, per set of positions in the hand sorted by
+  card type
+
+Card types are indexed by Mode.type_registry(), with one more slot shared by
+the cards not in the mode. Players and positions are relative to the player
+acting.
+
+The legal indices of a game state are the indices of its legal actions (see
+GameState.legal_actions()), so their dice costs are paid canonically. Legal
+actions outside the flat space (e.g. rerolling some but not all dices of an
+element) are not reachable through it.
+"""
+from __future__ import annotations
+from typing import Any, TYPE_CHECKING
+
+from ..character.enums import CharacterSkill
+from ..dices import ActualDices
+from ..effect.enums import Zone
+from ..effect.structs import StaticTarget
+from ..encode import Segment
+from ..helper.fingerprint import zobrist_key
+from ..state.enums import Pid
+
+from .action import *
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None  # type: ignore
+
+if TYPE_CHECKING:
+    import numpy.typing as npt
+
+    from ..card.card import Card
+    from ..mode import Mode
+    from ..state.game_state import GameState
+    from ..state.player_state import PlayerState
+
+__all__ = [
+    "ActionSpace",
+]
+
+#: bumped whenever the way the layout is derived from the mode changes
+_LAYOUT_VERSION = 1
+
+_SKILLS: tuple[CharacterSkill, ...] = tuple(CharacterSkill)
+_SELECT_ELEMS = ActualDices._LEGAL_ELEMS_ORDERED
+_TUNING_ELEMS = _SELECT_ELEMS[1:]  # without OMNI
+
+
+class ActionSpace:
+    """
+    The flat action space of a mode, get it with Mode.action_space().
+    """
+
+    _SPACES: dict[type[Mode], ActionSpace] = {}
+
+    def __init__(self, mode: Mode) -> None:
+        registry = mode.type_registry()
+        self._cards: dict[type[Card], int] = {
+            card: registry.cards.id_of(card)
+            for card in registry.cards
+        }
+        # the last slot is shared by the cards not in the mode (e.g. cards
+        # created during the game)
+        self._num_cards = len(self._cards) + 1
+        self._num_chars = mode.deck_chars_requirement()
+        self._num_summons = mode.summons_limit()
+        self._num_supports = mode.supports_limit()
+        self._hand_limit = mode.hand_card_limit()
+        # no target, then characters, summons and supports of self and opponent
+        self._num_targets = 1 + 2 * (self._num_chars + self._num_summons + self._num_supports)
+
+        segments: list[Segment] = []
+
+        def add(name: str, size: int) -> int:
+            start = segments[-1].stop if segments else 0
+            segments.append(Segment(name, start, size))
+            return start
+
+        self._end_round = add("end_round", 1)
+        self._skill = add("skill", len(_SKILLS))
+        self._swap = add("swap", self._num_chars)
+        self._death_swap = add("death_swap", self._num_chars)
+        self._character_select = add("character_select", self._num_chars)
+        self._elemental_tuning = add("elemental_tuning", self._num_cards * len(_TUNING_ELEMS))
+        self._card = add("card", self._num_cards * self._num_targets)
+        self._dices_select = add("dices_select", 1 << len(_SELECT_ELEMS))
+        self._cards_select = add("cards_select", 1 << self._hand_limit)
+        self.segments: tuple[Segment, ...] = tuple(segments)
+        self.size: int = segments[-1].stop
+        #: stable 64-bit stamp of the layout
+        self.version: int = zobrist_key(
+            "ActionSpace", _LAYOUT_VERSION, registry.version, *(
+                part
+                for segment in self.segments
+                for part in (segment.name, segment.size)
+            )
+        )
+
+    @classmethod
+    def of_mode(cls, mode: Mode) -> ActionSpace:
+        """ the action space is built once per mode type and shared afterwards """
+        space = cls._SPACES.get(type(mode))
+        if space is None:
+            space = cls(mode)
+            cls._SPACES[type(mode)] = space
+        return space
+
+    def segment(self, name: str) -> Segment:
+        """ raises KeyError if there's no segment of name """
+        for segment in self.segments:
+            if segment.name == name:
+                return segment
+        raise KeyError(name)
+
+    def index_of(self, action: PlayerAction, game_state: GameState, pid: Pid) -> None | int:
+        """
+        Returns the index of action taken by pid at game_state, or None if the
+        action is outside the flat space.
+        """
+        player = game_state.get_player(pid)
+        if isinstance(action, EndRoundAction):
+            return self._end_round
+        if isinstance(action, SkillAction):
+            return self._skill + _SKILLS.index(action.skill)
+        if isinstance(action, SwapAction):
+            return self._char_index(self._swap, player, action.char_id)
+        if isinstance(action, DeathSwapAction):
+            return self._char_index(self._death_swap, player, action.char_id)
+        if isinstance(action, CharacterSelectAction):
+            return self._char_index(self._character_select, player, action.char_id)
+        if isinstance(action, ElementalTuningAction):
+            if action.dice_elem not in _TUNING_ELEMS:
+                return None
+            return (
+                self._elemental_tuning
+                + self._card_slot(action.card) * len(_TUNING_ELEMS)
+                + _TUNING_ELEMS.index(action.dice_elem)
+            )
+        if isinstance(action, CardAction):
+            instruction = action.instruction
+            target: None | int
+            if type(instruction) is DiceOnlyInstruction:
+                target = 0
+            elif type(instruction) is StaticTargetInstruction:
+                target = self._target_index(game_state, pid, instruction.target)
+                if target is None:
+                    return None
+            else:
+                return None
+            return self._card + self._card_slot(action.card) * self._num_targets + target
+        if isinstance(action, DicesSelectAction):
+            return self._dices_select_index(player, action.selected_dices)
+        if isinstance(action, CardsSelectAction):
+            return self._cards_select_index(player, action)
+        return None
+
+    def _card_slot(self, card: type[Card]) -> int:
+        return self._cards.get(card, len(self._cards))
+
+    def _char_index(self, start: int, player: PlayerState, char_id: int) -> None | int:
+        for i, char in enumerate(player.get_characters()):
+            if char.get_id() == char_id:
+                return start + i if i < self._num_chars else None
+        return None
+
+    def _target_index(self, game_state: GameState, pid: Pid, target: StaticTarget) -> None | int:
+        player = game_state.get_player(target.pid)
+        # targets of the player acting come first
+        index = 1 if target.pid is pid else 1 + self._num_targets // 2
+        if target.zone is Zone.CHARACTERS:
+            for i, char in enumerate(player.get_characters()):
+                if char.get_id() == target.id:
+                    return index + i
+            return None
+        index += self._num_chars
+        if target.zone is Zone.SUMMONS:
+            for i, summon in enumerate(player.get_summons()):
+                if type(summon) is target.id:
+                    return index + i
+            return None
+        index += self._num_summons
+        if target.zone is Zone.SUPPORTS:
+            for i, support in enumerate(player.get_supports()):
+                if support.sid == target.id:
+                    return index + i
+        return None
+
+    def _dices_select_index(self, player: PlayerState, selected_dices: ActualDices) -> None | int:
+        dices = player.get_dices()
+        bits = 0
+        for i, elem in enumerate(_SELECT_ELEMS):
+            num = selected_dices[elem]
+            if num == 0:
+                continue
+            if num != dices[elem]:
+                return None
+            bits |= 1 << i
+        return self._dices_select + bits
+
+    def _cards_select_index(self, player: PlayerState, action: CardsSelectAction) -> None | int:
+        # positions of the hand sorted by card type, the copies of a card
+        # selected are always the first copies
+        selected_cards = action.selected_cards
+        hand_cards = player.get_hand_cards()
+        bits = 0
+        position = 0
+        for card in sorted(hand_cards, key=self._card_slot):
+            num = hand_cards[card]
+            if selected_cards[card] > num:
+                return None
+            bits |= ((1 << selected_cards[card]) - 1) << position
+            position += num
+        if position > self._hand_limit:
+            return None
+        return self._cards_select + bits
+
+    def legal_indices(self, game_state: GameState, pid: Pid) -> dict[int, PlayerAction]:
+        """
+        Returns the legal actions of pid at game_state by their indices, use
+        the cached GameState.legal_action_indices() instead.
+        """
+        indices: dict[int, PlayerAction] = {}
+        for action in game_state.legal_actions(pid):
+            index = self.index_of(action, game_state, pid)
+            if index is not None:
+                indices.setdefault(index, action)
+        return indices
+
+    def decode(self, index: int, game_state: GameState, pid: None | Pid = None) -> PlayerAction:
+        """
+        Returns the action of index for pid (the player to act by default) at
+        game_state, with its dices cost paid canonically.
+
+        Raises ValueError if the index is not legal.
+        """
+        if pid is None:
+            pid = game_state.waiting_for()
+            assert pid is not None
+        action = game_state.legal_action_indices(pid).get(index)
+        if action is None:
+            raise ValueError(f"action index {index} is not legal for {pid}")
+        return action
+
+    def mask(self, game_state: GameState, pid: Pid) -> npt.NDArray[Any]:
+        """ the legal indices of pid at game_state as a boolean array of size """
+        if np is None:  # pragma: no cover
+            raise ImportError("the action mask requires NumPy, see legal_action_indices()")
+        mask = np.zeros(self.size, dtype=np.bool_)
+        mask[list(game_state.legal_action_indices(pid))] = True
+        return mask
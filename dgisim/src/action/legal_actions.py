@@ -0,0 +1,144 @@
+"""
+This file contains the enumeration of all the legal actions of a player at a
+decision point, see GameState.legal_actions().
+
+The enumeration follows the ActionGenerator of the current phase, but the
+common action types (skills, swaps, elemental tuning) are built directly from
+the checkers instead of walking the generators choice by choice.
+
+Dice costs are paid with the canonical payment of ActualDices.basically_satisfy(),
+so there's one action per distinct decision rather than one per payment.
+"""
+from __future__ import annotations
+from typing import Callable, Iterator, TYPE_CHECKING
+
+from ..card.cards import Cards
+from ..dices import AbstractDices, ActualDices
+from ..element import Element
+from ..helper.quality_of_life import weighted_sub_multisets
+
+from .action import *
+from .action_generator import ActionGenerator
+from .enums import ActionType
+
+if TYPE_CHECKING:
+    from ..state.enums import Pid
+    from ..state.game_state import GameState
+
+__all__ = [
+    "legal_actions",
+]
+
+
+def legal_actions(game_state: GameState, pid: Pid) -> tuple[PlayerAction, ...]:
+    """
+    Returns all the distinct actions player pid can take at game_state, or an
+    empty tuple if the game has ended or is not waiting for player pid.
+    """
+    if game_state.game_end() or game_state.waiting_for() is not pid:
+        return ()
+    action_generator = game_state.action_generator(pid)
+    if action_generator is None:
+        return ()
+    # dict as an ordered set
+    actions: dict[PlayerAction, None] = {}
+    for action in _walk(action_generator):
+        actions[action] = None
+    return tuple(actions)
+
+
+def _walk(action_generator: ActionGenerator) -> Iterator[PlayerAction]:
+    if action_generator.filled():
+        yield action_generator.generate_action()
+        return
+    choices = action_generator.choices()
+    if isinstance(choices, AbstractDices):
+        payment = action_generator.dices_available().basically_satisfy(choices)
+        if payment is not None:
+            yield from _walk(action_generator.choose(payment))
+    elif isinstance(choices, ActualDices):
+        for dices in _sub_dices(choices):
+            yield from _walk(action_generator.choose(dices))
+    elif isinstance(choices, Cards):
+        for cards in _sub_cards(choices):
+            yield from _walk(action_generator.choose(cards))
+    else:
+        for choice in choices:
+            if isinstance(choice, ActionType) and choice in _DIRECT_ACTIONS:
+                yield from _DIRECT_ACTIONS[choice](action_generator.game_state, action_generator.pid)
+            else:
+                yield from _walk(action_generator.choose(choice))
+
+
+def _sub_dices(dices: ActualDices) -> Iterator[ActualDices]:
+    """ all the sub-multisets of dices """
+    for sub_dices, _ in weighted_sub_multisets((elem, dices[elem]) for elem in dices):
+        yield ActualDices(sub_dices)
+
+
+def _sub_cards(cards: Cards) -> Iterator[Cards]:
+    """ all the sub-multisets of cards """
+    for sub_cards, _ in weighted_sub_multisets((card, cards[card]) for card in cards):
+        yield Cards(sub_cards)
+
+
+def _card_actions(game_state: GameState, pid: Pid) -> Iterator[PlayerAction]:
+    card_checker = game_state.card_checker()
+    for card in game_state.get_player(pid).get_hand_cards():
+        if not card_checker.strictly_usable(pid, card):
+            continue
+        action_generator = card.action_generator(game_state, pid)
+        if action_generator is not None:
+            yield from _walk(action_generator)
+
+
+def _skill_actions(game_state: GameState, pid: Pid) -> Iterator[PlayerAction]:
+    active_character = game_state.get_player(pid).just_get_active_character()
+    dices = game_state.get_player(pid).get_dices()
+    skill_checker = game_state.skill_checker()
+    for skill in active_character.skills():
+        usable = skill_checker.usable(pid, active_character.get_id(), skill)
+        if usable is None:
+            continue
+        payment = dices.basically_satisfy(usable[1])
+        if payment is not None:
+            yield SkillAction(skill=skill, instruction=DiceOnlyInstruction(dices=payment))
+
+
+def _swap_actions(game_state: GameState, pid: Pid) -> Iterator[PlayerAction]:
+    swap_checker = game_state.swap_checker()
+    death_swap = swap_checker.should_death_swap()
+    dices = game_state.get_player(pid).get_dices()
+    for char in game_state.get_player(pid).get_characters():
+        swap_details = swap_checker.swap_details(pid, char.get_id())
+        if swap_details is None:
+            continue
+        if death_swap:
+            yield DeathSwapAction(char_id=char.get_id())
+            continue
+        _, dices_cost = swap_details
+        assert dices_cost is not None
+        payment = dices.basically_satisfy(dices_cost)
+        if payment is not None:
+            yield SwapAction(char_id=char.get_id(), instruction=DiceOnlyInstruction(dices=payment))
+
+
+def _elem_tuning_actions(game_state: GameState, pid: Pid) -> Iterator[PlayerAction]:
+    player = game_state.get_player(pid)
+    active_elem = player.just_get_active_character().element()
+    elems = tuple(
+        elem
+        for elem in player.get_dices()
+        if elem is not Element.OMNI and elem is not active_elem
+    )
+    for card in player.get_hand_cards():
+        for elem in elems:
+            yield ElementalTuningAction(card=card, dice_elem=elem)
+
+
+_DIRECT_ACTIONS: dict[ActionType, Callable[[GameState, Pid], Iterator[PlayerAction]]] = {
+    ActionType.PLAY_CARD: _card_actions,
+    ActionType.CAST_SKILL: _skill_actions,
+    ActionType.SWAP_CHARACTER: _swap_actions,
+    ActionType.ELEMENTAL_TUNING: _elem_tuning_actions,
+}
@@ -0,0 +1,96 @@
+"""
+This file contains the abstraction of dice payments for agents that search
+over action generators.
+
+When an ActionGenerator asks for the dices to pay an AbstractDices cost, any
+ActualDices that just satisfies the cost is a valid choice. Many of them are
+strategically identical, so the payments are collapsed into equivalence classes
+by what they leave to the player:
+
+- the number of OMNI dices
+- the number of dices of each element of the player's characters
+- the total number of the other (off-element) dices
+
+Each class is represented by a concrete payment, so an abstract choice maps
+back to an ActualDices that can be passed to ActionGenerator.choose() directly.
+"""
+from __future__ import annotations
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+from ..dices import AbstractDices, ActualDices
+from ..element import Element
+
+if TYPE_CHECKING:
+    from .action_generator import ActionGenerator
+    from .types import GivenChoiceType
+
+__all__ = [
+    "abstract_choices",
+    "canonical_payments",
+    "payment_class",
+]
+
+_PAYMENT_CACHE_SIZE = 4096
+
+
+def payment_class(
+        payment: ActualDices,
+        char_elems: frozenset[Element],
+) -> tuple[int, ...]:
+    """
+    Returns the key of the equivalence class of payment, payments of the same
+    dices pool with the same key leave the same value to characters of
+    char_elems.
+    """
+    elems = sorted(char_elems - {Element.OMNI}, key=lambda elem: elem.value)
+    num_omni = payment[Element.OMNI]
+    char_nums = tuple(payment[elem] for elem in elems)
+    return (
+        num_omni,
+        *char_nums,
+        payment.num_dices() - num_omni - sum(char_nums),
+    )
+
+
+def canonical_payments(
+        dices: ActualDices,
+        requirement: AbstractDices,
+        char_elems: frozenset[Element],
+) -> tuple[ActualDices, ...]:
+    """
+    Returns one payment of requirement from dices per equivalence class (see
+    payment_class()).
+
+    The representative of each class is the first one in the order of
+    ActualDices.minimal_payments(), and the classes are in that order as well.
+    Results are cached.
+    """
+    return _canonical_payments(dices, requirement, char_elems)
+
+
+def abstract_choices(action_generator: ActionGenerator) -> GivenChoiceType:
+    """
+    Returns the choices of action_generator with the dices costs replaced by
+    their canonical payments, every choice returned can be chosen directly.
+    """
+    choices = action_generator.choices()
+    if not isinstance(choices, AbstractDices):
+        return choices
+    char_elems = frozenset(
+        action_generator.game_state.get_player(action_generator.pid).get_characters().all_elems()
+    )
+    return canonical_payments(action_generator.dices_available(), choices, char_elems)
+
+
+@lru_cache(maxsize=_PAYMENT_CACHE_SIZE)
+def _canonical_payments(
+        dices: ActualDices,
+        requirement: AbstractDices,
+        char_elems: frozenset[Element],
+) -> tuple[ActualDices, ...]:
+    # dict as an ordered set of classes
+    payments: dict[tuple[int, ...], ActualDices] = {}
+    for payment in dices.minimal_payments(requirement, char_elems):
+        payments.setdefault(payment_class(payment, char_elems), payment)
+    return tuple(payments.values())
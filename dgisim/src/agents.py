@@ -14,6 +14,7 @@ from .card.cards import Cards
 from .dices import AbstractDices, ActualDices
 from .effect.effect import *
 from .element import Element
+from .helper.rng import random_or_global
 from .phase.default.action_phase import ActionPhase
 from .phase.default.card_select_phase import CardSelectPhase
 from .phase.default.end_phase import EndPhase
@@ -107,9 +108,15 @@ class PuppetAgent(PlayerAgent):
 class RandomAgent(PlayerAgent):
     """
     A player agent that make purely random (but of course valid) acions.
+
+    If seed is provided, the agent draws from its own random stream, otherwise
+    from the global random module.
     """
     _NUM_PICKED_CARDS = 3
 
+    def __init__(self, seed: None | int = None) -> None:
+        self._rand = None if seed is None else random.Random(seed)
+
     def _card_select_phase(self, history: list[GameState], pid: Pid) -> PlayerAction:
         game_state = history[-1]
         act_gen = game_state.action_generator(pid)
@@ -136,14 +143,15 @@ class RandomAgent(PlayerAgent):
         return player_action
 
     def _random_action_generator_chooser(self, action_generator: ActionGenerator) -> PlayerAction:
+        rand = random_or_global(self._rand)
         while not action_generator.filled():
             choices = action_generator.choices()
             choice: DecidedChoiceType  # type: ignore
             if isinstance(choices, tuple):
                 game_state = action_generator.game_state
-                if game_state.get_phase() == game_state.get_mode().roll_phase() and random.random() < 0.8:
+                if game_state.get_phase() == game_state.get_mode().roll_phase() and rand.random() < 0.8:
                     choices = tuple(c for c in choices if c is not ActionType.END_ROUND)
-                choice = random.choice(choices)
+                choice = rand.choice(choices)
                 action_generator = action_generator.choose(choice)
             elif isinstance(choices, AbstractDices):
                 optional_choice = action_generator.dices_available().basically_satisfy(choices)
@@ -154,7 +162,10 @@ class RandomAgent(PlayerAgent):
                 choice = optional_choice
                 action_generator = action_generator.choose(choice)
             elif isinstance(choices, Cards):
-                _, choice = choices.pick_random_cards(random.randint(0, choices.num_cards()))
+                _, choice = choices.pick_random_cards(
+                    rand.randint(0, choices.num_cards()),
+                    self._rand,
+                )
                 action_generator = action_generator.choose(choice)
             elif isinstance(choices, ActualDices):
                 game_state = action_generator.game_state
@@ -168,7 +179,10 @@ class RandomAgent(PlayerAgent):
                         if not (elem is Element.OMNI or elem in wanted_elems)
                     ))
                 else:
-                    _, choice = choices.pick_random_dices(random.randint(0, choices.num_dices()))
+                    _, choice = choices.pick_random_dices(
+                        rand.randint(0, choices.num_dices()),
+                        self._rand,
+                    )
                 action_generator = action_generator.choose(choice)
             else:
                 raise NotImplementedError
@@ -223,6 +237,7 @@ class CustomChoiceAgent(RandomAgent):  # pragma: no cover
             dict_choose_handler: Callable[[dict[_T, int], bool], None | dict[_T, int]],
             any_handler: Callable[[Iterable[Any]], Any],
     ) -> None:
+        super().__init__()
         self._prompt_handler = prompt_handler
         self._choose_handler = choose_handler
         self._dict_choose_handler = dict_choose_handler
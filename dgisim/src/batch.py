@@ -0,0 +1,381 @@
+"""
+This file contains the batch simulator running many games across processes.
+
+Games are split into chunks of work submitted to a ProcessPoolExecutor, each
+game gets a seed derived from the batch seed and its position in the batch,
+so a batch is reproducible and any single game can be replayed with
+play_game() from its GameResult.
+
+For many short batches, keep a WorkerPool alive: its workers are forked once
+from a warmed-up parent and reused by every batch run on it.
+
+Usage:
+    results = list(run_batch([(deck1, deck2)], RandomAgent, RandomAgent, 1000, seed=0))
+    summary = BatchSummary.of(results)
+    print(summary.win_rate(Pid.P1), summary.confidence_interval(Pid.P1))
+"""
+from __future__ import annotations
+import gc
+import math
+import multiprocessing as mp
+import os
+import traceback
+from concurrent.futures import Executor, ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import Any, Callable, Generator, Iterator, Sequence, TYPE_CHECKING
+
+from .card.cards import Cards
+from .game_state_machine import GameStateMachine
+from .helper.rng import Rng
+from .mode import DefaultMode, Mode
+from .state.enums import Pid
+from .state.game_state import GameState
+
+if TYPE_CHECKING:
+    from .deck import Deck
+    from .player_agent import PlayerAgent
+
+__all__ = [
+    "AgentFactory",
+    "BatchSummary",
+    "GameResult",
+    "WorkerPool",
+    "play_game",
+    "run_batch",
+]
+
+#: builds an agent from a seed, e.g. RandomAgent; must be picklable (defined at
+#: module level) to be sent to the worker processes
+AgentFactory = Callable[[int], "PlayerAgent"]
+
+
+@dataclass(frozen=True)
+class GameResult:
+    #: index of the deck pair played (0 if decks are default)
+    deck_pair: int
+    #: index of the game among the games of the deck pair
+    game: int
+    #: seed of the game, see play_game()
+    seed: int
+    #: None if the game is a draw or crashed
+    winner: None | Pid
+    rounds: int
+    #: HP lost by the characters of the opponent of P1 and P2 respectively
+    damage_dealt: tuple[int, int]
+    #: formatted traceback if the game crashed
+    error: None | str = None
+
+    def crashed(self) -> bool:
+        return self.error is not None
+
+
+def _damage_taken(game_state: GameState, pid: Pid) -> int:
+    return sum(
+        char.get_max_hp() - char.get_hp()
+        for char in game_state.get_player(pid).get_characters()
+    )
+
+
+def play_game(
+        seed: int,
+        agent1_factory: AgentFactory,
+        agent2_factory: AgentFactory,
+        decks: None | tuple[Deck, Deck] = None,
+        mode: Mode = DefaultMode(),
+        deck_pair: int = 0,
+        game: int = 0,
+) -> GameResult:
+    """
+    Plays one game to the end, the game and the agents are all seeded from seed.
+    Exceptions raised by the game (including building the game or the agents)
+    are caught and recorded in the result.
+    """
+    rng = Rng.from_seed(seed)
+    state_machine: None | GameStateMachine = None
+    error: None | str = None
+    try:
+        game_state: GameState
+        if decks is None:
+            game_state = GameState.from_default(seed=rng.value())
+        else:
+            game_state = GameState.from_decks(mode, decks[0], decks[1], seed=rng.value())
+        state_machine = GameStateMachine(
+            game_state,
+            agent1_factory(rng.split("agent", 1).value()),
+            agent2_factory(rng.split("agent", 2).value()),
+        )
+        while not state_machine.game_end():
+            state_machine.one_step()
+    except Exception:
+        error = traceback.format_exc()
+    if state_machine is None:
+        # the game or the agents couldn't be built
+        return GameResult(
+            deck_pair=deck_pair,
+            game=game,
+            seed=seed,
+            winner=None,
+            rounds=0,
+            damage_dealt=(0, 0),
+            error=error,
+        )
+    game_state = state_machine.get_game_state()
+    return GameResult(
+        deck_pair=deck_pair,
+        game=game,
+        seed=seed,
+        winner=None if error is not None else game_state.get_winner(),
+        rounds=game_state.get_round(),
+        damage_dealt=(
+            _damage_taken(game_state, Pid.P2),
+            _damage_taken(game_state, Pid.P1),
+        ),
+        error=error,
+    )
+
+
+@dataclass(frozen=True)
+class _Chunk:
+    """ a unit of work sent to a worker process """
+    agent1_factory: AgentFactory
+    agent2_factory: AgentFactory
+    mode: Mode
+    decks: None | tuple[Deck, Deck]
+    deck_pair: int
+    games: tuple[tuple[int, int], ...]  # (game, seed)
+
+
+def _play_chunk(chunk: _Chunk) -> list[GameResult]:
+    return [
+        play_game(
+            seed,
+            chunk.agent1_factory,
+            chunk.agent2_factory,
+            decks=chunk.decks,
+            mode=chunk.mode,
+            deck_pair=chunk.deck_pair,
+            game=game,
+        )
+        for game, seed in chunk.games
+    ]
+
+
+def _chunks(
+        deck_pairs: None | Sequence[tuple[Deck, Deck]],
+        agent1_factory: AgentFactory,
+        agent2_factory: AgentFactory,
+        num_games: int,
+        seed: int,
+        mode: Mode,
+        chunk_size: int,
+) -> Iterator[_Chunk]:
+    rng = Rng.from_seed(seed)
+    pairs: Sequence[None | tuple[Deck, Deck]] = [None] if deck_pairs is None else deck_pairs
+    for deck_pair, decks in enumerate(pairs):
+        if decks is not None:
+            decks = (decks[0].to_frozen(), decks[1].to_frozen())
+        for start in range(0, num_games, chunk_size):
+            yield _Chunk(
+                agent1_factory=agent1_factory,
+                agent2_factory=agent2_factory,
+                mode=mode,
+                decks=decks,
+                deck_pair=deck_pair,
+                games=tuple(
+                    (game, rng.split(deck_pair, game).value())
+                    for game in range(start, min(start + chunk_size, num_games))
+                ),
+            )
+
+
+def _run_chunks(
+        executor: Executor,
+        chunks: Iterator[_Chunk],
+) -> Generator[GameResult, None, None]:
+    futures = [executor.submit(_play_chunk, chunk) for chunk in chunks]
+    try:
+        for future in as_completed(futures):
+            yield from future.result()
+    finally:
+        # chunks not started yet if the caller stopped iterating early
+        for future in futures:
+            future.cancel()
+
+
+def run_batch(
+        deck_pairs: None | Sequence[tuple[Deck, Deck]],
+        agent1_factory: AgentFactory,
+        agent2_factory: AgentFactory,
+        num_games: int,
+        seed: int = 0,
+        mode: Mode = DefaultMode(),
+        workers: None | int = None,
+        chunk_size: int = 16,
+) -> Generator[GameResult, None, None]:
+    """
+    Plays num_games games for each deck pair (or num_games default games if
+    deck_pairs is None), yielding the results as soon as their chunk is done,
+    so in no particular order.
+
+    workers defaults to the number of CPUs, with workers=1 the games are played
+    in the current process. The worker processes only live for this batch, see
+    WorkerPool to reuse them.
+
+    Closing the returned generator early cancels the games not started yet.
+    """
+    chunks = _chunks(deck_pairs, agent1_factory, agent2_factory, num_games, seed, mode, chunk_size)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers == 1:
+        for chunk in chunks:
+            yield from _play_chunk(chunk)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        try:
+            yield from _run_chunks(executor, chunks)
+        except GeneratorExit:
+            # the caller stopped iterating, don't wait for the games left
+            executor.shutdown(cancel_futures=True)
+            raise
+
+
+def _warm_up(mode: Mode) -> None:
+    """
+    Builds the class-level caches of mode and plays a game to the first
+    decision, so that workers forked afterwards inherit them.
+    """
+    cards = mode.all_cards()
+    mode.all_chars()
+    mode.type_registry()
+    Cards({card: 1 for card in cards})  # seeds the card index
+    GameState.from_default(seed=0).advance_to_decision()
+
+
+def _ready() -> None:
+    """ no-op task used to make the pool fork its workers """
+    pass
+
+
+class WorkerPool:
+    """
+    A long-lived pool of worker processes for running batches.
+
+    The mode is warmed up in the current process before the workers are all
+    forked at construction, so the workers share the imported modules and
+    caches copy-on-write and are ready as soon as the pool is built. Where fork
+    is unavailable, workers are spawned and warm themselves up instead.
+
+    With fork, the objects inherited by the workers are frozen out of their
+    garbage collection (see gc.freeze()), the current process is unaffected.
+
+    Usage:
+        with WorkerPool(workers=8) as pool:
+            for deck_pair in candidates:
+                summary = BatchSummary.of(list(pool.run_batch([deck_pair], ...)))
+    """
+
+    def __init__(self, workers: None | int = None, mode: Mode = DefaultMode()) -> None:
+        self._mode = mode
+        if workers is None:
+            workers = os.cpu_count() or 1
+        self._workers = workers
+        _warm_up(mode)
+        kwargs: dict[str, Any]
+        fork = "fork" in mp.get_all_start_methods()
+        if fork:
+            # the objects inherited by the workers are never collected there,
+            # so the workers don't dirty the shared pages by updating their gc
+            # headers; workers forked later freeze themselves at start
+            gc.freeze()
+            kwargs = {"mp_context": mp.get_context("fork"), "initializer": gc.freeze}
+        else:  # pragma: no cover
+            kwargs = {"initializer": _warm_up, "initargs": (mode,)}
+        try:
+            self._executor = ProcessPoolExecutor(max_workers=self._workers, **kwargs)
+            # processes are only created when tasks are submitted, fork them all now
+            for future in [self._executor.submit(_ready) for _ in range(self._workers)]:
+                future.result()
+        finally:
+            if fork:
+                # the current process keeps collecting as usual
+                gc.unfreeze()
+
+    def num_workers(self) -> int:
+        return self._workers
+
+    def run_batch(
+            self,
+            deck_pairs: None | Sequence[tuple[Deck, Deck]],
+            agent1_factory: AgentFactory,
+            agent2_factory: AgentFactory,
+            num_games: int,
+            seed: int = 0,
+            chunk_size: int = 16,
+    ) -> Generator[GameResult, None, None]:
+        """ same as the module-level run_batch() but runs on the workers of the pool """
+        return _run_chunks(self._executor, _chunks(
+            deck_pairs, agent1_factory, agent2_factory, num_games, seed, self._mode, chunk_size,
+        ))
+
+    def close(self) -> None:
+        self._executor.shutdown()
+
+    def __enter__(self) -> WorkerPool:
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self.close()
+
+
+def _wilson_interval(wins: int, total: int, z: float) -> tuple[float, float]:
+    if total == 0:
+        return 0.0, 1.0
+    p = wins / total
+    denominator = 1 + z * z / total
+    centre = (p + z * z / (2 * total)) / denominator
+    margin = z * math.sqrt(p * (1 - p) / total + z * z / (4 * total * total)) / denominator
+    return max(0.0, centre - margin), min(1.0, centre + margin)
+
+
+@dataclass(frozen=True)
+class BatchSummary:
+    games: int
+    p1_wins: int
+    p2_wins: int
+    draws: int
+    crashes: int
+    mean_rounds: float
+    mean_damage_dealt: tuple[float, float]
+
+    @classmethod
+    def of(cls, results: Sequence[GameResult]) -> BatchSummary:
+        """ crashed games are only counted in crashes """
+        finished = [result for result in results if not result.crashed()]
+        num = len(finished)
+        return cls(
+            games=len(results),
+            p1_wins=sum(1 for result in finished if result.winner is Pid.P1),
+            p2_wins=sum(1 for result in finished if result.winner is Pid.P2),
+            draws=sum(1 for result in finished if result.winner is None),
+            crashes=len(results) - num,
+            mean_rounds=sum(result.rounds for result in finished) / num if num else 0.0,
+            mean_damage_dealt=(
+                sum(result.damage_dealt[0] for result in finished) / num if num else 0.0,
+                sum(result.damage_dealt[1] for result in finished) / num if num else 0.0,
+            ),
+        )
+
+    def finished(self) -> int:
+        return self.games - self.crashes
+
+    def wins(self, pid: Pid) -> int:
+        return self.p1_wins if pid is Pid.P1 else self.p2_wins
+
+    def win_rate(self, pid: Pid) -> float:
+        """ wins of pid over finished games, draws count as non-wins """
+        finished = self.finished()
+        return self.wins(pid) / finished if finished else 0.0
+
+    def confidence_interval(self, pid: Pid, z: float = 1.96) -> tuple[float, float]:
+        """ Wilson score interval of the win rate of pid, 95% by default """
+        return _wilson_interval(self.wins(pid), self.finished(), z)
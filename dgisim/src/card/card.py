@@ -156,7 +156,18 @@ class Card:
         Return a tuple of GameState and AbstractDices:
         - returned game-state is the game-state after preprocessing the usage of the card
         - returned abstract-dices are the actual cost of using the card at the provided game_state
+
+        The result is memorized by the card checker of game_state.
         """
+        return game_state.card_checker().preprocessed_dice_cost(pid, cls)
+
+    @classmethod
+    def _preprocessed_dice_cost(
+            cls,
+            game_state: gs.GameState,
+            pid: Pid
+    ) -> tuple[gs.GameState, AbstractDices]:
+        """ the uncached preprocessed_dice_cost() """
         game_state, card_event = StatusProcessing.preprocess_by_all_statuses(
             game_state=game_state,
             pid=pid,
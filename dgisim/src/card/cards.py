@@ -1,9 +1,9 @@
 from __future__ import annotations
 import random
-from collections import Counter
-from typing import Iterator, TYPE_CHECKING
+from typing import Iterator, Sequence, TYPE_CHECKING
 
-from ..helper.hashable_dict import HashableDict
+from ..helper.fingerprint import fingerprint_of
+from ..helper.rng import random_or_global
 
 if TYPE_CHECKING:
     from .card import Card
@@ -13,56 +13,182 @@ __all__ = [
 ]
 
 
+class _CardIndex:
+    """
+    Dense ids of card types, shared by all Cards in the process.
+
+    The index is seeded with the cards of the default mode in the order of
+    Mode.type_registry(). Other card types (OmniCard, cards of other modes...)
+    get the next free id the first time they are seen, so ids are only
+    meaningful within the process. (Cards pickles itself as a dict)
+
+    Cards are iterated (and drawn) in the order of the ids in order, which sorts
+    the types by (module, qualname) like the type registry, so that the order
+    doesn't depend on when each type was first seen.
+    """
+    __slots__ = ("types", "ids", "order", "_ordered")
+
+    def __init__(self) -> None:
+        self.types: list[type[Card]] = []
+        self.ids: dict[type[Card], int] = {}
+        #: None while the ids are already in sorted order
+        self.order: None | tuple[int, ...] = None
+        #: size -> ordered_ids(size), cleared whenever a type is registered
+        self._ordered: dict[int, Sequence[int]] = {}
+
+    def id_of(self, card: type[Card]) -> int:
+        id = self.ids.get(card)
+        if id is None:
+            if not self.types:
+                from ..mode import DefaultMode
+                for default_card in DefaultMode().type_registry().cards:
+                    self._register(default_card)
+                id = self.ids.get(card)
+            if id is None:
+                id = self._register(card)
+        return id
+
+    def _register(self, card: type[Card]) -> int:
+        id = len(self.types)
+        self.types.append(card)
+        self.ids[card] = id
+        order = sorted(
+            range(len(self.types)),
+            key=lambda id: (self.types[id].__module__, self.types[id].__qualname__),
+        )
+        self.order = None if order == list(range(len(order))) else tuple(order)
+        self._ordered.clear()
+        return id
+
+    def ordered_ids(self, size: int) -> Sequence[int]:
+        """ the ids below size in sorted order """
+        ids = self._ordered.get(size)
+        if ids is None:
+            if self.order is None:
+                ids = range(size)
+            else:
+                ids = tuple(id for id in self.order if id < size)
+            self._ordered[size] = ids
+        return ids
+
+
+_INDEX = _CardIndex()
+
+
+def _trimmed(vec: list[int]) -> tuple[int, ...]:
+    """ drops the trailing zeros so that equal cards have equal vectors """
+    end = len(vec)
+    while end > 0 and vec[end - 1] == 0:
+        end -= 1
+    return tuple(vec[:end])
+
+
+def _padded(vec: tuple[int, ...], size: int) -> list[int]:
+    padded = list(vec)
+    if len(padded) < size:
+        padded.extend(0 for _ in range(size - len(padded)))
+    return padded
+
+
+def _vec_of(cards: dict[type[Card], int]) -> tuple[int, ...]:
+    vec: list[int] = []
+    for card, num in cards.items():
+        id = _INDEX.id_of(card)
+        if id >= len(vec):
+            vec = _padded(tuple(vec), id + 1)
+        vec[id] += num
+    return _trimmed(vec)
+
+
 class Cards:
     """
     A container for easy management of cards.
+
+    The cards are stored as a vector of counts indexed by card type ids (see
+    _CardIndex), the total number of cards is computed once on creation.
     """
+    __slots__ = ("_vec", "_num", "_hash", "_fingerprint")
+
     def __init__(self, cards: dict[type[Card], int]) -> None:
-        self._cards = HashableDict.from_dict(cards)
+        self._vec = _vec_of(cards)
+        self._num = sum(self._vec)
+        self._hash: None | int = None
+        self._fingerprint: None | int = None
+
+    @classmethod
+    def _from_vec(cls, vec: tuple[int, ...]) -> Cards:
+        cards = cls.__new__(cls)
+        cards._vec = vec
+        cards._num = sum(vec)
+        cards._hash = None
+        cards._fingerprint = None
+        return cards
 
     @classmethod
     def from_empty(cls) -> Cards:
-        return Cards({})
+        return _EMPTY
+
+    def _items(self) -> Iterator[tuple[type[Card], int]]:
+        types = _INDEX.types
+        vec = self._vec
+        return (
+            (types[id], vec[id])
+            for id in _INDEX.ordered_ids(len(vec))
+            if vec[id] != 0
+        )
+
+    def _combine(self, other: Cards | dict[type[Card], int], sign: int) -> Cards:
+        other_vec = other._vec if isinstance(other, Cards) else _vec_of(other)
+        vec = _padded(self._vec, len(other_vec))
+        for id, num in enumerate(other_vec):
+            vec[id] += sign * num
+        return Cards._from_vec(_trimmed(vec))
+
+    def _add_to(self, card: type[Card], num: int) -> Cards:
+        id = _INDEX.id_of(card)
+        vec = _padded(self._vec, id + 1)
+        vec[id] += num
+        return Cards._from_vec(_trimmed(vec))
 
     def __add__(self, other: Cards | dict[type[Card], int]) -> Cards:
-        other_cards: dict[type[Card], int]
-        if isinstance(other, Cards):
-            other_cards = other._cards
-        else:
-            other_cards = other
-        return Cards(self._cards + other_cards)
+        return self._combine(other, 1)
 
     def __sub__(self, other: Cards | dict[type[Card], int]) -> Cards:
-        other_cards: dict[type[Card], int]
-        if isinstance(other, Cards):
-            other_cards = other._cards
-        else:
-            other_cards = other
-        return Cards(self._cards - other_cards)
+        return self._combine(other, -1)
 
-    def pick_random_cards(self, num: int) -> tuple[Cards, Cards]:
+    def pick_random_cards(
+            self,
+            num: int,
+            rand: None | random.Random = None,
+    ) -> tuple[Cards, Cards]:
         """
         Returns the left cards and selected cards
+
+        Draws from rand if provided, otherwise from the global random module.
         """
         num = min(self.num_cards(), num)
         if num == 0:
             return (self, Cards.from_empty())
-        picked_cards: dict[type[Card], int] = dict(Counter(
-            random.sample(list(self._cards.keys()), counts=self._cards.values(), k=num)
-        ))
-        return Cards(self._cards - picked_cards), Cards(picked_cards)
+        rand = random_or_global(rand)
+        vec = self._vec
+        ids = _INDEX.ordered_ids(len(vec))
+        picked = [0] * len(vec)
+        for id in rand.sample(ids, counts=[vec[id] for id in ids], k=num):
+            picked[id] += 1
+        picked_cards = Cards._from_vec(_trimmed(picked))
+        return self - picked_cards, picked_cards
 
     def num_cards(self) -> int:
-        return sum(self._cards.values())
+        return self._num
 
     def is_legal(self) -> bool:
-        return all(val >= 0 for val in self._cards.values())
+        return all(val >= 0 for val in self._vec)
 
     def empty(self) -> bool:
-        return all(value == 0 for value in self._cards.values())
+        return not self._vec
 
     def not_empty(self) -> bool:
-        return any(value > 0 for value in self._cards.values())
+        return any(value > 0 for value in self._vec)
 
     def contains(self, card: type[Card]) -> bool:
         from .card import OmniCard
@@ -72,18 +198,18 @@ class Cards:
         return self.contains(card)
 
     def add(self, card: type[Card]) -> Cards:
-        return self + {card: 1}
+        return self._add_to(card, 1)
 
     def remove(self, card: type[Card]) -> Cards:
         from .card import OmniCard
         if self[card] <= 0:
             assert self[OmniCard] > 0
-            return self - {OmniCard: 1}  # type: ignore
-        return self - {card: 1}
+            return self._add_to(OmniCard, -1)  # type: ignore
+        return self._add_to(card, -1)
 
     def remove_all(self, card: type[Card]) -> Cards:
         if self[card] >= 1:
-            return self - {card: self._cards[card]}
+            return self._add_to(card, -self[card])
         else:
             # if the card doesn't exist, even though there might be OmniCards
             # but we don't know how many to remove, so nothing is removed
@@ -94,48 +220,65 @@ class Cards:
         return Cards({OmniCard: self.num_cards()})
 
     def __getitem__(self, card: type[Card]) -> int:
-        return self._cards.get(card, 0)
+        id = _INDEX.ids.get(card)
+        if id is None or id >= len(self._vec):
+            return 0
+        return self._vec[id]
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, Cards):
             return False
-        return self is other or self._cards == other._cards
+        if self is other:
+            return True
+        if self._hash is not None and other._hash is not None and self._hash != other._hash:
+            return False
+        return self._vec == other._vec
 
     def __ne__(self, other: object) -> bool:
         return not self.__eq__(other)
 
     def __hash__(self) -> int:
-        return hash(self._cards)
+        if self._hash is None:
+            self._hash = hash(self._vec)
+        return self._hash
+
+    def fingerprint(self) -> int:
+        """ Stable 64-bit fingerprint, see GameState.fingerprint() """
+        if self._fingerprint is None:
+            self._fingerprint = fingerprint_of(dict(self._items()))
+        return self._fingerprint
+
+    def __reduce__(self) -> tuple:
+        # card ids are local to the process
+        return (Cards, (self.to_dict(),))
 
     def __repr__(self) -> str:
-        existing_cards = dict([
-            (card.name(), str(num))
-            for card, num in self._cards.items()
-            if num != 0
-        ])
         return (
             '{'
             + ", ".join(
-                f"{key}: {val}"
-                for key, val in existing_cards.items()
+                f"{card.name()}: {num}"
+                for card, num in self._items()
             )
             + '}'
         )
 
     def __iter__(self) -> Iterator[type[Card]]:
-        return (  # type: ignore
-            card
-            for card in self._cards.keys()
-            if self[card] > 0
+        types = _INDEX.types
+        vec = self._vec
+        return (
+            types[id]
+            for id in _INDEX.ordered_ids(len(vec))
+            if vec[id] > 0
         )
 
     def to_dict(self) -> dict[type[Card], int]:
-        return dict(self._cards.items())
+        return dict(self._items())
 
     def dict_str(self) -> dict:
-        existing_cards = dict([
+        return dict(
             (card.name(), str(num))
-            for card, num in self._cards.items()
-            if num != 0
-        ])
-        return existing_cards
+            for card, num in self._items()
+        )
+
+
+_EMPTY = Cards._from_vec(())
@@ -18,6 +18,7 @@ from ..effect.effects_template import *
 from ..effect.enums import Zone, DynamicCharacterTarget, TriggeringSignal
 from ..effect.structs import StaticTarget, DamageType
 from ..element import *
+from ..helper.fingerprint import combine_fingerprints, fingerprint_of
 from ..helper.quality_of_life import case_val
 from ..state.enums import Pid
 from .enums import CharacterSkill, WeaponType
@@ -44,6 +45,22 @@ __all__ = [
 
 
 class Character:
+    # subclasses should declare empty __slots__ to stay dict-free
+    __slots__ = (
+        "_id",
+        "_alive",
+        "_hp",
+        "_max_hp",
+        "_energy",
+        "_max_energy",
+        "_hiddens",
+        "_equipments",
+        "_statuses",
+        "_aura",
+        "_hash",
+        "_fingerprint",
+    )
+
     _ELEMENT = Element.ANY
     _WEAPON_TYPE: WeaponType
     _TALENT_STATUS: None | type[stt.TalentEquipmentStatus]
@@ -71,6 +88,8 @@ class Character:
         self._equipments = equipments
         self._statuses = statuses
         self._aura = elemental_aura
+        self._hash: None | int = None
+        self._fingerprint: None | int = None
 
     @classmethod
     def _talent_status(cls) -> None | type[stt.TalentEquipmentStatus]:
@@ -151,6 +170,9 @@ class Character:
         This should only be called to get effects right before the skill is to be executed.
 
         Otherwise faulty effects may be generated.
+
+        Skills may draw from game_state.get_rng().random(), the caller is
+        responsible for advancing the random stream afterwards.
         """
         return self._post_skill(
             game_state,
@@ -349,10 +371,25 @@ class Character:
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, type(self)):
             return False
+        if self is other:
+            return True
+        if self._hash is not None and other._hash is not None and self._hash != other._hash:
+            return False
         return self._all_unique_data() == other._all_unique_data()
 
     def __hash__(self) -> int:
-        return hash(self._all_unique_data())
+        if self._hash is None:
+            self._hash = hash(self._all_unique_data())
+        return self._hash
+
+    def fingerprint(self) -> int:
+        """ Stable 64-bit fingerprint, see GameState.fingerprint() """
+        if self._fingerprint is None:
+            self._fingerprint = combine_fingerprints(
+                fingerprint_of(type(self)),
+                map(fingerprint_of, self._all_unique_data()),
+            )
+        return self._fingerprint
 
     def dict_str(self) -> Union[dict, str]:
         return {
@@ -436,6 +473,7 @@ class CharacterFactory:
 
 
 class AratakiItto(Character):
+    __slots__ = ()
     _ELEMENT = Element.GEO
     _WEAPON_TYPE = WeaponType.CLAYMORE
     _TALENT_STATUS = stt.AratakiIchibanStatus
@@ -524,6 +562,7 @@ class AratakiItto(Character):
 
 
 class ElectroHypostasis(Character):
+    __slots__ = ()
     _ELEMENT = Element.ELECTRO
     _WEAPON_TYPE = WeaponType.NONE
     _TALENT_STATUS = None
@@ -608,6 +647,7 @@ class ElectroHypostasis(Character):
 
 
 class KaedeharaKazuha(Character):
+    __slots__ = ()
     _ELEMENT = Element.ANEMO
     _WEAPON_TYPE = WeaponType.SWORD
     _TALENT_STATUS = stt.PoeticsOfFuubutsuStatus
@@ -766,6 +806,7 @@ class KaedeharaKazuha(Character):
 
 
 class Kaeya(Character):
+    __slots__ = ()
     # basic info
     _ELEMENT = Element.CRYO
     _WEAPON_TYPE = WeaponType.SWORD
@@ -844,6 +885,7 @@ class Kaeya(Character):
 
 
 class Keqing(Character):
+    __slots__ = ()
     # basic info
     _ELEMENT = Element.ELECTRO
     _WEAPON_TYPE = WeaponType.SWORD
@@ -984,6 +1026,7 @@ class Keqing(Character):
 
 
 class Klee(Character):
+    __slots__ = ()
     _ELEMENT = Element.PYRO
     _WEAPON_TYPE = WeaponType.CATALYST
     _TALENT_STATUS = stt.PoundingSurpriseStatus
@@ -1065,6 +1108,7 @@ class Klee(Character):
 
 
 class Mona(Character):
+    __slots__ = ()
     _ELEMENT = Element.HYDRO
     _WEAPON_TYPE = WeaponType.CATALYST
     _TALENT_STATUS = stt.ProphecyOfSubmersionStatus
@@ -1148,6 +1192,7 @@ class Mona(Character):
 
 
 class RhodeiaOfLoch(Character):
+    __slots__ = ()
     # basic info
     _ELEMENT = Element.HYDRO
     _WEAPON_TYPE = WeaponType.NONE
@@ -1203,7 +1248,7 @@ class RhodeiaOfLoch(Character):
         )
 
     def _elemental_skill1(self, game_state: GameState, source: StaticTarget) -> tuple[eft.Effect, ...]:
-        from random import choice
+        choice = game_state.get_rng().random().choice
         summons_to_choose = self._not_summoned_types(game_state, source.pid)
         summon: type[sm.Summon]
         if summons_to_choose:
@@ -1218,7 +1263,7 @@ class RhodeiaOfLoch(Character):
         )
 
     def _elemental_skill2(self, game_state: GameState, source: StaticTarget) -> tuple[eft.Effect, ...]:
-        from random import choice
+        choice = game_state.get_rng().random().choice
 
         # first choice
         summons_to_choose = self._not_summoned_types(game_state, source.pid)
@@ -1296,6 +1341,7 @@ class RhodeiaOfLoch(Character):
 
 
 class Tighnari(Character):
+    __slots__ = ()
     _ELEMENT = Element.DENDRO
     _WEAPON_TYPE = WeaponType.BOW
     _TALENT_STATUS = stt.KeenSightStatus
@@ -1373,6 +1419,7 @@ class Tighnari(Character):
 
 
 class Xingqiu(Character):
+    __slots__ = ()
     _ELEMENT = Element.HYDRO
     _WEAPON_TYPE = WeaponType.SWORD
     _TALENT_STATUS = stt.TheScentRemainedStatus
@@ -1,6 +1,8 @@
 from __future__ import annotations
 from typing import Callable, Iterator, Optional, TYPE_CHECKING, Union, Iterable
 
+from ..helper.fingerprint import combine_fingerprints, fingerprint_of
+
 if TYPE_CHECKING:
     from .character import Character
     from ..element import Element
@@ -11,9 +13,13 @@ __all__ = [
 
 
 class Characters:
+    __slots__ = ("_characters", "_active_character_id", "_hash", "_fingerprint")
+
     def __init__(self, characters: tuple[Character, ...], active_character_id: None | int):
         self._characters = characters
         self._active_character_id = active_character_id
+        self._hash: None | int = None
+        self._fingerprint: None | int = None
 
     @classmethod
     def from_default(cls, characters: tuple[Character, ...]) -> Characters:
@@ -128,13 +134,28 @@ class Characters:
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, Characters):
             return False
-        return self is other or self._all_unique_data() == other._all_unique_data()
+        if self is other:
+            return True
+        if self._hash is not None and other._hash is not None and self._hash != other._hash:
+            return False
+        return self._all_unique_data() == other._all_unique_data()
 
     def __ne__(self, other: object) -> bool:
         return not self.__eq__(other)
 
     def __hash__(self) -> int:
-        return hash(self._all_unique_data())
+        if self._hash is None:
+            self._hash = hash(self._all_unique_data())
+        return self._hash
+
+    def fingerprint(self) -> int:
+        """ Stable 64-bit fingerprint, see GameState.fingerprint() """
+        if self._fingerprint is None:
+            self._fingerprint = combine_fingerprints(
+                fingerprint_of(self._active_character_id),
+                (char.fingerprint() for char in self._characters),
+            )
+        return self._fingerprint
 
     def __iter__(self) -> Iterator[Character]:
         return iter(self.get_characters())
@@ -1,13 +1,14 @@
 from __future__ import annotations
 import random
-from collections import Counter
 from functools import lru_cache
 from typing import Any, Optional, Iterator, Iterable
 
 from typing_extensions import Self, override, TYPE_CHECKING
 
+from .helper.fingerprint import fingerprint_of
 from .helper.hashable_dict import HashableDict
 from .helper.quality_of_life import BIG_INT, case_val
+from .helper.rng import random_or_global
 from .element import Element
 
 if TYPE_CHECKING:
@@ -21,117 +22,170 @@ __all__ = [
 ]
 
 
+_ELEMS: tuple[Element, ...] = tuple(Element)
+_NUM_ELEMS = len(_ELEMS)
+_ZEROS: tuple[int, ...] = (0,) * _NUM_ELEMS
+_OMNI = Element.OMNI.value
+_ANY = Element.ANY.value
+
+
+def _vec_of(dices: dict[Element, int]) -> tuple[int, ...]:
+    vec = list(_ZEROS)
+    for elem, num in dices.items():
+        vec[elem.value] += num
+    return tuple(vec)
+
+
+def _illegal_slots(legal_elems: frozenset[Element]) -> tuple[int, ...]:
+    return tuple(elem.value for elem in _ELEMS if elem not in legal_elems)
+
+
 class Dices:
     """
     Base class for dices
+
+    The dices are stored as a fixed-length vector of counts indexed by
+    Element.value, so arithmetic is element-wise and the total number of dices
+    is computed once on creation.
     """
+    __slots__ = ("_vec", "_num", "_hash", "_fingerprint")
+
     _LEGAL_ELEMS = frozenset(elem for elem in Element)
+    _ILLEGAL_SLOTS: tuple[int, ...] = ()
 
     def __init__(self, dices: dict[Element, int]) -> None:
-        self._dices = HashableDict.from_dict(dices)
+        self._vec = _vec_of(dices)
+        self._num = sum(self._vec)
+        self._hash: None | int = None
+        self._fingerprint: None | int = None
+
+    @classmethod
+    def _from_vec(cls, vec: tuple[int, ...]) -> Self:
+        dices = cls.__new__(cls)
+        dices._vec = vec
+        dices._num = sum(vec)
+        dices._hash = None
+        dices._fingerprint = None
+        return dices
+
+    @property
+    def _dices(self) -> HashableDict[Element, int]:
+        """ dict view of the non-zero dices """
+        return HashableDict(self._items())
+
+    def _items(self) -> Iterator[tuple[Element, int]]:
+        return (
+            (elem, num)
+            for elem, num in zip(_ELEMS, self._vec)
+            if num != 0
+        )
 
     def __add__(self, other: Dices | dict[Element, int]) -> Self:
-        dices: dict[Element, int]
-        if isinstance(other, Dices):
-            dices = other._dices
-        else:
-            dices = other
-        return type(self)(self._dices + dices)
+        other_vec = other._vec if isinstance(other, Dices) else _vec_of(other)
+        return self._from_vec(tuple(a + b for a, b in zip(self._vec, other_vec)))
 
     def __sub__(self, other: Dices | dict[Element, int]) -> Self:
-        dices: dict[Element, int]
-        if isinstance(other, Dices):
-            dices = other._dices
-        else:
-            dices = other
-        return type(self)(self._dices - dices)
+        other_vec = other._vec if isinstance(other, Dices) else _vec_of(other)
+        return self._from_vec(tuple(a - b for a, b in zip(self._vec, other_vec)))
 
     def num_dices(self) -> int:
-        return sum(self._dices.values())
+        return self._num
 
     def is_even(self) -> bool:
-        return self.num_dices() % 2 == 0
+        return self._num % 2 == 0
 
     def is_empty(self) -> bool:
-        return not any(val > 0 for val in self._dices.values())
+        return not any(num > 0 for num in self._vec)
 
     def is_legal(self) -> bool:
-        return all(map(lambda x: x >= 0, self._dices.values())) \
-            and all(elem in self._LEGAL_ELEMS for elem in self._dices)
+        vec = self._vec
+        return min(vec) >= 0 and not any(vec[i] for i in self._ILLEGAL_SLOTS)
 
     def validify(self) -> Self:
         if self.is_legal():
             return self
-        return type(self)(dict(
-            (elem, n)
-            for elem, n in self._dices.items()
-            if elem in self._LEGAL_ELEMS and n > 0
-        ))
+        vec = [max(num, 0) for num in self._vec]
+        for i in self._ILLEGAL_SLOTS:
+            vec[i] = 0
+        return self._from_vec(tuple(vec))
 
     def elems(self) -> Iterable[Element]:
-        return self._dices.keys()
+        return tuple(elem for elem, _ in self._items())
 
-    def pick_random_dices(self, num: int) -> tuple[Self, Self]:
+    def pick_random_dices(
+            self,
+            num: int,
+            rand: None | random.Random = None,
+    ) -> tuple[Self, Self]:
         """
         Returns the left dices and selected dices
+
+        Draws from rand if provided, otherwise from the global random module.
         """
         num = min(self.num_dices(), num)
         if num == 0:
             return (self, type(self).from_empty())
-        picked_dices: dict[Element, int] = HashableDict(Counter(
-            random.sample(list(self._dices.keys()), counts=self._dices.values(), k=num)
-        ))
-        return type(self)(self._dices - picked_dices), type(self)(picked_dices)
+        rand = random_or_global(rand)
+        picked = list(_ZEROS)
+        for elem in rand.sample(_ELEMS, counts=self._vec, k=num):
+            picked[elem.value] += 1
+        picked_dices = self._from_vec(tuple(picked))
+        return self - picked_dices, picked_dices
 
     def __contains__(self, elem: Element) -> bool:
         return (
             elem in self._LEGAL_ELEMS
-            and self[elem] > 0
+            and self._vec[elem.value] > 0
         )
 
     def __iter__(self) -> Iterator[Element]:
         return (
             elem
-            for elem in self._dices
-            if self[elem] > 0
+            for elem, num in zip(_ELEMS, self._vec)
+            if num > 0
         )
 
     def __getitem__(self, index: Element) -> int:
-        return self._dices.get(index, 0)
+        return self._vec[index.value]
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, Dices):
             return False
-        return self is other or self._dices == other._dices
+        if self is other:
+            return True
+        if self._hash is not None and other._hash is not None and self._hash != other._hash:
+            return False
+        return self._vec == other._vec
 
     def __hash__(self) -> int:
-        return hash(self._dices)
+        if self._hash is None:
+            self._hash = hash(self._vec)
+        return self._hash
+
+    def fingerprint(self) -> int:
+        """ Stable 64-bit fingerprint, see GameState.fingerprint() """
+        if self._fingerprint is None:
+            self._fingerprint = fingerprint_of(dict(self._items()))
+        return self._fingerprint
 
     def __repr__(self) -> str:
-        existing_dices = dict([
-            (dice.name, str(num))
-            for dice, num in self._dices.items()
-            if num != 0
-        ])
         return (
             '{'
             + ", ".join(
-                f"{key}: {val}"
-                for key, val in existing_dices.items()
+                f"{elem.name}: {num}"
+                for elem, num in self._items()
             )
             + '}'
         )
 
     def to_dict(self) -> dict[Element, int]:
-        return self._dices.to_dict()
+        return dict(self._items())
 
     def dict_str(self) -> dict[str, Any]:
-        existing_dices = dict([
-            (dice.name, str(num))
-            for dice, num in self._dices.items()
-            if num != 0
-        ])
-        return existing_dices
+        return dict(
+            (elem.name, str(num))
+            for elem, num in self._items()
+        )
 
     def __copy__(self) -> Self:  # pragma: no cover
         return self
@@ -141,10 +195,7 @@ class Dices:
 
     @classmethod
     def from_empty(cls) -> Self:
-        return cls(HashableDict((
-            (elem, 0)
-            for elem in cls._LEGAL_ELEMS
-        )))
+        return cls._from_vec(_ZEROS)
 
 
 _PURE_ELEMS = frozenset({
@@ -156,12 +207,15 @@ _PURE_ELEMS = frozenset({
     Element.CRYO,
     Element.GEO,
 })
+_PURE_SLOTS: tuple[int, ...] = tuple(elem.value for elem in _ELEMS if elem in _PURE_ELEMS)
 
 
 class ActualDices(Dices):
     """
     Used for the actual dices a player can have.
     """
+    __slots__ = ()
+
     _LEGAL_ELEMS = frozenset({
         Element.OMNI,
         Element.PYRO,
@@ -172,6 +226,7 @@ class ActualDices(Dices):
         Element.CRYO,
         Element.GEO,
     })
+    _ILLEGAL_SLOTS = _illegal_slots(_LEGAL_ELEMS)
 
     # tested against the actual game in Genshin
     _LEGAL_ELEMS_ORDERED: tuple[Element, ...] = (
@@ -196,30 +251,7 @@ class ActualDices(Dices):
 
     def _satisfy(self, requirement: AbstractDices) -> bool:
         assert self.is_legal() and requirement.is_legal()
-
-        # satisfy all pure elements first
-        pure_deducted: HashableDict[Element, int] = HashableDict((
-            (elem, self[elem] - requirement[elem])
-            for elem in _PURE_ELEMS
-        ), frozen=False)
-        omni_needed = sum(
-            -num
-            for num in pure_deducted.values()
-            if num < 0
-        )
-
-        # if OMNI given cannot cover pure misses, fail
-        if self[Element.OMNI] < omni_needed:
-            return False
-
-        # test OMNI requirement
-        omni_remained = self[Element.OMNI] - omni_needed
-        most_pure = max(pure_deducted.values())
-        if omni_remained + most_pure < requirement[Element.OMNI]:
-            return False
-
-        # We have enough dices to satisfy Element.ANY, so success
-        return True
+        return _cached_satisfy(self, requirement)
 
     def loosely_satisfy(self, requirement: AbstractDices) -> bool:
         """
@@ -246,73 +278,34 @@ class ActualDices(Dices):
             requirement: AbstractDices,
             game_state: Optional[GameState] = None,
     ) -> Optional[ActualDices]:
-        if requirement.num_dices() > self.num_dices():
-            return None
-        # TODO: optimize for having game_state
-        from collections import defaultdict
-        remaining: dict[Element, int] = self._dices.copy()
-        answer: dict[Element, int] = defaultdict(int)
-        pures: dict[Element, int] = HashableDict(frozen=False)
-        omni = 0
-        any = 0
-        omni_required = 0
-        for elem in requirement:
-            if elem in _PURE_ELEMS:
-                pures[elem] = requirement[elem]
-            elif elem is Element.OMNI:
-                omni = requirement[elem]
-            elif elem is Element.ANY:
-                any = requirement[elem]
-            else:  # pragma: no cover
-                raise Exception("Unknown element")
-        if len(pures) > 0:
-            for elem in pures:
-                if remaining.get(elem, 0) < pures[elem]:
-                    answer[elem] += remaining.get(elem, 0)
-                    omni_required += pures[elem] - remaining.get(elem, 0)
-                    remaining[elem] = 0
-                else:
-                    answer[elem] += pures[elem]
-                    remaining[elem] -= pures[elem]
-        if omni > 0:
-            best_elem: Optional[Element] = None
-            best_count = 0
-            for elem in list(_PURE_ELEMS):
-                this_count = remaining.get(elem, 0)
-                if best_count > omni and this_count >= omni and this_count < best_count:
-                    best_elem = elem
-                    best_count = this_count
-                elif best_count < omni and this_count > best_count:
-                    best_elem = elem
-                    best_count = this_count
-                elif best_count == omni:
-                    break
-            if best_elem is not None:
-                best_count = min(best_count, omni)
-                answer[best_elem] += best_count
-                remaining[best_elem] -= best_count
-                omni_required += omni - best_count
-            else:
-                omni_required += omni
-        if any > 0:
-            from operator import itemgetter
-            sorted_elems = sorted(remaining.items(), key=itemgetter(1))
-            for elem, num in sorted_elems:
-                if elem in _PURE_ELEMS:
-                    num = min(num, any)
-                    answer[elem] += num
-                    remaining[elem] -= num
-                    any -= num
-                    if any == 0:
-                        break
-            if any > 0:
-                answer[Element.OMNI] += any
-                remaining[Element.OMNI] -= any
-        if omni_required > 0:
-            if remaining.get(Element.OMNI, 0) < omni_required:
-                return None
-            answer[Element.OMNI] += omni_required
-        return ActualDices(answer)
+        """
+        Returns a payment of exactly the number of dices requirement asks for,
+        or None if self cannot afford it.
+
+        Results are cached on (self, requirement).
+
+        game_state is ignored and only kept for compatibility: the payment only
+        depends on (self, requirement), so it is cacheable and canonical (see
+        GameState.legal_actions()). For payments that take the characters
+        into account, see minimal_payments().
+        """
+        return _basic_payment(self, requirement)
+
+    def minimal_payments(
+            self,
+            requirement: AbstractDices,
+            priority_elems: frozenset[Element] = frozenset(),
+    ) -> tuple[ActualDices, ...]:
+        """
+        Returns all the distinct payments of exactly the number of dices
+        requirement asks for, that is all the ways self can pay requirement.
+
+        Payments spending fewer OMNI dices come first, then those spending fewer
+        dices of priority_elems (e.g. the elements of the alive characters).
+
+        Results are cached on (self, requirement, priority_elems).
+        """
+        return _minimal_payments(self, requirement, priority_elems)
 
     def _init_ordered_dices(
             self,
@@ -359,26 +352,25 @@ class ActualDices(Dices):
         )
 
     @classmethod
-    def from_random(cls, size: int) -> ActualDices:
-        dices = ActualDices.from_empty()
-        dices._dices._unfreeze()
+    def from_random(cls, size: int, rand: None | random.Random = None) -> ActualDices:
+        """ Draws from rand if provided, otherwise from the global random module. """
+        rand = random_or_global(rand)
+        legal_elems = ActualDices._LEGAL_ELEMS_ORDERED
+        vec = list(_ZEROS)
         for i in range(size):
-            elem = random.choice(tuple(ActualDices._LEGAL_ELEMS))
-            dices._dices[elem] += 1
-        dices._dices.freeze()
-        return dices
+            elem = rand.choice(legal_elems)
+            vec[elem.value] += 1
+        return ActualDices._from_vec(tuple(vec))
 
     @classmethod
     def from_all(cls, size: int, elem: Element) -> ActualDices:
-        dices = ActualDices.from_empty()
-        dices._dices._unfreeze()
-        dices._dices[Element.OMNI] = size
-        dices._dices.freeze()
-        return dices
+        vec = list(_ZEROS)
+        vec[_OMNI] = size
+        return ActualDices._from_vec(tuple(vec))
 
     @classmethod
     def from_dices(cls, dices: Dices) -> Optional[ActualDices]:
-        new_dices = ActualDices(dices._dices)
+        new_dices = ActualDices._from_vec(dices._vec)
         if not new_dices.is_legal():
             return None
         else:
@@ -389,6 +381,8 @@ class AbstractDices(Dices):
     """
     Used for the dice cost of cards and other actions
     """
+    __slots__ = ()
+
     _LEGAL_ELEMS = frozenset({
         Element.OMNI,  # represents the request for dices of the same type
         Element.PYRO,
@@ -400,11 +394,143 @@ class AbstractDices(Dices):
         Element.GEO,
         Element.ANY,
     })
+    _ILLEGAL_SLOTS = _illegal_slots(_LEGAL_ELEMS)
 
     @classmethod
     def from_dices(cls, dices: Dices) -> Optional[AbstractDices]:
-        new_dices = AbstractDices(dices._dices)
+        new_dices = AbstractDices._from_vec(dices._vec)
         if not new_dices.is_legal():
             return None
         else:
             return new_dices
+
+
+#: bound of each of the payment caches below
+_PAYMENT_CACHE_SIZE = 4096
+
+
+def _satisfy_vecs(vec: tuple[int, ...], req: tuple[int, ...]) -> bool:
+    # satisfy all pure elements first
+    omni_needed = 0
+    most_pure = -BIG_INT
+    for i in _PURE_SLOTS:
+        deducted = vec[i] - req[i]
+        if deducted < 0:
+            omni_needed -= deducted
+        if deducted > most_pure:
+            most_pure = deducted
+
+    # if OMNI given cannot cover pure misses, fail
+    if vec[_OMNI] < omni_needed:
+        return False
+
+    # test OMNI requirement
+    omni_remained = vec[_OMNI] - omni_needed
+    if omni_remained + most_pure < req[_OMNI]:
+        return False
+
+    # We have enough dices to satisfy Element.ANY, so success
+    return True
+
+
+@lru_cache(maxsize=_PAYMENT_CACHE_SIZE)
+def _cached_satisfy(pool: ActualDices, requirement: AbstractDices) -> bool:
+    return _satisfy_vecs(pool._vec, requirement._vec)
+
+
+@lru_cache(maxsize=_PAYMENT_CACHE_SIZE)
+def _basic_payment(pool: ActualDices, requirement: AbstractDices) -> Optional[ActualDices]:
+    if requirement.num_dices() > pool.num_dices():
+        return None
+    req = requirement._vec
+    remaining = list(pool._vec)
+    answer = list(_ZEROS)
+    omni = req[_OMNI]
+    any = req[_ANY]
+    omni_required = 0
+    for i in _PURE_SLOTS:
+        needed = req[i]
+        if needed == 0:
+            continue
+        if remaining[i] < needed:
+            answer[i] += remaining[i]
+            omni_required += needed - remaining[i]
+            remaining[i] = 0
+        else:
+            answer[i] += needed
+            remaining[i] -= needed
+    if omni > 0:
+        best_slot: Optional[int] = None
+        best_count = 0
+        for i in _PURE_SLOTS:
+            this_count = remaining[i]
+            if best_count > omni and this_count >= omni and this_count < best_count:
+                best_slot = i
+                best_count = this_count
+            elif best_count < omni and this_count > best_count:
+                best_slot = i
+                best_count = this_count
+            elif best_count == omni:
+                break
+        if best_slot is not None:
+            best_count = min(best_count, omni)
+            answer[best_slot] += best_count
+            remaining[best_slot] -= best_count
+            omni_required += omni - best_count
+        else:
+            omni_required += omni
+    if any > 0:
+        for i in sorted(_PURE_SLOTS, key=remaining.__getitem__):
+            num = min(remaining[i], any)
+            answer[i] += num
+            remaining[i] -= num
+            any -= num
+            if any == 0:
+                break
+        if any > 0:
+            answer[_OMNI] += any
+            remaining[_OMNI] -= any
+    if omni_required > 0:
+        if remaining[_OMNI] < omni_required:
+            return None
+        answer[_OMNI] += omni_required
+    return ActualDices._from_vec(tuple(answer))
+
+
+@lru_cache(maxsize=_PAYMENT_CACHE_SIZE)
+def _minimal_payments(
+        pool: ActualDices,
+        requirement: AbstractDices,
+        priority_elems: frozenset[Element],
+) -> tuple[ActualDices, ...]:
+    assert pool.is_legal() and requirement.is_legal()
+    num = requirement.num_dices()
+    if num > pool.num_dices():
+        return ()
+    pool_vec, req_vec = pool._vec, requirement._vec
+    slots = tuple(i for i, n in enumerate(pool_vec) if n > 0)
+    payments: list[ActualDices] = []
+    vec = list(_ZEROS)
+
+    def fill(k: int, left: int) -> None:
+        """ distributes the left dices over slots[k:] """
+        if left == 0:
+            payment = tuple(vec)
+            if _satisfy_vecs(payment, req_vec):
+                payments.append(ActualDices._from_vec(payment))
+            return
+        if k == len(slots):
+            return
+        i = slots[k]
+        for n in range(min(pool_vec[i], left), -1, -1):
+            vec[i] = n
+            fill(k + 1, left - n)
+        vec[i] = 0
+
+    fill(0, num)
+    priority_slots = tuple(elem.value for elem in priority_elems)
+    payments.sort(key=lambda payment: (
+        payment._vec[_OMNI],
+        sum(payment._vec[i] for i in priority_slots),
+    ))
+    return tuple(payments)
@@ -12,7 +12,7 @@ ordered alphabetically.
 """
 from __future__ import annotations
 from dataclasses import asdict, dataclass, field, replace
-from typing import cast, FrozenSet, Iterable, Optional, TYPE_CHECKING, Union
+from typing import cast, ClassVar, FrozenSet, Iterable, Optional, TYPE_CHECKING, Union
 
 from typing_extensions import override
 
@@ -28,7 +28,7 @@ from ..event import *
 from ..helper.quality_of_life import just, case_val
 from ..state.enums import Pid, Act
 from ..status.enums import Preprocessables, Informables
-from ..status.status_processing import StatusProcessing
+from ..status.status_processing import BatchedStatusProcessing, StatusProcessing
 from .enums import DynamicCharacterTarget, TriggeringSignal, Zone
 from .structs import StaticTarget, DamageType
 
@@ -710,13 +710,9 @@ class ApplyElementalAuraEffect(DirectEffect):
         all_aura = target_char.get_elemental_aura()
         if target_char.defeated() or self.element in all_aura:
             return game_state
-        reaction_detail = all_aura.consult_reaction(self.element)
-        new_aura = all_aura
+        reaction_detail, new_aura = all_aura.react(self.element)
         effects: list[Effect] = []
-        if reaction_detail is None:
-            new_aura = new_aura.add(self.element)
-        else:
-            new_aura = new_aura.remove(reaction_detail.first_elem)
+        if reaction_detail is not None:
             if reaction_detail.reaction_type is Reaction.BLOOM:
                 effects.append(
                     AddCombatStatusEffect(
@@ -784,50 +780,38 @@ class SpecificDamageEffect(DirectEffect):
     damage_type: DamageType
     reaction: Optional[ReactionDetail] = None
 
+    #: if True, _resolve_damage() also resolves every damage status by status
+    #: and asserts that both paths lead to the same result
+    VERIFY_BATCHED_STATUSES: ClassVar[bool] = False
+
     @staticmethod
     def _damage_preprocess(
-            game_state: GameState, damage: SpecificDamageEffect, pp_type: Preprocessables
-    ) -> tuple[GameState, SpecificDamageEffect]:
-        source_id = damage.source.pid
-        game_state, item = StatusProcessing.preprocess_by_all_statuses(
-            game_state,
-            source_id,
-            pp_type,
-            DmgPEvent(dmg=damage),
-        )
+            game_state: GameState,
+            statuses: BatchedStatusProcessing,
+            damage: SpecificDamageEffect,
+            pp_type: Preprocessables,
+    ) -> SpecificDamageEffect:
+        item = statuses.preprocess(game_state, pp_type, DmgPEvent(dmg=damage))
         assert isinstance(item, DmgPEvent), item
-        damage = item.dmg
-        return game_state, damage
-
-    @classmethod
-    def _element_confirmation(
-            cls, game_state: GameState, damage: SpecificDamageEffect
-    ) -> tuple[GameState, SpecificDamageEffect]:
-        """ This is the pass to check final damage element """
-        return cls._damage_preprocess(game_state, damage, Preprocessables.DMG_ELEMENT)
-
-    @classmethod
-    def _reaction_confirmation(
-            cls, game_state: GameState, damage: SpecificDamageEffect
+        return item.dmg
+
+    @staticmethod
+    def _apply_reaction(
+            game_state: GameState, damage: SpecificDamageEffect
     ) -> tuple[GameState, SpecificDamageEffect, Optional[ReactionDetail]]:
-        """ This is the pass to check final damage reaction type """
+        """ Identifies the reaction and updates the target's aura accordingly """
         target_char = game_state.get_character_target(damage.target)
         assert target_char is not None
 
         # try to identify the reaction
         second_elem = damage.element
         all_aura = target_char.get_elemental_aura()
-        reaction_detail = all_aura.consult_reaction(second_elem)
-
-        # generate & update new aura
-        new_aura = all_aura
+        reaction_detail, new_aura = all_aura.react(second_elem)
         if reaction_detail is not None:
-            new_aura = new_aura.remove(reaction_detail.first_elem)
             damage = replace(damage, reaction=reaction_detail)
-        elif new_aura.aurable(second_elem):
-            new_aura = new_aura.add(second_elem)
 
-        if new_aura != all_aura:
+        # update new aura
+        if new_aura is not all_aura:
             game_state = game_state.factory().f_player(
                 just(game_state.belongs_to(target_char)),
                 lambda p: p.factory().f_characters(
@@ -836,42 +820,81 @@ class SpecificDamageEffect(DirectEffect):
                     ).build()
                 ).build()
             ).build()
-
-        game_state, damage = cls._damage_preprocess(
-            game_state, damage, Preprocessables.DMG_REACTION
-        )
         return game_state, damage, reaction_detail
 
-    @classmethod
-    def _damage_confirmation(
-            cls, game_state: GameState, damage: SpecificDamageEffect
-    ) -> tuple[GameState, SpecificDamageEffect]:
-        """ This is the pass to check final damage amount """
-        game_state, damage = cls._damage_preprocess(
-            game_state, damage, Preprocessables.DMG_AMOUNT_PLUS)
-        game_state, damage = cls._damage_preprocess(
-            game_state, damage, Preprocessables.DMG_AMOUNT_MUL)
-        return cls._damage_preprocess(game_state, damage, Preprocessables.DMG_AMOUNT_MINUS)
-
-    def execute(self, game_state: GameState) -> GameState:
-        # Preprocessing
-        game_state, elemented_damage = self._element_confirmation(game_state, self)
-        game_state, reactioned_damage, reaction = self._reaction_confirmation(
-            game_state, elemented_damage
+    def _resolve_damage(
+            self, game_state: GameState
+    ) -> tuple[GameState, SpecificDamageEffect, Optional[ReactionDetail]]:
+        """
+        Runs all the preprocessing passes (element, reaction, amount +, *, -) and
+        informs statuses of the final damage.
+
+        The statuses involved are processed by one BatchedStatusProcessing, so
+        their updates are written to the game state once at the end.
+        """
+        initial_game_state = game_state
+        statuses = BatchedStatusProcessing(game_state, self.source.pid)
+        damage = self._damage_preprocess(game_state, statuses, self, Preprocessables.DMG_ELEMENT)
+        game_state, damage, reaction = self._apply_reaction(game_state, damage)
+        damage = self._damage_preprocess(
+            game_state, statuses, damage, Preprocessables.DMG_REACTION
         )
         if reaction is not None:
-            reactioned_damage = replace(
-                reactioned_damage,
-                damage=reactioned_damage.damage + reaction.reaction_type.damage_boost(),
+            damage = replace(
+                damage,
+                damage=damage.damage + reaction.reaction_type.damage_boost(),
             )
-        game_state, actual_damage = self._damage_confirmation(game_state, reactioned_damage)
+        for pp_type in (
+                Preprocessables.DMG_AMOUNT_PLUS,
+                Preprocessables.DMG_AMOUNT_MUL,
+                Preprocessables.DMG_AMOUNT_MINUS,
+        ):
+            damage = self._damage_preprocess(game_state, statuses, damage, pp_type)
         # Update all statuses with this damage
+        statuses.inform(game_state, Informables.DMG_DELT, DmgIEvent(dmg=damage))
+        result = statuses.commit(game_state), damage, reaction
+        if SpecificDamageEffect.VERIFY_BATCHED_STATUSES:
+            assert result == self._resolve_damage_by_status(initial_game_state), \
+                f"batched statuses diverge when resolving {self} at game state:\n{initial_game_state}"
+        return result
+
+    def _resolve_damage_by_status(
+            self, game_state: GameState
+    ) -> tuple[GameState, SpecificDamageEffect, Optional[ReactionDetail]]:
+        """
+        Same as _resolve_damage() but the game state is rebuilt after each
+        status update, see VERIFY_BATCHED_STATUSES.
+        """
+        def preprocess(
+                game_state: GameState, damage: SpecificDamageEffect, pp_type: Preprocessables
+        ) -> tuple[GameState, SpecificDamageEffect]:
+            game_state, item = StatusProcessing.preprocess_by_all_statuses(
+                game_state, damage.source.pid, pp_type, DmgPEvent(dmg=damage),
+            )
+            assert isinstance(item, DmgPEvent), item
+            return game_state, item.dmg
+
+        game_state, damage = preprocess(game_state, self, Preprocessables.DMG_ELEMENT)
+        game_state, damage, reaction = self._apply_reaction(game_state, damage)
+        game_state, damage = preprocess(game_state, damage, Preprocessables.DMG_REACTION)
+        if reaction is not None:
+            damage = replace(
+                damage,
+                damage=damage.damage + reaction.reaction_type.damage_boost(),
+            )
+        for pp_type in (
+                Preprocessables.DMG_AMOUNT_PLUS,
+                Preprocessables.DMG_AMOUNT_MUL,
+                Preprocessables.DMG_AMOUNT_MINUS,
+        ):
+            game_state, damage = preprocess(game_state, damage, pp_type)
         game_state = StatusProcessing.inform_all_statuses(
-            game_state,
-            actual_damage.source.pid,
-            Informables.DMG_DELT,
-            DmgIEvent(dmg=actual_damage),
+            game_state, damage.source.pid, Informables.DMG_DELT, DmgIEvent(dmg=damage),
         )
+        return game_state, damage, reaction
+
+    def execute(self, game_state: GameState) -> GameState:
+        game_state, actual_damage, reaction = self._resolve_damage(game_state)
 
         # Get damage target
         target = game_state.get_character_target(actual_damage.target)
@@ -1682,7 +1705,8 @@ class CastSkillEffect(DirectEffect):
         effects = character.skill(game_state, self.target, self.skill)
         if not effects:  # pragma: no cover
             return game_state
-        return game_state.factory().f_effect_stack(
+        # skills may draw from the random stream
+        return game_state.factory().rng(game_state.get_rng().next()).f_effect_stack(
             lambda es: es.push_many_fl(effects)
         ).build()
 
@@ -1,5 +1,7 @@
 from __future__ import annotations
-from typing import Iterable, TYPE_CHECKING
+from typing import Callable, Iterable, Iterator, Optional, TYPE_CHECKING
+
+from ..helper.fingerprint import combine_fingerprints, fingerprint_of, zobrist_key
 
 if TYPE_CHECKING:
     from .effect import Effect
@@ -9,35 +11,114 @@ __all__ = [
 ]
 
 
+class _EffectNode:
+    """
+    An immutable cell of the persistent stack. Nodes are shared between all the
+    stacks derived from one another, so they must never be mutated after creation
+    (except for the lazily cached hash and fingerprint).
+    """
+    __slots__ = ("effect", "next", "size", "_hash", "_fingerprint")
+
+    def __init__(self, effect: Effect, next: Optional[_EffectNode]) -> None:
+        self.effect = effect
+        self.next = next
+        self.size: int = 1 if next is None else next.size + 1
+        self._hash: Optional[int] = None
+        self._fingerprint: Optional[int] = None
+
+
+def _cached_fold(
+        node: Optional[_EffectNode],
+        attr: str,
+        empty: int,
+        step: Callable[[Effect, int], int],
+) -> int:
+    """
+    Folds the stack starting at node from bottom to top with step(), caching the
+    result of every node in attr so that shared tails are only folded once.
+    """
+    if node is None:
+        return empty
+    cached = getattr(node, attr)
+    if cached is not None:
+        return cached
+    # collect the nodes not computed yet iteratively to avoid deep recursion
+    pending: list[_EffectNode] = []
+    curr: Optional[_EffectNode] = node
+    while curr is not None and getattr(curr, attr) is None:
+        pending.append(curr)
+        curr = curr.next
+    val = empty if curr is None else getattr(curr, attr)
+    for n in reversed(pending):
+        val = step(n.effect, val)
+        setattr(n, attr, val)
+    return val
+
+
+def _hash_step(effect: Effect, tail_hash: int) -> int:
+    return hash((effect, tail_hash))
+
+
+def _fingerprint_step(effect: Effect, tail_fingerprint: int) -> int:
+    return combine_fingerprints(tail_fingerprint, (fingerprint_of(effect),))
+
+
+_EMPTY_HASH = hash(())
+_EMPTY_FINGERPRINT = zobrist_key("EffectStack")
+
+
 class EffectStack:
+    """
+    A persistent (immutable) stack of effects.
+
+    The stack is backed by a singly linked list whose head is the top of the stack,
+    so push and pop are O(1) and all stacks derived from one another share their
+    common tails.
+
+    The constructor takes the effects in the order from bottom to top, that is the
+    last effect of the tuple is the first one to be popped.
+    """
+    __slots__ = ("_head",)
+
     def __init__(self, effects: tuple[Effect, ...]) -> None:
-        self._effects = effects
+        head: Optional[_EffectNode] = None
+        for effect in effects:
+            head = _EffectNode(effect, head)
+        self._head = head
+
+    @classmethod
+    def _from_head(cls, head: Optional[_EffectNode]) -> EffectStack:
+        stack = cls.__new__(cls)
+        stack._head = head
+        return stack
 
     def is_not_empty(self) -> bool:
-        return not self.is_empty()
+        return self._head is not None
 
     def is_empty(self) -> bool:
-        return len(self._effects) == 0
+        return self._head is None
 
     def pop(self) -> tuple[EffectStack, Effect]:
-        assert not self.is_empty()
-        return (EffectStack(tuple(self._effects[:-1])), self._effects[-1])
+        assert self._head is not None
+        return (EffectStack._from_head(self._head.next), self._head.effect)
 
     def peek(self) -> Effect:
-        assert not self.is_empty()
-        return self._effects[-1]
+        assert self._head is not None
+        return self._head.effect
 
     def push_one(self, effect: Effect) -> EffectStack:
-        return EffectStack(self._effects + (effect, ))
+        return EffectStack._from_head(_EffectNode(effect, self._head))
 
     def push_many_lf(self, effects: Iterable[Effect]) -> EffectStack:
         """
         lf means the effects passed in are executed from the last to the first
         """
-        effects = tuple(effects)
-        if not effects:
+        head = self._head
+        for effect in effects:
+            head = _EffectNode(effect, head)
+        if head is self._head:
             return self
-        return EffectStack(self._effects + effects)
+        return EffectStack._from_head(head)
 
     def push_many_fl(self, effects: Iterable[Effect]) -> EffectStack:
         """
@@ -46,27 +127,56 @@ class EffectStack:
         effects = tuple(effects)
         if not effects:
             return self
-        return EffectStack(self._effects + effects[::-1])
+        head = self._head
+        for effect in reversed(effects):
+            head = _EffectNode(effect, head)
+        return EffectStack._from_head(head)
+
+    def _iter_top_down(self) -> Iterator[Effect]:
+        node = self._head
+        while node is not None:
+            yield node.effect
+            node = node.next
 
     def contains(self, effect_type: type[Effect]) -> bool:
-        for effect in self._effects:
+        for effect in self._iter_top_down():
             if type(effect) == effect_type:
                 return True
         return False
 
+    def __len__(self) -> int:
+        return 0 if self._head is None else self._head.size
+
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, EffectStack):
             return False
-        return self is other or self._effects == other._effects
+        if self is other:
+            return True
+        this, that = self._head, other._head
+        if len(self) != len(other):
+            return False
+        while this is not None and that is not None:
+            if this is that:
+                return True
+            if this._hash is not None and that._hash is not None and this._hash != that._hash:
+                return False
+            if this.effect != that.effect:
+                return False
+            this, that = this.next, that.next
+        return this is that
 
     def __hash__(self) -> int:
-        return hash(self._effects)
+        return _cached_fold(self._head, "_hash", _EMPTY_HASH, _hash_step)
+
+    def fingerprint(self) -> int:
+        """ Stable 64-bit fingerprint, see GameState.fingerprint() """
+        return _cached_fold(self._head, "_fingerprint", _EMPTY_FINGERPRINT, _fingerprint_step)
 
     def __str__(self) -> str:
-        return str(self._effects)
+        return str(tuple(reversed(tuple(self._iter_top_down()))))
 
     def dict_str(self) -> dict | str:
         content = {}
-        for i, effect in enumerate(reversed(self._effects)):
+        for i, effect in enumerate(self._iter_top_down()):
             content[f"{str(i)}-{effect.name()}"] = effect.dict_str()
         return content
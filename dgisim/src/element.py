@@ -6,7 +6,7 @@ from dataclasses import dataclass
 from enum import Enum
 from typing import Any, FrozenSet, Optional, Iterator
 
-from .helper.hashable_dict import HashableDict
+from .helper.fingerprint import zobrist_key
 
 __all__ = [
     "AURA_ELEMENTS",
@@ -120,26 +120,26 @@ class Reaction(Enum):
 
     @classmethod
     def consult_reaction(cls, first: Element, second: Element) -> Optional[Reaction]:
-        for reaction in cls:
-            e1, e2 = reaction.value.reaction_elems
-            if (first in e1 and second in e2) or (first in e2 and second in e1):
-                return reaction
-        return None
+        return _REACTION_PAIRS.get((first, second))
 
     @classmethod
     def consult_reaction_with_aura(
             cls, aura: ElementalAura, second: Element
     ) -> None | ReactionDetail:
-        for elem in aura:
-            reaction = cls.consult_reaction(elem, second)
-            if reaction is not None:
-                return ReactionDetail(reaction, elem, second)
-        return None
+        return _REACTION_TABLE[aura._mask][second.value][0]
 
     def damage_boost(self) -> int:
         return self.value.damage_boost
 
 
+_REACTION_PAIRS: dict[tuple[Element, Element], Reaction] = {}
+for _reaction in Reaction:
+    for _e1 in _reaction.value.reaction_elems[0]:
+        for _e2 in _reaction.value.reaction_elems[1]:
+            _REACTION_PAIRS.setdefault((_e1, _e2), _reaction)
+            _REACTION_PAIRS.setdefault((_e2, _e1), _reaction)
+
+
 @dataclass(frozen=True)
 class ReactionDetail:
     reaction_type: Reaction
@@ -161,76 +161,142 @@ class ReactionDetail:
             )
 
 
+_AURA_BITS: dict[Element, int] = {
+    elem: 1 << i
+    for i, elem in enumerate(AURA_ELEMENTS_ORDERED)
+}
+_NUM_AURA_MASKS = 1 << len(AURA_ELEMENTS_ORDERED)
+
+
 class ElementalAura:
-    def __init__(self, aura: dict[Element, bool] = {}) -> None:
+    """
+    The set of elements applied to a character, stored as a bitmask over
+    AURA_ELEMENTS_ORDERED (which is also the order of iteration).
+
+    There are only a few possible auras, so instances are interned and the
+    reaction of any incoming element is looked up in a table precomputed at
+    import time. (see react())
+    """
+    __slots__ = ("_mask", "_hash")
+
+    _mask: int
+    _hash: int
+
+    def __new__(cls, aura: dict[Element, bool] = {}) -> ElementalAura:
         assert aura.keys() <= AURA_ELEMENTS
-        self._aura = HashableDict.from_dict(aura)
+        mask = 0
+        for elem, applied in aura.items():
+            if applied:
+                mask |= _AURA_BITS[elem]
+        return _AURAS[mask]
+
+    @classmethod
+    def _new(cls, mask: int) -> ElementalAura:
+        """ Only used to create the interned instances in _AURAS """
+        aura = object.__new__(cls)
+        aura._mask = mask
+        aura._hash = hash((ElementalAura, mask))
+        return aura
 
     @classmethod
     def from_default(cls) -> ElementalAura:
-        return cls(HashableDict(
-            (elem, False)
-            for elem in AURA_ELEMENTS_ORDERED
-        ))
+        return _AURAS[0]
 
     @staticmethod
     def aurable(elem: Element) -> bool:
         return elem in AURA_ELEMENTS
 
     def peek(self) -> Optional[Element]:
-        for elem, aura in self._aura.items():
-            if aura:
-                return elem
+        for elem in self:
+            return elem
         return None
 
     def remove(self, elem: Element) -> ElementalAura:
         assert elem in AURA_ELEMENTS
-        return ElementalAura(HashableDict(
-            (e, aura if e != elem else False)
-            for e, aura in self._aura.items()
-        ))
+        return _AURAS[self._mask & ~_AURA_BITS[elem]]
 
     def add(self, elem: Element) -> ElementalAura:
         assert elem in AURA_ELEMENTS
-        if elem in self._aura and self._aura[elem]:
-            return self
-        return ElementalAura(HashableDict(
-            (e, aura if e != elem else True)
-            for e, aura in self._aura.items()
-        ))
+        return _AURAS[self._mask | _AURA_BITS[elem]]
 
     def contains(self, elem: Element) -> bool:
         assert elem in AURA_ELEMENTS
-        return self._aura[elem]
+        return bool(self._mask & _AURA_BITS[elem])
 
     def __contains__(self, elem: Element) -> bool:
         return self.contains(elem)
 
     def has_aura(self) -> bool:
-        return any(self._aura.values())
+        return self._mask != 0
 
     def elem_auras(self) -> tuple[Element, ...]:
-        return tuple(iter(self))
+        return _AURA_ELEMS[self._mask]
 
     def consult_reaction(self, incoming_elem: Element) -> None | ReactionDetail:
-        return Reaction.consult_reaction_with_aura(self, incoming_elem)
+        return _REACTION_TABLE[self._mask][incoming_elem.value][0]
+
+    def react(self, incoming_elem: Element) -> tuple[None | ReactionDetail, ElementalAura]:
+        """
+        Returns the reaction triggered by incoming_elem and the resulting aura.
+
+        If there's a reaction, the reacted aura element is removed, otherwise
+        incoming_elem is added to the aura if it is aurable.
+        """
+        return _REACTION_TABLE[self._mask][incoming_elem.value]
+
+    def fingerprint(self) -> int:
+        """ Stable 64-bit fingerprint, see GameState.fingerprint() """
+        return zobrist_key("ElementalAura", self._mask)
 
     def __iter__(self) -> Iterator[Element]:
-        return (
-            elem
-            for elem, aura in self._aura.items()
-            if aura
-        )
+        return iter(_AURA_ELEMS[self._mask])
 
     def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
         if not isinstance(other, ElementalAura):
             return False
-        return self._aura == other._aura
+        return self._mask == other._mask
 
     def __hash__(self) -> int:
-        return hash(self._aura)
+        return self._hash
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (_aura_of_mask, (self._mask,))
 
     def __str__(self) -> str:
         return '[' + ','.join(map(
             lambda elem: elem.name, self.elem_auras()
         )) + ']'
+
+
+_AURAS: tuple[ElementalAura, ...] = tuple(
+    ElementalAura._new(mask) for mask in range(_NUM_AURA_MASKS)
+)
+
+
+def _aura_of_mask(mask: int) -> ElementalAura:
+    return _AURAS[mask]
+
+
+_AURA_ELEMS: tuple[tuple[Element, ...], ...] = tuple(
+    tuple(elem for elem in AURA_ELEMENTS_ORDERED if mask & _AURA_BITS[elem])
+    for mask in range(_NUM_AURA_MASKS)
+)
+
+
+def _react(mask: int, incoming_elem: Element) -> tuple[None | ReactionDetail, ElementalAura]:
+    for elem in _AURA_ELEMS[mask]:
+        reaction = Reaction.consult_reaction(elem, incoming_elem)
+        if reaction is not None:
+            return ReactionDetail(reaction, elem, incoming_elem), _AURAS[mask & ~_AURA_BITS[elem]]
+    if incoming_elem in AURA_ELEMENTS:
+        return None, _AURAS[mask | _AURA_BITS[incoming_elem]]
+    return None, _AURAS[mask]
+
+
+#: _REACTION_TABLE[aura mask][incoming element value] = (reaction, resulting aura)
+_REACTION_TABLE: tuple[tuple[tuple[None | ReactionDetail, ElementalAura], ...], ...] = tuple(
+    tuple(_react(mask, elem) for elem in Element)
+    for mask in range(_NUM_AURA_MASKS)
+)
@@ -0,0 +1,438 @@
+"""
+This file contains ObservationEncoder, which encodes the game state seen by a
+player into a fixed-length feature vector, for training agents.
+
+The layout of the vector is derived from the type registry of the mode (see
+Mode.type_registry()) and is described by the segments of the encoder. It is
+stamped by ObservationEncoder.version, which changes whenever the layout does.
+
+Features are raw values (HP, counts, usages...) and one-hots, from the
+perspective of the player observing: the segments of that player are prefixed
+by "self." and the ones of the opponent by "oppo.". The hand and deck cards of
+the opponent are only encoded by their number, as in
+GameState.prespective_view().
+
+The NumPy outputs (encode(), encode_batch()) require NumPy, encode_list()
+doesn't.
+
+Usage:
+    encoder = ObservationEncoder(DefaultMode())
+    buffer = encoder.new_buffer(64)
+    with VecEnv(num_envs=64, observe=keep_state) as env:
+        batch = env.reset()
+        encoder.encode_batch(batch.observations, batch.players, out=buffer)
+"""
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable, Sequence, TYPE_CHECKING
+
+from .dices import ActualDices
+from .element import AURA_ELEMENTS_ORDERED, Element
+from .helper.fingerprint import zobrist_key
+from .mode import DefaultMode, Mode
+from .state.enums import Act, Pid
+from .state.game_state import GameState
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None  # type: ignore
+
+if TYPE_CHECKING:
+    import numpy.typing as npt
+
+    from .card.cards import Cards
+    from .state.player_state import PlayerState
+    from .status.statuses import Statuses
+    from .summon.summons import Summons
+    from .support.supports import Supports
+    from .type_registry import TypeIndex
+
+__all__ = [
+    "ObservationEncoder",
+    "Segment",
+    "keep_state",
+]
+
+#: bumped whenever the way the layout is derived from the type registry changes
+_LAYOUT_VERSION = 1
+
+_ELEMS: tuple[Element, ...] = tuple(Element)
+_ACTS: tuple[Act, ...] = tuple(Act)
+
+
+def keep_state(game_state: GameState, pid: Pid) -> GameState:
+    """
+    Observer of VecEnv returning the game state as is, so that observations
+    can be encoded as a batch with ObservationEncoder.encode_batch().
+    """
+    return game_state
+
+
+@dataclass(frozen=True)
+class Segment:
+    """ a named range of features of the observation vector """
+    name: str
+    start: int
+    size: int
+
+    @property
+    def stop(self) -> int:
+        return self.start + self.size
+
+
+class _TypeSlots:
+    """
+    Slots of the types of a TypeIndex, followed by one slot for all the types
+    that are not indexed (e.g. the hidden OmniCard).
+    """
+    __slots__ = ("ids", "size", "unindexed")
+
+    def __init__(self, index: TypeIndex) -> None:
+        self.ids: dict[type, int] = {t: index.id_of(t) for t in index}
+        self.size = len(index) + 1
+        self.unindexed = len(index)
+
+    def slot(self, t: type) -> int:
+        return self.ids.get(t, self.unindexed)
+
+
+@dataclass(frozen=True)
+class _CharSlot:
+    """ starts of the segments of a character """
+    type: int
+    hp: int
+    max_hp: int
+    energy: int
+    max_energy: int
+    alive: int
+    active: int
+    aura: int
+    statuses: int
+    status_usages: int
+
+
+@dataclass(frozen=True)
+class _PlayerSlot:
+    """ starts of the segments of a player """
+    act: int
+    card_redraw_chances: int
+    dice_reroll_chances: int
+    chars: tuple[_CharSlot, ...]
+    hidden_statuses: int
+    hidden_status_usages: int
+    combat_statuses: int
+    combat_status_usages: int
+    summons: int
+    summon_usages: int
+    supports: int
+    support_usages: int
+    dices: int
+    hand_cards: int
+    deck_cards: int
+    publicly_used_cards: int
+    publicly_gained_cards: int
+
+
+class ObservationEncoder:
+    """
+    Encodes what a player sees of a game state into a vector of
+    ObservationEncoder.size features.
+
+    It can be used as the observe function of VecEnv, which then gets one NumPy
+    array per environment; to encode all the environments at once, use
+    keep_state() as the observe function and encode_batch().
+    """
+
+    def __init__(self, mode: Mode = DefaultMode()) -> None:
+        self._mode = mode
+        registry = mode.type_registry()
+        self._cards = _TypeSlots(registry.cards)
+        self._chars = _TypeSlots(registry.characters)
+        self._statuses = _TypeSlots(registry.statuses)
+        self._summons = _TypeSlots(registry.summons)
+        self._supports = _TypeSlots(registry.supports)
+        self._phases: dict[type, int] = {
+            phase: i
+            for i, phase in enumerate((
+                mode.card_select_phase,
+                mode.starting_hand_select_phase,
+                mode.roll_phase,
+                mode.action_phase,
+                mode.end_phase,
+                mode.game_end_phase,
+            ))
+        }
+        self._num_chars = mode.deck_chars_requirement()
+
+        segments: list[Segment] = []
+
+        def add(name: str, size: int = 1) -> int:
+            start = segments[-1].stop if segments else 0
+            segments.append(Segment(name, start, size))
+            return start
+
+        self._round = add("round")
+        self._phase = add("phase", len(self._phases))
+        self._self_active = add("self_active")
+        self._players: tuple[_PlayerSlot, _PlayerSlot] = (
+            self._add_player("self", add),
+            self._add_player("oppo", add),
+        )
+        self.segments: tuple[Segment, ...] = tuple(segments)
+        self.size: int = segments[-1].stop
+        #: stable 64-bit stamp of the layout
+        self.version: int = zobrist_key(
+            "ObservationEncoder", _LAYOUT_VERSION, registry.version, *(
+                part
+                for segment in self.segments
+                for part in (segment.name, segment.size)
+            )
+        )
+
+    def _add_player(self, prefix: str, add: Callable[..., int]) -> _PlayerSlot:
+        # the segments are added in the order of the keyword arguments
+        act = add(f"{prefix}.act", len(_ACTS))
+        card_redraw_chances = add(f"{prefix}.card_redraw_chances")
+        dice_reroll_chances = add(f"{prefix}.dice_reroll_chances")
+        chars = tuple(
+            self._add_char(f"{prefix}.char{i}", add)
+            for i in range(self._num_chars)
+        )
+        return _PlayerSlot(
+            act=act,
+            card_redraw_chances=card_redraw_chances,
+            dice_reroll_chances=dice_reroll_chances,
+            chars=chars,
+            hidden_statuses=add(f"{prefix}.hidden_statuses", self._statuses.size),
+            hidden_status_usages=add(f"{prefix}.hidden_status_usages", self._statuses.size),
+            combat_statuses=add(f"{prefix}.combat_statuses", self._statuses.size),
+            combat_status_usages=add(f"{prefix}.combat_status_usages", self._statuses.size),
+            summons=add(f"{prefix}.summons", self._summons.size),
+            summon_usages=add(f"{prefix}.summon_usages", self._summons.size),
+            supports=add(f"{prefix}.supports", self._supports.size),
+            support_usages=add(f"{prefix}.support_usages", self._supports.size),
+            dices=add(f"{prefix}.dices", len(_ELEMS)),
+            hand_cards=add(f"{prefix}.hand_cards", self._cards.size),
+            deck_cards=add(f"{prefix}.deck_cards", self._cards.size),
+            publicly_used_cards=add(f"{prefix}.publicly_used_cards", self._cards.size),
+            publicly_gained_cards=add(f"{prefix}.publicly_gained_cards", self._cards.size),
+        )
+
+    def _add_char(self, prefix: str, add: Callable[..., int]) -> _CharSlot:
+        return _CharSlot(
+            type=add(f"{prefix}.type", self._chars.size),
+            hp=add(f"{prefix}.hp"),
+            max_hp=add(f"{prefix}.max_hp"),
+            energy=add(f"{prefix}.energy"),
+            max_energy=add(f"{prefix}.max_energy"),
+            alive=add(f"{prefix}.alive"),
+            active=add(f"{prefix}.active"),
+            aura=add(f"{prefix}.aura", len(AURA_ELEMENTS_ORDERED)),
+            # hidden, equipment and character statuses
+            statuses=add(f"{prefix}.statuses", self._statuses.size),
+            status_usages=add(f"{prefix}.status_usages", self._statuses.size),
+        )
+
+    def segment(self, name: str) -> Segment:
+        """ raises KeyError if there's no segment of name """
+        for segment in self.segments:
+            if segment.name == name:
+                return segment
+        raise KeyError(name)
+
+    def entries(self, game_state: GameState, pid: None | Pid = None) -> tuple[list[int], list[float]]:
+        """
+        Returns the indices and values of the non-zero features of game_state
+        observed by pid (the player to act by default).
+        """
+        if pid is None:
+            pid = game_state.waiting_for()
+            assert pid is not None
+        indices: list[int] = []
+        values: list[float] = []
+        index = indices.append
+        value = values.append
+        index(self._round)
+        value(game_state.get_round())
+        index(self._phase + self._phases[type(game_state.get_phase())])
+        value(1)
+        if game_state.get_active_player_id() is pid:
+            index(self._self_active)
+            value(1)
+        self._player_entries(self._players[0], game_state.get_player(pid), False, index, value)
+        self._player_entries(self._players[1], game_state.get_other_player(pid), True, index, value)
+        return indices, values
+
+    def _player_entries(
+            self,
+            slot: _PlayerSlot,
+            player: PlayerState,
+            hidden: bool,
+            index: Any,
+            value: Any,
+    ) -> None:
+        index(slot.act + _ACTS.index(player.get_phase()))
+        value(1)
+        index(slot.card_redraw_chances)
+        value(player.get_card_redraw_chances())
+        index(slot.dice_reroll_chances)
+        value(player.get_dice_reroll_chances())
+        characters = player.get_characters()
+        active_id = characters.get_active_character_id()
+        for char_slot, char in zip(slot.chars, characters.get_characters()):
+            index(char_slot.type + self._chars.slot(type(char)))
+            value(1)
+            index(char_slot.hp)
+            value(char.get_hp())
+            index(char_slot.max_hp)
+            value(char.get_max_hp())
+            index(char_slot.energy)
+            value(char.get_energy())
+            index(char_slot.max_energy)
+            value(char.get_max_energy())
+            if char.get_alive():
+                index(char_slot.alive)
+                value(1)
+            if char.get_id() == active_id:
+                index(char_slot.active)
+                value(1)
+            aura = char.get_elemental_aura()
+            for i, elem in enumerate(AURA_ELEMENTS_ORDERED):
+                if elem in aura:
+                    index(char_slot.aura + i)
+                    value(1)
+            for statuses in char.get_all_statuses_ordered():
+                self._status_entries(
+                    statuses, self._statuses, char_slot.statuses, char_slot.status_usages,
+                    index, value,
+                )
+        self._status_entries(
+            player.get_hidden_statuses(), self._statuses,
+            slot.hidden_statuses, slot.hidden_status_usages, index, value,
+        )
+        self._status_entries(
+            player.get_combat_statuses(), self._statuses,
+            slot.combat_statuses, slot.combat_status_usages, index, value,
+        )
+        self._status_entries(
+            player.get_summons(), self._summons,
+            slot.summons, slot.summon_usages, index, value,
+        )
+        self._status_entries(
+            player.get_supports(), self._supports,
+            slot.supports, slot.support_usages, index, value,
+        )
+        self._dices_entries(player.get_dices(), slot.dices, index, value)
+        self._cards_entries(player.get_hand_cards(), hidden, slot.hand_cards, index, value)
+        self._cards_entries(player.get_deck_cards(), hidden, slot.deck_cards, index, value)
+        self._cards_entries(
+            player.get_publicly_used_cards(), False, slot.publicly_used_cards, index, value,
+        )
+        self._cards_entries(
+            player.get_publicly_gained_cards(), False, slot.publicly_gained_cards, index, value,
+        )
+
+    @staticmethod
+    def _status_entries(
+            statuses: Statuses | Summons | Supports,
+            slots: _TypeSlots,
+            start: int,
+            usages_start: int,
+            index: Any,
+            value: Any,
+    ) -> None:
+        """ the number of each type of status and the sum of their usages """
+        for status in statuses:
+            slot = slots.slot(type(status))
+            index(start + slot)
+            value(1)
+            usages = getattr(status, "usages", None)
+            if usages:
+                index(usages_start + slot)
+                value(usages)
+
+    @staticmethod
+    def _dices_entries(dices: ActualDices, start: int, index: Any, value: Any) -> None:
+        for elem in dices:
+            index(start + elem.value)
+            value(dices[elem])
+
+    def _cards_entries(
+            self,
+            cards: Cards,
+            hidden: bool,
+            start: int,
+            index: Any,
+            value: Any,
+    ) -> None:
+        if hidden:
+            if cards.not_empty():
+                index(start + self._cards.unindexed)
+                value(cards.num_cards())
+            return
+        for card in cards:
+            index(start + self._cards.slot(card))
+            value(cards[card])
+
+    def encode_list(self, game_state: GameState, pid: None | Pid = None) -> list[float]:
+        """ the features of game_state observed by pid as a list """
+        features = [0.0] * self.size
+        indices, values = self.entries(game_state, pid)
+        for i, v in zip(indices, values):
+            features[i] += v
+        return features
+
+    def new_buffer(self, num: int) -> npt.NDArray[Any]:
+        """ returns a zeroed float32 array of shape (num, size) """
+        return _numpy().zeros((num, self.size), dtype=np.float32)
+
+    def encode(self, game_state: GameState, pid: None | Pid = None) -> npt.NDArray[Any]:
+        """ the features of game_state observed by pid as a float32 array """
+        return self.encode_batch((game_state,), (pid,))[0]
+
+    def encode_batch(
+            self,
+            game_states: Sequence[GameState],
+            pids: None | Iterable[None | Pid] = None,
+            out: None | npt.NDArray[Any] = None,
+    ) -> npt.NDArray[Any]:
+        """
+        Encodes game_states observed by pids (the players to act by default)
+        into the rows of out, which is allocated if not provided (see
+        new_buffer()), and returns out.
+        """
+        np = _numpy()
+        buffer: npt.NDArray[Any]
+        if out is None:
+            buffer = self.new_buffer(len(game_states))
+        else:
+            assert out.shape[0] >= len(game_states) and out.shape[1] == self.size
+            buffer = out
+            buffer[:len(game_states)] = 0
+        if pids is None:
+            pids = (None for _ in game_states)
+        rows: list[int] = []
+        indices: list[int] = []
+        values: list[float] = []
+        for row, (game_state, pid) in enumerate(zip(game_states, pids)):
+            row_indices, row_values = self.entries(game_state, pid)
+            rows.extend(row for _ in row_indices)
+            indices += row_indices
+            values += row_values
+        # indices are distinct within a row, except for statuses of the same
+        # type which are accumulated
+        np.add.at(buffer, (np.asarray(rows), np.asarray(indices)), np.asarray(values))
+        return buffer
+
+    def __call__(self, game_state: GameState, pid: Pid) -> npt.NDArray[Any]:
+        return self.encode(game_state, pid)
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (ObservationEncoder, (self._mode,))
+
+
+def _numpy() -> Any:
+    if np is None:  # pragma: no cover
+        raise ImportError("ObservationEncoder requires NumPy for array outputs, try encode_list()")
+    return np
@@ -0,0 +1,370 @@
+"""
+This file contains VecEnv, a Gym-style vectorized environment stepping many
+independent games in lockstep, for training agents.
+
+Each environment is at a decision point of its game. An environment step is a
+single decision of the player to act, and the game is then advanced to the
+next decision. Finished games are reset automatically.
+
+Observations are produced by an observe function from the game state and the
+player to act, by default the perspective view of that player (see
+GameState.prespective_view()).
+
+Actions are indices into the legal actions of each environment, or with
+flat_actions=True, indices into the flat action space of the mode (see
+Mode.action_space()) with the legal ones given by the masks.
+
+Usage:
+    with VecEnv(num_envs=64) as env:
+        batch = env.reset(seeds=range(64))
+        while training:
+            actions = [policy(obs, mask) for obs, mask in zip(batch.observations, batch.masks)]
+            batch = env.step(actions)
+"""
+from __future__ import annotations
+import multiprocessing as mp
+from dataclasses import dataclass
+from multiprocessing.connection import Connection
+from typing import Any, Callable, Sequence, TYPE_CHECKING
+
+from .action.action import PlayerAction
+from .helper.quality_of_life import just
+from .helper.rng import Rng
+from .mode import DefaultMode, Mode
+from .state.enums import Pid
+from .state.game_state import GameState
+
+if TYPE_CHECKING:
+    from .deck import Deck
+
+__all__ = [
+    "Observer",
+    "VecEnv",
+    "VecStep",
+    "perspective_view",
+]
+
+#: builds the observation of the player to act; must be picklable (defined at
+#: module level) for the subprocess mode
+Observer = Callable[[GameState, Pid], Any]
+
+_REWARDS: dict[None | Pid, tuple[float, float]] = {
+    None: (0.0, 0.0),
+    Pid.P1: (1.0, -1.0),
+    Pid.P2: (-1.0, 1.0),
+}
+
+
+def perspective_view(game_state: GameState, pid: Pid) -> GameState:
+    """ the default observation: the game state with the opponent's cards hidden """
+    return game_state.prespective_view(pid)
+
+
+@dataclass(frozen=True)
+class VecStep:
+    """ one entry per environment in each field """
+    observations: list[Any]
+    #: the player to act
+    players: list[Pid]
+    #: the legal actions of the player to act, step() takes indices into these
+    #: unless the actions are flat
+    legal_actions: list[tuple[PlayerAction, ...]]
+    #: rewards of (P1, P2): +1 for the winner and -1 for the loser of the game
+    #: that has just ended, 0 otherwise
+    rewards: list[tuple[float, float]]
+    #: True if the game ended on this step, the environment is then already
+    #: reset and the other fields describe the new game
+    dones: list[bool]
+    #: winner of the game that has just ended, None on draws or if not done
+    winners: list[None | Pid]
+    #: the legal action masks over the flat action space if the actions are flat
+    action_masks: None | list[Any] = None
+
+    @property
+    def masks(self) -> list[Any]:
+        """
+        the action masks if the actions are flat, otherwise masks over the
+        legal actions, all True
+        """
+        if self.action_masks is not None:
+            return self.action_masks
+        return [[True] * len(actions) for actions in self.legal_actions]
+
+
+@dataclass(frozen=True)
+class _EnvStep:
+    observation: Any
+    player: Pid
+    legal_actions: tuple[PlayerAction, ...]
+    reward: tuple[float, float] = _REWARDS[None]
+    done: bool = False
+    winner: None | Pid = None
+    action_mask: Any = None
+
+
+class _Env:
+    """ a single environment """
+
+    def __init__(
+            self,
+            mode: Mode,
+            decks: None | tuple[Deck, Deck],
+            observe: Observer,
+            flat_actions: bool,
+    ) -> None:
+        self._mode = mode
+        self._decks = decks
+        self._observe = observe
+        self._flat_actions = flat_actions
+        self._seed_rng = Rng.from_seed()
+        self._episode = 0
+        self._game_state: GameState
+
+    def reset(self, seed: None | int) -> _EnvStep:
+        self._seed_rng = Rng.from_seed(seed)
+        self._episode = 0
+        return self._new_game()
+
+    def _new_game(self) -> _EnvStep:
+        seed = self._seed_rng.split("episode", self._episode).value()
+        self._episode += 1
+        if self._decks is None:
+            game_state = GameState.from_default(seed=seed)
+        else:
+            game_state = GameState.from_decks(self._mode, *self._decks, seed=seed)
+        self._game_state = game_state.advance_to_decision()
+        return self._env_step()
+
+    def _env_step(self) -> _EnvStep:
+        pid = self._game_state.waiting_for()
+        assert pid is not None
+        return _EnvStep(
+            observation=self._observe(self._game_state, pid),
+            player=pid,
+            legal_actions=self._game_state.legal_actions(pid),
+            action_mask=self._game_state.legal_action_mask(pid) if self._flat_actions else None,
+        )
+
+    def resolve(self, action: int | PlayerAction) -> GameState:
+        """
+        Returns the game state right after action, without stepping this
+        environment. Raises ValueError if action is not legal, exceptions
+        raised by the game are not caught.
+        """
+        game_state = self._game_state
+        pid = game_state.waiting_for()
+        assert pid is not None
+        if isinstance(action, PlayerAction):
+            if action in game_state.legal_actions(pid):
+                return just(game_state.action_step(pid, action, trusted=True))
+            # e.g. a legal action paid with other dices than the canonical payment
+            new_game_state = game_state.action_step(pid, action)
+            if new_game_state is None:
+                raise ValueError(f"{action} is not legal for {pid}")
+            return new_game_state
+        index = int(action)
+        if self._flat_actions:
+            player_action = self._mode.action_space().decode(index, game_state, pid)
+        else:
+            legal_actions = game_state.legal_actions(pid)
+            if not 0 <= index < len(legal_actions):
+                raise ValueError(
+                    f"action index {index} is out of the {len(legal_actions)} legal actions of {pid}"
+                )
+            player_action = legal_actions[index]
+        return just(game_state.action_step(pid, player_action, trusted=True))
+
+    def step(self, new_game_state: GameState) -> _EnvStep:
+        """ steps this environment to new_game_state given by resolve() """
+        self._game_state = new_game_state.advance_to_decision()
+        if not self._game_state.game_end():
+            return self._env_step()
+        winner = self._game_state.get_winner()
+        env_step = self._new_game()
+        return _EnvStep(
+            observation=env_step.observation,
+            player=env_step.player,
+            legal_actions=env_step.legal_actions,
+            reward=_REWARDS[winner],
+            done=True,
+            winner=winner,
+            action_mask=env_step.action_mask,
+        )
+
+
+def _vec_step(env_steps: Sequence[_EnvStep]) -> VecStep:
+    return VecStep(
+        observations=[env_step.observation for env_step in env_steps],
+        players=[env_step.player for env_step in env_steps],
+        legal_actions=[env_step.legal_actions for env_step in env_steps],
+        rewards=[env_step.reward for env_step in env_steps],
+        dones=[env_step.done for env_step in env_steps],
+        winners=[env_step.winner for env_step in env_steps],
+        action_masks=(
+            [env_step.action_mask for env_step in env_steps]
+            if env_steps and env_steps[0].action_mask is not None
+            else None
+        ),
+    )
+
+
+def _worker(
+        conn: Connection,
+        num_envs: int,
+        mode: Mode,
+        decks: None | tuple[Deck, Deck],
+        observe: Observer,
+        flat_actions: bool,
+) -> None:
+    """
+    runs a group of environments for the parent process, exceptions are sent
+    back as the result for the parent to raise
+
+    A step takes two commands: "check" resolves the actions (see _Env.resolve())
+    and keeps the resulting game states, then "step" steps the environments to
+    them, so the parent can make sure every action is legal in every worker
+    before any environment is stepped.
+    """
+    envs = [_Env(mode, decks, observe, flat_actions) for _ in range(num_envs)]
+    resolved: list[GameState] = []
+    while True:
+        command, args = conn.recv()
+        if command == "close":
+            conn.close()
+            return
+        try:
+            if command == "reset":
+                conn.send([env.reset(seed) for env, seed in zip(envs, args)])
+            elif command == "check":
+                resolved = [env.resolve(action) for env, action in zip(envs, args)]
+                conn.send(None)
+            elif command == "step":
+                assert len(resolved) == len(envs)
+                game_states, resolved = resolved, []
+                conn.send([env.step(game_state) for env, game_state in zip(envs, game_states)])
+        except Exception as e:
+            conn.send(e)
+
+
+class VecEnv:
+    """
+    Steps num_envs independent games in lockstep.
+
+    With workers=0 the games are stepped in the current process, otherwise the
+    environments are split evenly over workers subprocesses which step their
+    groups in parallel.
+
+    With flat_actions=True, actions are indices into the flat action space of
+    the mode, and the masks of the steps are its NumPy legal action masks.
+    """
+
+    def __init__(
+            self,
+            num_envs: int,
+            decks: None | tuple[Deck, Deck] = None,
+            mode: Mode = DefaultMode(),
+            observe: Observer = perspective_view,
+            workers: int = 0,
+            flat_actions: bool = False,
+    ) -> None:
+        if decks is not None:
+            decks = (decks[0].to_frozen(), decks[1].to_frozen())
+        self._num_envs = num_envs
+        self._envs: list[_Env] = []
+        # sizes of the groups of environments of the workers
+        self._group_sizes: list[int] = []
+        self._conns: list[Connection] = []
+        self._processes: list[mp.process.BaseProcess] = []
+        if workers == 0:
+            self._envs = [_Env(mode, decks, observe, flat_actions) for _ in range(num_envs)]
+            return
+        workers = min(workers, num_envs)
+        self._group_sizes = [
+            num_envs // workers + (1 if i < num_envs % workers else 0)
+            for i in range(workers)
+        ]
+        for group_size in self._group_sizes:
+            conn, child_conn = mp.Pipe()
+            process = mp.Process(
+                target=_worker,
+                args=(child_conn, group_size, mode, decks, observe, flat_actions),
+                daemon=True,
+            )
+            process.start()
+            child_conn.close()
+            self._conns.append(conn)
+            self._processes.append(process)
+
+    def num_envs(self) -> int:
+        return self._num_envs
+
+    def _run(self, command: str, args: Sequence[Any]) -> VecStep:
+        assert len(args) == self._num_envs
+        if self._envs:
+            if command == "reset":
+                return _vec_step([env.reset(seed) for env, seed in zip(self._envs, args)])
+            # every action is resolved before any environment is stepped
+            game_states = [env.resolve(action) for env, action in zip(self._envs, args)]
+            return _vec_step([
+                env.step(game_state) for env, game_state in zip(self._envs, game_states)
+            ])
+        if command == "step":
+            self._send_all("check", args)
+        return _vec_step(self._send_all(command, args))
+
+    def _send_all(self, command: str, args: Sequence[Any]) -> list[_EnvStep]:
+        """
+        sends each worker the args of its group, and raises the first exception
+        once every worker has replied, so no reply is left for the next command
+        """
+        start = 0
+        for conn, group_size in zip(self._conns, self._group_sizes):
+            conn.send((command, list(args[start:start + group_size])))
+            start += group_size
+        results = [conn.recv() for conn in self._conns]
+        for result in results:
+            if isinstance(result, Exception):
+                raise result
+        env_steps: list[_EnvStep] = []
+        for result in results:
+            if result is not None:
+                env_steps += result
+        return env_steps
+
+    def reset(self, seeds: None | Sequence[None | int] = None) -> VecStep:
+        """
+        Starts a new game in every environment, the games of an environment
+        (including the auto-reset ones) are all derived from its seed.
+        Unseeded environments are seeded from the global random module.
+        """
+        if seeds is None:
+            seeds = [None] * self._num_envs
+        return self._run("reset", list(seeds))
+
+    def step(self, actions: Sequence[int | PlayerAction]) -> VecStep:
+        """
+        Takes one action per environment for its player to act, either an index
+        into the legal actions returned by the last reset() or step() (into the
+        flat action space if the actions are flat), or a PlayerAction (which is
+        then validated).
+
+        Raises ValueError if an index is not legal or the game rejects a
+        PlayerAction (the game may also raise its own exception for actions it
+        doesn't expect), no environment is stepped then.
+        """
+        return self._run("step", actions)
+
+    def close(self) -> None:
+        for conn in self._conns:
+            conn.send(("close", None))
+            conn.close()
+        for process in self._processes:
+            process.join()
+        self._conns = []
+        self._processes = []
+
+    def __enter__(self) -> VecEnv:
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self.close()
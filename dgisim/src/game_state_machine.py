@@ -15,9 +15,10 @@ __all__ = [
 class GameStateMachine:
     def __init__(self, game_state: GameState, agent1: PlayerAgent, agent2: PlayerAgent):
         self._history = [game_state]
+        # perspective views of the history, filled on demand by get_perspective_history()
         self._perspective_history: dict[Pid, list[GameState]] = {
-            Pid.P1: [game_state.prespective_view(Pid.P1)],
-            Pid.P2: [game_state.prespective_view(Pid.P2)],
+            Pid.P1: [],
+            Pid.P2: [],
         }
         self._action_history: list[int] = []
         self._actions: dict[int, PlayerAction] = {}
@@ -32,6 +33,31 @@ class GameStateMachine:
     def get_history(self) -> tuple[GameState, ...]:
         return tuple(self._history)
 
+    def get_perspective_history(self, pid: Pid) -> list[GameState]:
+        """
+        Returns the history viewed from the perspective of player pid.
+
+        Views are only computed when asked for and then kept. If the opponent's
+        player state is unchanged from the previous game state, the hidden
+        opponent of the previous view is reused.
+        """
+        views = self._perspective_history[pid]
+        for i in range(len(views), len(self._history)):
+            game_state = self._history[i]
+            prev_state = self._history[i - 1] if i > 0 else None
+            if prev_state is game_state:
+                view = views[-1]
+            elif prev_state is not None \
+                    and game_state.get_other_player(pid) is prev_state.get_other_player(pid):
+                view = game_state.factory().other_player(
+                    pid,
+                    views[-1].get_other_player(pid),
+                ).build()
+            else:
+                view = game_state.prespective_view(pid)
+            views.append(view)
+        return views
+
     def get_action_history(self) -> tuple[GameState, ...]:
         return tuple([self._history[i] for i in self._action_history])
 
@@ -91,8 +117,6 @@ class GameStateMachine:
 
     def _append_history(self, game_state: GameState) -> None:
         self._history.append(self._game_state)
-        self._perspective_history[Pid.P1].append(self._game_state.prespective_view(Pid.P1))
-        self._perspective_history[Pid.P2].append(self._game_state.prespective_view(Pid.P2))
 
     def _step(self, observe=False) -> None:
         self._game_state = self._game_state.step()
@@ -147,7 +171,7 @@ class GameStateMachine:
             while patience > 0 \
                     and not self._action_step(
                         pid,
-                        self.player_agent(pid).choose_action(self._perspective_history[pid], pid),
+                        self.player_agent(pid).choose_action(self.get_perspective_history(pid), pid),
                         observe=observe,
                     ):
                 patience -= 1
@@ -1,3 +1,4 @@
+from .fingerprint import *
 from .hashable_dict import *
 from .level_print import *
 from .quality_of_life import *
\ No newline at end of file
@@ -0,0 +1,129 @@
+"""
+Stable 64-bit fingerprints of game objects.
+
+Unlike the builtin hash(), which is salted per process for strings, the
+fingerprints here only depend on the content of the object, so they can be
+shared across processes (e.g. as keys of a shared transposition table).
+
+Composite nodes of the game state (GameState, PlayerState...) fingerprint
+themselves Zobrist-style: the fingerprint is the XOR of one term per field,
+so a new node built from an old one only needs to XOR out the terms of the
+changed fields and XOR in the new ones. (see inherit_fingerprint())
+"""
+from __future__ import annotations
+from dataclasses import fields, is_dataclass
+from enum import Enum
+from functools import lru_cache
+from hashlib import blake2b
+from typing import Any, Iterable
+
+__all__ = [
+    "combine_fingerprints",
+    "field_term",
+    "fingerprint_of",
+    "inherit_fingerprint",
+    "mix64",
+    "zobrist_key",
+]
+
+_MASK64 = (1 << 64) - 1
+
+
+def mix64(x: int) -> int:
+    """ splitmix64 finalizer, scrambles the bits of a 64-bit integer """
+    x &= _MASK64
+    x = ((x ^ (x >> 30)) * 0xbf58476d1ce4e5b9) & _MASK64
+    x = ((x ^ (x >> 27)) * 0x94d049bb133111eb) & _MASK64
+    return x ^ (x >> 31)
+
+
+@lru_cache(maxsize=None)
+def zobrist_key(*parts: str | int) -> int:
+    """ Returns the stable pseudo-random 64-bit key of the parts. """
+    digest = blake2b(repr(parts).encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "little")
+
+
+def combine_fingerprints(seed: int, items: Iterable[int]) -> int:
+    """ Order-dependent combination of fingerprints. """
+    fp = seed
+    for item in items:
+        fp = mix64(fp + 0x9e3779b97f4a7c15 + item)
+    return fp
+
+
+def _unordered(pairs: Iterable[tuple[Any, Any]]) -> int:
+    fp = 0
+    for key, val in pairs:
+        fp ^= mix64(fingerprint_of(key) ^ mix64(fingerprint_of(val) + 1))
+    return fp
+
+
+def fingerprint_of(obj: Any) -> int:
+    """
+    Returns the stable fingerprint of obj.
+
+    Objects defining fingerprint() are asked directly; dataclasses (statuses,
+    summons, effects...) are fingerprinted by type and compared fields; other
+    unknown objects (phases, modes) are fingerprinted by their type only, which
+    matches how they define equality.
+    """
+    fingerprint = getattr(obj, "fingerprint", None)
+    if fingerprint is not None and not isinstance(obj, type):
+        return fingerprint()
+    if obj is None:
+        return zobrist_key("None")
+    if isinstance(obj, bool):
+        return zobrist_key("bool", int(obj))
+    if isinstance(obj, int):
+        return mix64(obj ^ 0x5851f42d4c957f2d)
+    if isinstance(obj, str):
+        return zobrist_key("str", obj)
+    if isinstance(obj, Enum):
+        return zobrist_key(type(obj).__name__, obj.name)
+    if isinstance(obj, type):
+        return zobrist_key("type", obj.__qualname__)
+    if isinstance(obj, (tuple, list)):
+        return combine_fingerprints(zobrist_key("tuple"), (fingerprint_of(item) for item in obj))
+    if isinstance(obj, (frozenset, set)):
+        return _unordered((item, None) for item in obj)
+    if isinstance(obj, dict):
+        return _unordered(obj.items())
+    if is_dataclass(obj):
+        return combine_fingerprints(
+            zobrist_key("type", type(obj).__qualname__),
+            (
+                fingerprint_of(getattr(obj, field.name))
+                for field in fields(obj)
+                if field.compare
+            ),
+        )
+    return zobrist_key("type", type(obj).__qualname__)
+
+
+def field_term(owner: str, field: str, value: Any) -> int:
+    """ The Zobrist term contributed by owner.field being value. """
+    return mix64(zobrist_key(owner, field) ^ fingerprint_of(value))
+
+
+def inherit_fingerprint(
+        old: Any,
+        new: Any,
+        owner: str,
+        field_names: Iterable[str],
+) -> None:
+    """
+    If old already has its fingerprint computed, sets new's fingerprint by
+    XORing out the terms of the fields that changed and XORing in the new ones.
+
+    Fields are considered unchanged if they hold the same object.
+    """
+    fp = old._fingerprint
+    if fp is None:
+        return
+    for field in field_names:
+        old_val = getattr(old, field)
+        new_val = getattr(new, field)
+        if old_val is not new_val:
+            fp ^= field_term(owner, field, old_val) ^ field_term(owner, field, new_val)
+    new._fingerprint = fp
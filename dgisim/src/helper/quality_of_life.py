@@ -2,13 +2,16 @@ from __future__ import annotations
 from dataclasses import fields
 from enum import Enum
 from inspect import isclass
-from typing import Any, TypeVar
+from itertools import product
+from math import comb, prod
+from typing import Any, Iterable, Iterator, TypeVar
 
 __all__ = [
     "BIG_INT",
     "case_val",
     "dataclass_repr",
     "just",
+    "weighted_sub_multisets",
 ]
 
 _T = TypeVar('_T')
@@ -48,3 +51,19 @@ def just(optional_val: None | _T, backup: None | _T = None) -> _T:
         else:
             return backup
     return optional_val
+
+
+def weighted_sub_multisets(
+        multiset: Iterable[tuple[_T, int]]
+) -> Iterator[tuple[dict[_T, int], int]]:
+    """
+    Yields all the sub-multisets of multiset, each with the number of ways to
+    pick it when the copies of an item are told apart.
+    """
+    pairs = tuple(multiset)
+    items, nums = zip(*pairs) if pairs else ((), ())
+    for picks in product(*(range(num + 1) for num in nums)):
+        yield (
+            dict(zip(items, picks)),
+            prod(comb(num, pick) for num, pick in zip(nums, picks)),
+        )
@@ -0,0 +1,84 @@
+"""
+Immutable, splittable random number stream carried by the game state.
+
+Rng is a counter-based SplitMix64 stream: the n-th value of a stream only
+depends on its seed and n, so an Rng can be shared by any number of game
+states (e.g. branches of a search tree) and every branch replays the same
+values.
+
+A step of the game that needs randomness takes a random.Random from the Rng of
+the game state with rng.random(), uses it for all the draws of the step, and
+puts rng.next() into the game state it returns.
+"""
+from __future__ import annotations
+import random
+from typing import Any
+
+from .fingerprint import mix64, zobrist_key
+
+__all__ = [
+    "Rng",
+    "random_or_global",
+]
+
+_MASK64 = (1 << 64) - 1
+_GAMMA = 0x9e3779b97f4a7c15
+
+
+def random_or_global(rand: None | random.Random) -> random.Random:
+    """
+    Returns rand, or the instance behind the functions of the global random
+    module if rand is None (so draws are the same as calling those functions).
+    """
+    return random._inst if rand is None else rand
+
+
+class Rng:
+    __slots__ = ("_seed", "_counter")
+
+    def __init__(self, seed: int, counter: int = 0) -> None:
+        self._seed = seed & _MASK64
+        self._counter = counter
+
+    @classmethod
+    def from_seed(cls, seed: None | int = None) -> Rng:
+        """ if seed is None, the seed is drawn from the global random module """
+        if seed is None:
+            seed = random.getrandbits(64)
+        return cls(mix64(seed))
+
+    def value(self) -> int:
+        """ the 64-bit value at the current position of the stream """
+        return mix64(self._seed + (self._counter + 1) * _GAMMA)
+
+    def next(self) -> Rng:
+        """ the stream advanced by one position """
+        return Rng(self._seed, self._counter + 1)
+
+    def random(self) -> random.Random:
+        """
+        Returns a random.Random seeded by the current value of the stream.
+        Calling it twice on the same Rng gives the same sequence of draws.
+        """
+        return random.Random(self.value())
+
+    def split(self, *keys: str | int) -> Rng:
+        """
+        Returns an independent stream derived from the current position and keys,
+        e.g. one stream per worker with rng.split(worker_id).
+        """
+        return Rng(mix64(self.value() ^ zobrist_key("split", *keys)))
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Rng):
+            return False
+        return self._seed == other._seed and self._counter == other._counter
+
+    def __hash__(self) -> int:
+        return hash((self._seed, self._counter))
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (Rng, (self._seed, self._counter))
+
+    def __repr__(self) -> str:
+        return f"Rng({self._seed:#018x}, {self._counter})"
@@ -10,11 +10,13 @@ from .event import *
 from .helper.level_print import level_print_single
 
 if TYPE_CHECKING:
+    from .action.action_space import ActionSpace
     from .card.card import Card
     from .character.character import Character
     from .deck import Deck
     from .phase.phase import Phase
     from .status.statuses import Statuses
+    from .type_registry import TypeRegistry
 
 __all__ = [
     "Mode",
@@ -111,6 +113,16 @@ class Mode(ABC):
         from .status.status import PlungeAttackStatus, DeathThisRoundStatus
         return Statuses((PlungeAttackStatus(), DeathThisRoundStatus()))
 
+    def type_registry(self) -> TypeRegistry:
+        """ dense integer ids of all the types of cards, characters... of this mode """
+        from .type_registry import TypeRegistry
+        return TypeRegistry.of_mode(self)
+
+    def action_space(self) -> ActionSpace:
+        """ the fixed flat indexing of the actions of this mode """
+        from .action.action_space import ActionSpace
+        return ActionSpace.of_mode(self)
+
     @abstractmethod
     def all_cards(self) -> frozenset[type[Card]]:
         pass
@@ -189,13 +189,17 @@ class ActionPhase(ph.Phase):
             self,
             game_state: GameState,
             pid: Pid,
-            action: SkillAction
+            action: SkillAction,
+            trusted: bool = False,
     ) -> Optional[GameState]:
         # Check action validity
-        result = game_state.skill_checker().valid_action(pid, action)
-        if result is None:
-            raise Exception(f"{action} from {pid} is invalid for gamestate:\n{game_state}")
-        game_state = result
+        if trusted:
+            game_state = game_state.skill_checker().preprocessed_action(pid, action)
+        else:
+            result = game_state.skill_checker().valid_action(pid, action)
+            if result is None:
+                raise Exception(f"{action} from {pid} is invalid for gamestate:\n{game_state}")
+            game_state = result
 
         player = game_state.get_player(pid)
         instruction = action.instruction
@@ -220,8 +224,8 @@ class ActionPhase(ph.Phase):
             TriggeringSignal.COMBAT_ACTION,
         ))
         new_effects.append(TurnEndEffect())
-        # Afterwards
-        return game_state.factory().f_effect_stack(
+        # Afterwards (the skill may have drawn from the random stream)
+        return game_state.factory().rng(game_state.get_rng().next()).f_effect_stack(
             lambda es: es.push_many_fl(new_effects)
         ).player(
             pid,
@@ -232,13 +236,17 @@ class ActionPhase(ph.Phase):
             self,
             game_state: GameState,
             pid: Pid,
-            action: SwapAction
+            action: SwapAction,
+            trusted: bool = False,
     ) -> Optional[GameState]:
         # Check action validity
-        result = game_state.swap_checker().valid_action(pid, action)
-        if result is None:
-            raise Exception(f"{action} from {pid} is invalid for gamestate:\n{game_state}")
-        game_state, action_speed = result
+        if trusted:
+            game_state, action_speed = game_state.swap_checker().preprocessed_action(pid, action)
+        else:
+            result = game_state.swap_checker().valid_action(pid, action)
+            if result is None:
+                raise Exception(f"{action} from {pid} is invalid for gamestate:\n{game_state}")
+            game_state, action_speed = result
 
         player = game_state.get_player(pid)
         new_effects: list[Effect] = []
@@ -268,17 +276,21 @@ class ActionPhase(ph.Phase):
             self,
             game_state: GameState,
             pid: Pid,
-            action: CardAction
+            action: CardAction,
+            trusted: bool = False,
     ) -> Optional[GameState]:
         paid_dices = action.instruction.dices
         card = action.card
 
         # verify action validity
-        preprocessed_game_state = card.valid_instruction(game_state, pid, action.instruction)
-        if preprocessed_game_state is None:
-            raise Exception(f"{action.instruction} is not valid of the {card.name()} "
-                            + f"in the game state:\n{game_state}")
-        game_state = preprocessed_game_state
+        if trusted:
+            game_state, _ = card.preprocessed_dice_cost(game_state, pid)
+        else:
+            preprocessed_game_state = card.valid_instruction(game_state, pid, action.instruction)
+            if preprocessed_game_state is None:
+                raise Exception(f"{action.instruction} is not valid of the {card.name()} "
+                                + f"in the game state:\n{game_state}")
+            game_state = preprocessed_game_state
 
         #  setup
         player = game_state.get_player(pid)
@@ -309,7 +321,8 @@ class ActionPhase(ph.Phase):
             self,
             game_state: GameState,
             pid: Pid,
-            action: ElementalTuningAction
+            action: ElementalTuningAction,
+            trusted: bool = False,
     ) -> Optional[GameState]:
         player = game_state.get_player(pid)
         cards = player.get_hand_cards()
@@ -317,10 +330,13 @@ class ActionPhase(ph.Phase):
         active_character = player.get_active_character()
         assert active_character is not None
         active_character_elem = active_character.element()
-        if action.card not in cards \
-                or dices[action.dice_elem] == 0 \
-                or action.dice_elem is active_character_elem \
-                or dices[Element.OMNI] + dices[active_character_elem] == dices.num_dices():
+        # trusted actions skip the whole validity check
+        if not trusted and (
+                action.card not in cards
+                or dices[action.dice_elem] == 0
+                or action.dice_elem is active_character_elem
+                or dices[Element.OMNI] + dices[active_character_elem] == dices.num_dices()
+        ):
             print(f"{action} cannot be performed in game state:\n{game_state}")
             assert False
             return None
@@ -340,13 +356,15 @@ class ActionPhase(ph.Phase):
             self,
             game_state: GameState,
             pid: Pid,
-            action: DeathSwapAction
+            action: DeathSwapAction,
+            trusted: bool = False,
     ) -> Optional[GameState]:
         # Check action validity
-        result = game_state.swap_checker().valid_action(pid, action)
-        if result is None:
-            raise Exception(f"{action} from {pid} is invalid for gamestate:\n{game_state}")
-        game_state, _ = result
+        if not trusted:
+            result = game_state.swap_checker().valid_action(pid, action)
+            if result is None:
+                raise Exception(f"{action} from {pid} is invalid for gamestate:\n{game_state}")
+            game_state, _ = result
 
         game_state = game_state.factory().f_effect_stack(lambda es: es.pop()[0]).build()
         player = game_state.get_player(pid)
@@ -365,19 +383,20 @@ class ActionPhase(ph.Phase):
             self,
             game_state: GameState,
             pid: Pid,
-            action: GameAction
+            action: GameAction,
+            trusted: bool = False,
     ) -> Optional[GameState]:
         player = game_state.get_player(pid)
         if isinstance(action, SkillAction):
-            return self._handle_skill_action(game_state, pid, action)
+            return self._handle_skill_action(game_state, pid, action, trusted)
         elif isinstance(action, SwapAction):
-            return self._handle_swap_action(game_state, pid, action)
+            return self._handle_swap_action(game_state, pid, action, trusted)
         elif isinstance(action, CardAction):
-            return self._handle_card_action(game_state, pid, action)
+            return self._handle_card_action(game_state, pid, action, trusted)
         elif isinstance(action, ElementalTuningAction):
-            return self._handle_elemental_tuning_action(game_state, pid, action)
+            return self._handle_elemental_tuning_action(game_state, pid, action, trusted)
         elif isinstance(action, DeathSwapAction):
-            return self._handle_death_swap_action(game_state, pid, action)
+            return self._handle_death_swap_action(game_state, pid, action, trusted)
         raise Exception("Unhandld action", action)  # pragma: no cover
 
     def _handle_dices_select_action(
@@ -398,7 +417,8 @@ class ActionPhase(ph.Phase):
         dices = player.get_dices()
         kept_dices = dices - action.selected_dices
         assert kept_dices.is_legal()
-        replacement_dices = ActualDices.from_random(action.selected_dices.num_dices())
+        rng = game_state.get_rng()
+        replacement_dices = ActualDices.from_random(action.selected_dices.num_dices(), rng.random())
         new_dices = kept_dices + replacement_dices
         new_reroll_chances = player.get_dice_reroll_chances() - 1
         new_effect_stack: EffectStack
@@ -407,7 +427,7 @@ class ActionPhase(ph.Phase):
         else:
             # removes rolling phase effect
             new_effect_stack = game_state.get_effect_stack().pop()[0]
-        return game_state.factory().f_player(
+        return game_state.factory().rng(rng.next()).f_player(
             pid,
             lambda p: p.factory()
             .dice_reroll_chances(new_reroll_chances)
@@ -421,29 +441,39 @@ class ActionPhase(ph.Phase):
             self,
             game_state: GameState,
             pid: Pid,
-            action: PlayerAction
+            action: PlayerAction,
+            trusted: bool = False,
     ) -> Optional[GameState]:
-        # check action arrived at the right state
-        if pid is not self.waiting_for(game_state):
-            raise Exception(f"Unexpected action from {pid} at game state:\n{game_state}")
+        if not trusted:
+            # check action arrived at the right state
+            if pid is not self.waiting_for(game_state):
+                raise Exception(f"Unexpected action from {pid} at game state:\n{game_state}")
 
-        # check death swap phase
-        if game_state.death_swapping(pid):
-            if not isinstance(action, DeathSwapAction):
-                raise Exception(f"Trying to execute {action} when a death swap is expected")
+            # check death swap phase
+            if game_state.death_swapping(pid):
+                if not isinstance(action, DeathSwapAction):
+                    raise Exception(f"Trying to execute {action} when a death swap is expected")
 
-        elif self._rolling(game_state):  # pragma: no cover
-            if not isinstance(action, DicesSelectAction):
-                raise Exception(f"Trying to execute {action} when a dices selection is expected")
+            elif self._rolling(game_state):  # pragma: no cover
+                if not isinstance(action, DicesSelectAction):
+                    raise Exception(f"Trying to execute {action} when a dices selection is expected")
 
         if isinstance(action, GameAction):
-            return self._handle_game_action(game_state, pid, action)
+            return self._handle_game_action(game_state, pid, action, trusted)
         elif isinstance(action, DicesSelectAction):
             return self._handle_dices_select_action(game_state, pid, action)
         elif isinstance(action, EndRoundAction):
             return self._handle_end_round(game_state, pid, action)
         raise Exception("Not Reached! Unknown Game State to process")
 
+    def step_trusted_action(
+            self,
+            game_state: GameState,
+            pid: Pid,
+            action: PlayerAction
+    ) -> Optional[GameState]:
+        return self.step_action(game_state, pid, action, trusted=True)
+
     @classmethod
     def _rolling(cls, game_state: GameState) -> bool:
         effect_stack = game_state.get_effect_stack()
@@ -26,10 +26,12 @@ class CardSelectPhase(ph.Phase):
     def _draw_cards_and_activate(self, game_state: GameState) -> GameState:
         p1: PlayerState = game_state.get_player1()
         p2: PlayerState = game_state.get_player2()
-        p1_deck, p1_hand = p1.get_deck_cards().pick_random_cards(self._NUM_CARDS)
-        p2_deck, p2_hand = p2.get_deck_cards().pick_random_cards(self._NUM_CARDS)
+        rng = game_state.get_rng()
+        rand = rng.random()
+        p1_deck, p1_hand = p1.get_deck_cards().pick_random_cards(self._NUM_CARDS, rand)
+        p2_deck, p2_hand = p2.get_deck_cards().pick_random_cards(self._NUM_CARDS, rand)
         mode = game_state.get_mode()
-        return game_state.factory().f_player1(
+        return game_state.factory().rng(rng.next()).f_player1(
             lambda p1: p1.factory()
             .phase(Act.ACTION_PHASE)
             .card_redraw_chances(game_state.get_mode().card_redraw_chances())
@@ -67,7 +69,11 @@ class CardSelectPhase(ph.Phase):
 
     def _handle_card_drawing(self, game_state: GameState, pid: Pid, action: CardsSelectAction) -> GameState:
         player: PlayerState = game_state.get_player(pid)
-        new_deck, new_cards = player.get_deck_cards().pick_random_cards(action.selected_cards.num_cards())
+        rng = game_state.get_rng()
+        new_deck, new_cards = player.get_deck_cards().pick_random_cards(
+            action.selected_cards.num_cards(),
+            rng.random(),
+        )
         new_deck = new_deck + action.selected_cards
         new_hand = player.get_hand_cards() - action.selected_cards
         new_hand = new_hand + new_cards
@@ -77,7 +83,7 @@ class CardSelectPhase(ph.Phase):
             new_player_phase = player.get_phase()
         else:
             new_player_phase = Act.END_PHASE
-        return game_state.factory().player(
+        return game_state.factory().rng(rng.next()).player(
             pid,
             player.factory()
             .phase(new_player_phase)
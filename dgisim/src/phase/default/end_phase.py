@@ -43,15 +43,17 @@ class EndPhase(ph.Phase):
         active_player_id = game_state.get_active_player_id()
         active_player = game_state.get_player(active_player_id)
         other_player = game_state.get_other_player(active_player_id)
+        rng = game_state.get_rng()
+        rand = rng.random()
         active_player_deck, new_cards = (
-            active_player.get_deck_cards().pick_random_cards(self._CARDS_DRAWN)
+            active_player.get_deck_cards().pick_random_cards(self._CARDS_DRAWN, rand)
         )
         active_player_hand = active_player.get_hand_cards() + new_cards
         other_player_deck, new_cards = (
-            other_player.get_deck_cards().pick_random_cards(self._CARDS_DRAWN)
+            other_player.get_deck_cards().pick_random_cards(self._CARDS_DRAWN, rand)
         )
         other_player_hand = other_player.get_hand_cards() + new_cards
-        return game_state.factory().round(
+        return game_state.factory().rng(rng.next()).round(
             new_round
         ).phase(
             game_state.get_mode().roll_phase()
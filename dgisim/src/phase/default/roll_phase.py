@@ -37,17 +37,21 @@ class RollPhase(ph.Phase):
             RollChancePEvent(pid=Pid.P2, chances=base_roll_chances)
         )
         assert isinstance(p2_chances, RollChancePEvent)
-        return game_state.factory().f_player1(
+        rng = game_state.get_rng()
+        rand = rng.random()
+        p1_dices = ActualDices.from_random(RollPhase._NUM_DICES, rand)
+        p2_dices = ActualDices.from_random(RollPhase._NUM_DICES, rand)
+        return game_state.factory().rng(rng.next()).f_player1(
             lambda p1: p1.factory()
             .phase(Act.ACTION_PHASE)
             .dice_reroll_chances(p1_chances.chances)  # type: ignore
-            .dices(ActualDices.from_random(RollPhase._NUM_DICES))
+            .dices(p1_dices)
             .build()
         ).f_player2(
             lambda p2: p2.factory()
             .phase(Act.ACTION_PHASE)
             .dice_reroll_chances(p2_chances.chances)  # type: ignore
-            .dices(ActualDices.from_random(RollPhase._NUM_DICES))
+            .dices(p2_dices)
             .build()
         ).build()
 
@@ -84,7 +88,8 @@ class RollPhase(ph.Phase):
         dices = player.get_dices()
         kept_dices = dices - action.selected_dices
         assert kept_dices.is_legal()
-        replacement_dices = ActualDices.from_random(action.selected_dices.num_dices())
+        rng = game_state.get_rng()
+        replacement_dices = ActualDices.from_random(action.selected_dices.num_dices(), rng.random())
         new_dices = kept_dices + replacement_dices
         new_reroll_chances = player.get_dice_reroll_chances() - 1
         new_player_phase: Act
@@ -92,7 +97,7 @@ class RollPhase(ph.Phase):
             new_player_phase = player.get_phase()
         else:
             new_player_phase = Act.END_PHASE
-        return game_state.factory().f_player(
+        return game_state.factory().rng(rng.next()).f_player(
             pid,
             lambda p: p.factory()
             .phase(new_player_phase)
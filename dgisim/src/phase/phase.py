@@ -29,6 +29,18 @@ class Phase:
     ) -> None | GameState:
         raise NotImplementedError
 
+    def step_trusted_action(
+        self,
+        game_state: GameState,
+        pid: Pid,
+        action: PlayerAction
+    ) -> None | GameState:
+        """
+        Same as step_action() except that action is known to be legal (e.g. it
+        is one of game_state.legal_actions(pid)), so its validation can be skipped.
+        """
+        return self.step_action(game_state, pid, action)
+
     def waiting_for(self, game_state: GameState) -> None | Pid:
         players = [game_state.get_player1(), game_state.get_player2()]
         for player in players:
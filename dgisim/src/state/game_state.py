@@ -1,5 +1,5 @@
 from __future__ import annotations
-from typing import Callable, Optional, TYPE_CHECKING, cast
+from typing import Any, Callable, Optional, TYPE_CHECKING, cast
 
 from typing_extensions import Self
 
@@ -22,7 +22,9 @@ from ..effect.enums import Zone
 from ..effect.structs import StaticTarget
 from ..element import Element
 from ..event import *
+from ..helper.fingerprint import field_term, inherit_fingerprint, zobrist_key
 from ..helper.quality_of_life import case_val
+from ..helper.rng import Rng
 from ..status.status_processing import StatusProcessing
 from ..status.enums import Preprocessables
 from ..summon.summon import Summon
@@ -47,8 +49,46 @@ class GameState:
     run step(), otherwise run action_step(player_action).
 
     To tell if a player action is required, run waiting_for().
+
+    All the randomness of the game (dices, card drawing...) is drawn from the
+    random stream of the game state (see get_rng()), so the same seed and the
+    same actions give the same game. The stream is not part of the game
+    position: equality, hash and fingerprint ignore it.
     """
 
+    __slots__ = (
+        "_mode",
+        "_phase",
+        "_round",
+        "_active_player_id",
+        "_player1",
+        "_player2",
+        "_effect_stack",
+        "_hash",
+        "_fingerprint",
+        "_rng",
+        "_card_checker",
+        "_swap_checker",
+        "_skill_checker",
+        "_elem_tuning_checker",
+        "_legal_actions",
+        "_legal_action_indices",
+    )
+
+    #: if True, action_step() also validates trusted actions and asserts that
+    #: both paths lead to the same game state
+    VERIFY_TRUSTED_ACTIONS = False
+
+    _FINGERPRINT_FIELDS = (
+        "_mode",
+        "_phase",
+        "_round",
+        "_active_player_id",
+        "_player1",
+        "_player2",
+        "_effect_stack",
+    )
+
     def __init__(
         self,
         mode: md.Mode,
@@ -57,7 +97,8 @@ class GameState:
         active_player_id: Pid,
         player1: ps.PlayerState,
         player2: ps.PlayerState,
-        effect_stack: EffectStack
+        effect_stack: EffectStack,
+        rng: None | Rng = None,
     ):
         # REMINDER: don't forget to update factory when adding new fields
         self._mode = mode
@@ -67,28 +108,47 @@ class GameState:
         self._player1 = player1
         self._player2 = player2
         self._effect_stack = effect_stack
+        self._hash: None | int = None
+        self._fingerprint: None | int = None
+        self._rng = Rng.from_seed() if rng is None else rng
+
+        # checkers are created on first use
+        self._card_checker: None | CardChecker = None
+        self._swap_checker: None | SwapChecker = None
+        self._skill_checker: None | SkillChecker = None
+        self._elem_tuning_checker: None | ElementalTuningChecker = None
 
-        # checkers
-        self._card_checker = CardChecker(self)
-        self._swap_checker = SwapChecker(self)
-        self._skill_checker = SkillChecker(self)
-        self._elem_tuning_checker = ElementalTuningChecker(self)
+        # legal actions of each player, computed on first use
+        self._legal_actions: None | dict[Pid, tuple[PlayerAction, ...]] = None
+        self._legal_action_indices: None | dict[Pid, dict[int, PlayerAction]] = None
 
     @classmethod
-    def from_default(cls) -> Self:
+    def from_default(cls, seed: None | int = None) -> Self:
+        """
+        if seed is None, the game is seeded from the global random module
+        """
         mode = md.DefaultMode()
+        rng = Rng.from_seed(seed)
+        rand = rng.random()
         return cls(
             mode=mode,
             phase=mode.first_phase(),
             round=0,
             active_player_id=Pid.P1,
-            player1=ps.PlayerState.example_player(mode),
-            player2=ps.PlayerState.example_player(mode),
+            player1=ps.PlayerState.example_player(mode, rand),
+            player2=ps.PlayerState.example_player(mode, rand),
             effect_stack=EffectStack(()),
+            rng=rng.next(),
         )
 
     @classmethod
-    def from_players(cls, mode: md.Mode, player1: ps.PlayerState, player2: ps.PlayerState) -> Self:
+    def from_players(
+            cls,
+            mode: md.Mode,
+            player1: ps.PlayerState,
+            player2: ps.PlayerState,
+            seed: None | int = None,
+    ) -> Self:
         return cls(  # pragma: no cover
             mode=mode,
             phase=mode.first_phase(),
@@ -97,10 +157,17 @@ class GameState:
             player1=player1,
             player2=player2,
             effect_stack=EffectStack(()),
+            rng=Rng.from_seed(seed),
         )
 
     @classmethod
-    def from_decks(cls, mode: md.Mode, p1_deck: Deck, p2_deck: Deck) -> Self:  # pragma: no cover
+    def from_decks(
+            cls,
+            mode: md.Mode,
+            p1_deck: Deck,
+            p2_deck: Deck,
+            seed: None | int = None,
+    ) -> Self:  # pragma: no cover
         if not p1_deck.immutable:
             p1_deck = p1_deck.to_frozen()
         if not p2_deck.immutable:
@@ -115,6 +182,7 @@ class GameState:
             player1=ps.PlayerState.from_deck(mode, p1_deck),
             player2=ps.PlayerState.from_deck(mode, p2_deck),
             effect_stack=EffectStack(()),
+            rng=Rng.from_seed(seed),
         )
 
     def factory(self) -> GameStateFactory:
@@ -135,6 +203,9 @@ class GameState:
     def get_effect_stack(self) -> EffectStack:
         return self._effect_stack
 
+    def get_rng(self) -> Rng:
+        return self._rng
+
     def get_player1(self) -> ps.PlayerState:
         return self._player1
 
@@ -177,15 +248,23 @@ class GameState:
         )
 
     def card_checker(self) -> CardChecker:
+        if self._card_checker is None:
+            self._card_checker = CardChecker(self)
         return self._card_checker
 
     def swap_checker(self) -> SwapChecker:
+        if self._swap_checker is None:
+            self._swap_checker = SwapChecker(self)
         return self._swap_checker
 
     def skill_checker(self) -> SkillChecker:
+        if self._skill_checker is None:
+            self._skill_checker = SkillChecker(self)
         return self._skill_checker
 
     def elem_tuning_checker(self) -> ElementalTuningChecker:
+        if self._elem_tuning_checker is None:
+            self._elem_tuning_checker = ElementalTuningChecker(self)
         return self._elem_tuning_checker
 
     def belongs_to(self, object: Character | Support) -> None | Pid:
@@ -220,15 +299,98 @@ class GameState:
     def step(self) -> GameState:
         return self._phase.step(self)
 
-    def action_step(self, pid: Pid, action: PlayerAction) -> Optional[GameState]:
+    def action_step(
+            self,
+            pid: Pid,
+            action: PlayerAction,
+            trusted: bool = False,
+    ) -> Optional[GameState]:
         """
         Returns None if the action is illegal or undefined
+
+        If trusted is True, the action must be known to be legal, e.g. it is one
+        of legal_actions(pid) or was generated by action_generator(pid), then
+        its validation is skipped.
+        (see VERIFY_TRUSTED_ACTIONS for debugging)
         """
-        return self._phase.step_action(self, pid, action)
+        if not trusted:
+            return self._phase.step_action(self, pid, action)
+        if not GameState.VERIFY_TRUSTED_ACTIONS:
+            return self._phase.step_trusted_action(self, pid, action)
+        # both paths draw from the Rng of this game state
+        trusted_game_state = self._phase.step_trusted_action(self, pid, action)
+        game_state = self._phase.step_action(self, pid, action)
+        assert trusted_game_state == game_state, \
+            f"trusted {action} from {pid} diverges from validation at game state:\n{self}"
+        assert (
+            trusted_game_state is None
+            or game_state is None
+            or trusted_game_state.get_rng() == game_state.get_rng()
+        ), f"trusted {action} from {pid} advances the rng differently at game state:\n{self}"
+        return game_state
 
     def action_generator(self, pid: Pid) -> None | acg.ActionGenerator:
         return self._phase.action_generator(self, pid)
 
+    def legal_actions(self, pid: Pid) -> tuple[PlayerAction, ...]:
+        """
+        Returns all the distinct actions player pid can take now, with dice
+        costs paid canonically (see ActualDices.basically_satisfy()).
+
+        Returns an empty tuple if the game has ended or is not waiting for
+        player pid.
+        The result is cached on this game state.
+        """
+        if self._legal_actions is None:
+            self._legal_actions = {}
+        actions = self._legal_actions.get(pid)
+        if actions is None:
+            from ..action.legal_actions import legal_actions
+            actions = legal_actions(self, pid)
+            self._legal_actions[pid] = actions
+        return actions
+
+    def legal_action_indices(self, pid: Pid) -> dict[int, PlayerAction]:
+        """
+        Returns the legal actions of player pid by their indices in the flat
+        action space of the mode (see Mode.action_space()).
+
+        The result is cached on this game state.
+        """
+        if self._legal_action_indices is None:
+            self._legal_action_indices = {}
+        indices = self._legal_action_indices.get(pid)
+        if indices is None:
+            indices = self._mode.action_space().legal_indices(self, pid)
+            self._legal_action_indices[pid] = indices
+        return indices
+
+    def legal_action_mask(self, pid: Pid) -> Any:
+        """
+        Returns the NumPy boolean mask of the legal actions of player pid over
+        the flat action space of the mode (see legal_action_indices()).
+        """
+        return self._mode.action_space().mask(self, pid)
+
+    def advance_to_decision(self, trace: None | list[eft.Effect | ph.Phase] = None) -> GameState:
+        """
+        Keeps stepping the game until a player action is required or the game ends,
+        and returns that game state. Intermediate states are not kept.
+
+        If trace is provided, one entry is appended to it per step: the effect on
+        top of the effect stack before the step, or the phase if the stack is empty.
+        """
+        game_state = self
+        end_phase_type = type(self._mode.game_end_phase())
+        while True:
+            phase = game_state._phase
+            if type(phase) is end_phase_type or phase.waiting_for(game_state) is not None:
+                return game_state
+            if trace is not None:
+                effect_stack = game_state._effect_stack
+                trace.append(effect_stack.peek() if effect_stack.is_not_empty() else phase)
+            game_state = phase.step(game_state)
+
     def get_winner(self) -> Optional[Pid]:  # pragma: no cover
         assert self.game_end()
         if self.get_player1().defeated():
@@ -242,9 +404,16 @@ class GameState:
         return type(self._phase) is type(self._mode.game_end_phase())
 
     def prespective_view(self, pid: Pid) -> GameState:
+        """
+        The game state as seen by pid: the cards of the opponent are hidden and
+        the random stream is replaced by a public one, unrelated to the real
+        stream, so the next draws can't be predicted from the view.
+        """
         return self.factory().f_player(
             pid.other(),
             lambda p: p.hide_cards()
+        ).rng(
+            Rng.from_seed(zobrist_key("prespective_view", pid.value))
         ).build()
 
     def __copy__(self) -> Self:  # pragma: no cover
@@ -267,10 +436,31 @@ class GameState:
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, GameState):
             return False
-        return self is other or self._all_unique_data() == other._all_unique_data()
+        if self is other:
+            return True
+        if self._hash is not None and other._hash is not None and self._hash != other._hash:
+            return False
+        return self._all_unique_data() == other._all_unique_data()
 
     def __hash__(self) -> int:
-        return hash(self._all_unique_data())
+        if self._hash is None:
+            self._hash = hash(self._all_unique_data())
+        return self._hash
+
+    def fingerprint(self) -> int:
+        """
+        Returns a 64-bit fingerprint of the game state that is stable across
+        processes. (unlike hash())
+
+        The fingerprint of a game state built by the factory of another game state
+        with a known fingerprint is derived from the old one in O(changed fields).
+        """
+        if self._fingerprint is None:
+            fp = 0
+            for field in self._FINGERPRINT_FIELDS:
+                fp ^= field_term("GameState", field, getattr(self, field))
+            self._fingerprint = fp
+        return self._fingerprint
 
     def __str__(self) -> str:
         from ..helper.level_print import GamePrinter
@@ -290,6 +480,7 @@ class GameState:
 
 class GameStateFactory:
     def __init__(self, game_state: GameState):
+        self._game_state = game_state
         self._mode = game_state.get_mode()
         self._phase = game_state.get_phase()
         self._round = game_state.get_round()
@@ -297,6 +488,7 @@ class GameStateFactory:
         self._player1 = game_state.get_player1()
         self._player2 = game_state.get_player2()
         self._effect_stack = game_state.get_effect_stack()
+        self._rng = game_state.get_rng()
 
     def mode(self, new_mode: md.Mode) -> GameStateFactory:
         self._mode = new_mode
@@ -313,6 +505,10 @@ class GameStateFactory:
         self._round = new_round
         return self
 
+    def rng(self, rng: Rng) -> GameStateFactory:
+        self._rng = rng
+        return self
+
     def effect_stack(self, effect_stack: EffectStack) -> GameStateFactory:
         self._effect_stack = effect_stack
         return self
@@ -371,7 +567,7 @@ class GameStateFactory:
             raise Exception("player_id unknown")
 
     def build(self) -> GameState:
-        return GameState(
+        game_state = GameState(
             mode=self._mode,
             phase=self._phase,
             round=self._round,
@@ -379,20 +575,53 @@ class GameStateFactory:
             effect_stack=self._effect_stack,
             player1=self._player1,
             player2=self._player2,
+            rng=self._rng,
         )
+        inherit_fingerprint(
+            self._game_state,
+            game_state,
+            "GameState",
+            GameState._FINGERPRINT_FIELDS,
+        )
+        return game_state
 
 
 class CardChecker:
     def __init__(self, game_state: GameState) -> None:
         self._game_state = game_state
+        # memos filled on first query, keyed by (pid, card_type)
+        self._costs: dict[tuple[Pid, type[Card]], tuple[GameState, AbstractDices]] = {}
+        self._strictly_usables: dict[tuple[Pid, type[Card]], bool] = {}
 
     def usable(self, pid: Pid, card_type: type[Card]) -> None | acg.ActionGenerator:
         return card_type.action_generator(self._game_state, pid)
 
+    def strictly_usable(self, pid: Pid, card_type: type[Card]) -> bool:
+        """ memorized Card.strictly_usable() """
+        key = (pid, card_type)
+        usable = self._strictly_usables.get(key)
+        if usable is None:
+            usable = card_type.strictly_usable(self._game_state, pid)
+            self._strictly_usables[key] = usable
+        return usable
+
+    def preprocessed_dice_cost(
+            self,
+            pid: Pid,
+            card_type: type[Card],
+    ) -> tuple[GameState, AbstractDices]:
+        """ memorized Card.preprocessed_dice_cost() """
+        key = (pid, card_type)
+        cost = self._costs.get(key)
+        if cost is None:
+            cost = card_type._preprocessed_dice_cost(self._game_state, pid)
+            self._costs[key] = cost
+        return cost
+
     def playable(self, pid: Pid) -> bool:
         """ Returns true if any card is playable """
         return any(
-            card_type.strictly_usable(self._game_state, pid)
+            self.strictly_usable(pid, card_type)
             for card_type in self._game_state.get_player(pid).get_hand_cards()
         )
 
@@ -400,6 +629,12 @@ class CardChecker:
 class SwapChecker:
     def __init__(self, game_state: GameState) -> None:
         self._game_state = game_state
+        # memos filled on first query, keyed by (pid, char_id)
+        self._swap_details: dict[
+            tuple[Pid, int],
+            None | tuple[EventSpeed, None | AbstractDices]
+        ] = {}
+        self._swap_events: dict[tuple[Pid, int], tuple[GameState, ActionPEvent]] = {}
 
     def should_death_swap(self) -> bool:
         effect_stack = self._game_state.get_effect_stack()
@@ -420,6 +655,16 @@ class SwapChecker:
             self,
             pid: Pid,
             char_id: int,
+    ) -> None | tuple[EventSpeed, None | AbstractDices]:
+        key = (pid, char_id)
+        if key not in self._swap_details:
+            self._swap_details[key] = self._find_swap_details(pid, char_id)
+        return self._swap_details[key]
+
+    def _find_swap_details(
+            self,
+            pid: Pid,
+            char_id: int,
     ) -> None | tuple[EventSpeed, None | AbstractDices]:
         game_state = self._game_state
         selected_char = game_state.get_player(pid).get_characters().get_character(char_id)
@@ -434,27 +679,7 @@ class SwapChecker:
             return EventSpeed.FAST_ACTION, None
 
         # Check if player can afford Normal Swap
-        _, swap_action = StatusProcessing.preprocess_by_all_statuses(
-            game_state=game_state,
-            pid=pid.other(),  # start from opponent because cost raise goes first
-            pp_type=Preprocessables.SWAP,
-            item=ActionPEvent(
-                source=StaticTarget(
-                    pid=pid,
-                    zone=Zone.CHARACTERS,
-                    id=active_character_id,
-                ),
-                target=StaticTarget(
-                    pid=pid,
-                    zone=Zone.CHARACTERS,
-                    id=char_id,
-                ),
-                event_type=EventType.SWAP,
-                event_speed=game_state.get_mode().swap_speed(),
-                dices_cost=game_state.get_mode().swap_cost(),
-            ),
-        )
-        assert isinstance(swap_action, ActionPEvent)
+        _, swap_action = self._preprocessed_swap(pid, active_character_id, char_id)
         if game_state.get_player(pid).get_dices().loosely_satisfy(swap_action.dices_cost):
             return swap_action.event_speed, swap_action.dices_cost
         else:
@@ -490,27 +715,9 @@ class SwapChecker:
                 None,
             )
         elif isinstance(action, act.SwapAction):
-            new_game_state, swap_action = StatusProcessing.preprocess_by_all_statuses(
-                game_state=game_state,
-                pid=pid.other(),  # start from opponent because cost raise goes first
-                pp_type=Preprocessables.SWAP,
-                item=ActionPEvent(
-                    source=StaticTarget(
-                        pid=pid,
-                        zone=Zone.CHARACTERS,
-                        id=active_character_id,
-                    ),
-                    target=StaticTarget(
-                        pid=pid,
-                        zone=Zone.CHARACTERS,
-                        id=action.char_id,
-                    ),
-                    event_type=EventType.SWAP,
-                    event_speed=game_state.get_mode().swap_speed(),
-                    dices_cost=game_state.get_mode().swap_cost(),
-                ),
+            new_game_state, swap_action = self._preprocessed_swap(
+                pid, active_character_id, action.char_id
             )
-            assert isinstance(swap_action, ActionPEvent)
             instruction_dices = action.instruction.dices
             player_dices = game_state.get_player(pid).get_dices()
             return case_val(
@@ -521,16 +728,92 @@ class SwapChecker:
             )
         raise Exception("action ({action}) is not expected to be passed in")  # pragma: no cover
 
+    def preprocessed_action(
+            self,
+            pid: Pid,
+            action: act.SwapAction | act.DeathSwapAction,
+    ) -> tuple[GameState, EventSpeed]:
+        """
+        Same as valid_action() but the action is assumed to be valid and is not
+        checked.
+        """
+        if isinstance(action, act.DeathSwapAction):
+            return self._game_state, EventSpeed.FAST_ACTION
+        active_character_id = self._game_state.get_player(
+            pid
+        ).get_characters().get_active_character_id()
+        assert active_character_id is not None
+        new_game_state, swap_action = self._preprocessed_swap(
+            pid, active_character_id, action.char_id
+        )
+        return new_game_state, swap_action.event_speed
+
+    def _preprocessed_swap(
+            self,
+            pid: Pid,
+            active_character_id: int,
+            char_id: int,
+    ) -> tuple[GameState, ActionPEvent]:
+        key = (pid, char_id)
+        swap_event = self._swap_events.get(key)
+        if swap_event is not None:
+            return swap_event
+        game_state = self._game_state
+        new_game_state, swap_action = StatusProcessing.preprocess_by_all_statuses(
+            game_state=game_state,
+            pid=pid.other(),  # start from opponent because cost raise goes first
+            pp_type=Preprocessables.SWAP,
+            item=ActionPEvent(
+                source=StaticTarget(
+                    pid=pid,
+                    zone=Zone.CHARACTERS,
+                    id=active_character_id,
+                ),
+                target=StaticTarget(
+                    pid=pid,
+                    zone=Zone.CHARACTERS,
+                    id=char_id,
+                ),
+                event_type=EventType.SWAP,
+                event_speed=game_state.get_mode().swap_speed(),
+                dices_cost=game_state.get_mode().swap_cost(),
+            ),
+        )
+        assert isinstance(swap_action, ActionPEvent)
+        swap_event = (new_game_state, swap_action)
+        self._swap_events[key] = swap_event
+        return swap_event
+
 
 class SkillChecker:
     def __init__(self, game_state: GameState) -> None:
         self._game_state = game_state
+        # memos filled on first query, keyed by (pid, char_id, skill_type)
+        self._usables: dict[
+            tuple[Pid, int, CharacterSkill],
+            None | tuple[GameState, AbstractDices]
+        ] = {}
+        self._skill_events: dict[
+            tuple[Pid, int, CharacterSkill],
+            tuple[GameState, ActionPEvent]
+        ] = {}
 
     def usable(
             self,
             pid: Pid,
             char_id: int,
             skill_type: CharacterSkill,
+    ) -> None | tuple[GameState, AbstractDices]:
+        key = (pid, char_id, skill_type)
+        if key not in self._usables:
+            self._usables[key] = self._find_usable(pid, char_id, skill_type)
+        return self._usables[key]
+
+    def _find_usable(
+            self,
+            pid: Pid,
+            char_id: int,
+            skill_type: CharacterSkill,
     ) -> None | tuple[GameState, AbstractDices]:
         game_state = self._game_state
         character = game_state.get_player(pid).get_characters().get_character(char_id)
@@ -541,22 +824,7 @@ class SkillChecker:
         if skill_type is CharacterSkill.ELEMENTAL_BURST \
                 and character.get_energy() < character.get_max_energy():
             return None
-        new_game_state, skill_event = StatusProcessing.preprocess_by_all_statuses(
-            game_state=game_state,
-            pid=pid,
-            pp_type=Preprocessables.SKILL,
-            item=ActionPEvent(
-                source=StaticTarget(
-                    pid=pid,
-                    zone=Zone.CHARACTERS,
-                    id=char_id,
-                ),
-                event_type=skill_type.to_event_type(),
-                event_speed=EventSpeed.COMBAT_ACTION,
-                dices_cost=character.skill_cost(skill_type),
-            ),
-        )
-        assert isinstance(skill_event, ActionPEvent)
+        new_game_state, skill_event = self._preprocessed_skill(pid, character, skill_type)
         if game_state.get_player(pid).get_dices().loosely_satisfy(skill_event.dices_cost):
             return new_game_state, skill_event.dices_cost
         else:
@@ -587,8 +855,38 @@ class SkillChecker:
         if skill_type is CharacterSkill.ELEMENTAL_BURST \
                 and character.get_energy() < character.get_max_energy():  # pragma: no cover
             return None
+        game_state, skill_event = self._preprocessed_skill(pid, character, skill_type)
+        paid_dices = action.instruction.dices
+        if paid_dices.just_satisfy(skill_event.dices_cost) \
+                and (game_state.get_player(pid).get_dices() - paid_dices).is_legal():
+            return game_state
+        else:
+            return None
+
+    def preprocessed_action(
+            self,
+            pid: Pid,
+            action: act.SkillAction,
+    ) -> GameState:
+        """
+        Same as valid_action() but the action is assumed to be valid and is not
+        checked.
+        """
+        character = self._game_state.get_player(pid).just_get_active_character()
+        return self._preprocessed_skill(pid, character, action.skill)[0]
+
+    def _preprocessed_skill(
+            self,
+            pid: Pid,
+            character: Character,
+            skill_type: CharacterSkill,
+    ) -> tuple[GameState, ActionPEvent]:
+        key = (pid, character.get_id(), skill_type)
+        cached = self._skill_events.get(key)
+        if cached is not None:
+            return cached
         game_state, skill_event = StatusProcessing.preprocess_by_all_statuses(
-            game_state=game_state,
+            game_state=self._game_state,
             pid=pid,
             pp_type=Preprocessables.SKILL,
             item=ActionPEvent(
@@ -603,12 +901,9 @@ class SkillChecker:
             ),
         )
         assert isinstance(skill_event, ActionPEvent)
-        paid_dices = action.instruction.dices
-        if paid_dices.just_satisfy(skill_event.dices_cost) \
-                and (game_state.get_player(pid).get_dices() - paid_dices).is_legal():
-            return game_state
-        else:
-            return None
+        cached = (game_state, skill_event)
+        self._skill_events[key] = cached
+        return cached
 
 
 class ElementalTuningChecker:
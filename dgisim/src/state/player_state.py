@@ -1,4 +1,5 @@
 from __future__ import annotations
+import random
 from typing import Callable, Optional, Union, TYPE_CHECKING
 from typing_extensions import Self
 
@@ -9,6 +10,8 @@ from ..support import support as sp
 from ..card.cards import Cards
 from ..character.characters import Characters
 from ..dices import ActualDices
+from ..helper.fingerprint import field_term, inherit_fingerprint
+from ..helper.rng import random_or_global
 from ..summon.summons import Summons
 from ..support.supports import Supports
 
@@ -16,7 +19,12 @@ from .enums import Act
 
 if TYPE_CHECKING:
     from ..deck import Deck
+    from ..effect.enums import TriggeringSignal
+    from ..effect.structs import StaticTarget
     from ..mode import Mode
+    from ..status.enums import Informables, Preprocessables
+    from ..status.status import Status
+    from .enums import Pid
 
 __all__ = [
     "PlayerState",
@@ -24,6 +32,24 @@ __all__ = [
 
 
 class PlayerState:
+    _FINGERPRINT_FIELDS = (
+        "_phase",
+        "_card_redraw_chances",
+        "_dice_reroll_chances",
+        "_characters",
+        "_hidden_statuses",
+        "_combat_statuses",
+        "_summons",
+        "_supports",
+        "_dices",
+        "_hand_cards",
+        "_deck_cards",
+        "_publicly_used_cards",
+        "_publicly_gained_cards",
+    )
+
+    __slots__ = _FINGERPRINT_FIELDS + ("_hash", "_fingerprint", "_signal_index")
+
     def __init__(
         self,
         phase: Act,
@@ -54,6 +80,15 @@ class PlayerState:
         self._deck_cards = deck_cards
         self._publicly_used_cards = publicly_used_cards
         self._publicly_gained_cards = publicly_gained_cards
+        self._hash: None | int = None
+        self._fingerprint: None | int = None
+        self._signal_index: None | tuple[
+            Pid,
+            dict[
+                TriggeringSignal | Preprocessables | Informables,
+                tuple[tuple[Status, StaticTarget], ...],
+            ],
+        ] = None
 
     def factory(self) -> PlayerStateFactory:
         return PlayerStateFactory(self)
@@ -127,6 +162,40 @@ class PlayerState:
     def defeated(self) -> bool:
         return self._characters.all_defeated()
 
+    def signal_reactors(
+            self,
+            pid: Pid,
+            signal: TriggeringSignal | Preprocessables | Informables,
+    ) -> tuple[tuple[Status, StaticTarget], ...]:
+        """
+        Returns the statuses of this player (as player pid) that react to signal,
+        with their sources, in the order of StatusProcessing.loop_one_player_all_statuses().
+
+        signal can be a triggering signal, or a kind of preprocessing or information
+        a status handles.
+
+        The index from signals to reactors is built on first call.
+        """
+        if self._signal_index is None or self._signal_index[0] is not pid:
+            from ..status.status_processing import StatusProcessing
+            index: dict[
+                TriggeringSignal | Preprocessables | Informables,
+                list[tuple[Status, StaticTarget]],
+            ] = {}
+            for status, target in StatusProcessing.player_statuses_in_order(self, pid):
+                reactable_signals: tuple[TriggeringSignal | Preprocessables | Informables, ...] = (
+                    *status.REACTABLE_SIGNALS,
+                    *status.PREPROCESSABLES,
+                    *status.INFORMABLES,
+                )
+                for reactable_signal in reactable_signals:
+                    index.setdefault(reactable_signal, []).append((status, target))
+            self._signal_index = (pid, {
+                reactable_signal: tuple(reactors)
+                for reactable_signal, reactors in index.items()
+            })
+        return self._signal_index[1].get(signal, ())
+
     def hide_cards(self) -> PlayerState:
         return self.factory().f_hand_cards(
             lambda hcs: hcs.hide_all()
@@ -135,13 +204,15 @@ class PlayerState:
         ).build()
 
     @classmethod
-    def example_player(cls, mode: Mode) -> Self:
+    def example_player(cls, mode: Mode, rand: None | random.Random = None) -> Self:
+        """
+        Draws from rand if provided, otherwise from the global random module.
+        """
         from ..status.status import DeathThisRoundStatus, PlungeAttackStatus
-        cards = mode.all_cards()
-        chars = mode.all_chars()
-        import random
-        selected_cards = random.sample(list(cards), k=15)
-        selected_chars = random.sample(list(chars), k=3)
+        type_registry = mode.type_registry()
+        rand = random_or_global(rand)
+        selected_cards = rand.sample(type_registry.cards.types(), k=15)
+        selected_chars = rand.sample(type_registry.characters.types(), k=3)
         return cls(
             phase=Act.PASSIVE_WAIT_PHASE,
             card_redraw_chances=0,
@@ -216,10 +287,25 @@ class PlayerState:
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, PlayerState):
             return False
+        if self is other:
+            return True
+        if self._hash is not None and other._hash is not None and self._hash != other._hash:
+            return False
         return self._all_unique_data() == other._all_unique_data()
 
     def __hash__(self) -> int:
-        return hash(self._all_unique_data())
+        if self._hash is None:
+            self._hash = hash(self._all_unique_data())
+        return self._hash
+
+    def fingerprint(self) -> int:
+        """ Stable 64-bit fingerprint, see GameState.fingerprint() """
+        if self._fingerprint is None:
+            fp = 0
+            for field in self._FINGERPRINT_FIELDS:
+                fp ^= field_term("PlayerState", field, getattr(self, field))
+            self._fingerprint = fp
+        return self._fingerprint
 
     def dict_str(self) -> dict[str, Union[dict, str]]:
         return {
@@ -240,6 +326,7 @@ class PlayerState:
 
 class PlayerStateFactory:
     def __init__(self, player_state: PlayerState) -> None:
+        self._player_state = player_state
         self._phase = player_state.get_phase()
         self._card_redraw_chances = player_state.get_card_redraw_chances()
         self._dice_reroll_chances = player_state.get_dice_reroll_chances()
@@ -344,7 +431,7 @@ class PlayerStateFactory:
         return self.publicly_gained_cards(f(self._publicly_gained_cards))
 
     def build(self) -> PlayerState:
-        return PlayerState(
+        player_state = PlayerState(
             phase=self._phase,
             card_redraw_chances=self._card_redraw_chances,
             dice_reroll_chances=self._dice_reroll_chances,
@@ -359,3 +446,10 @@ class PlayerStateFactory:
             publicly_used_cards=self._publicly_used_cards,
             publicly_gained_cards=self._publicly_gained_cards,
         )
+        inherit_fingerprint(
+            self._player_state,
+            player_state,
+            "PlayerState",
+            PlayerState._FINGERPRINT_FIELDS,
+        )
+        return player_state
@@ -15,7 +15,7 @@ from abc import abstractmethod
 from dataclasses import dataclass, replace
 from enum import Enum
 from math import ceil
-from typing import ClassVar, cast, Optional, TYPE_CHECKING
+from typing import Any, ClassVar, cast, Optional, TYPE_CHECKING
 from typing_extensions import override, Self
 
 from ..effect import effect as eft
@@ -144,6 +144,18 @@ __all__ = [
 @dataclass(frozen=True)
 class Status:
     REACTABLE_SIGNALS: ClassVar[frozenset[TriggeringSignal]] = frozenset()
+    # The kinds of preprocessing / information this status handles, statuses are
+    # only asked to preprocess(), inform() for these kinds.
+    # Must be declared by every status overriding _preprocess() or _inform().
+    PREPROCESSABLES: ClassVar[frozenset[Preprocessables]] = frozenset()
+    INFORMABLES: ClassVar[frozenset[Informables]] = frozenset()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        if cls._preprocess is not Status._preprocess and not cls.PREPROCESSABLES:
+            raise TypeError(f"{cls.__name__} overrides _preprocess() but declares no PREPROCESSABLES")
+        if cls._inform is not Status._inform and not cls.INFORMABLES:
+            raise TypeError(f"{cls.__name__} overrides _inform() but declares no INFORMABLES")
 
     def __init__(self) -> None:
         if type(self) is Status:  # pragma: no cover
@@ -189,6 +201,19 @@ class Status:
     ) -> tuple[PreprocessableEvent, Optional[Self]]:
         return (new_item, new_self)
 
+    def informed(
+            self,
+            game_state: GameState,
+            status_source: StaticTarget,
+            info_type: Informables,
+            information: InformableEvent,
+    ) -> Self:
+        """
+        Returns the updated self, without writing it back to game_state
+        (see inform())
+        """
+        return self._inform(game_state, status_source, info_type, information)
+
     def inform(
             self,
             game_state: GameState,
@@ -196,7 +221,7 @@ class Status:
             info_type: Informables,
             information: InformableEvent,
     ) -> GameState:
-        new_self = self._inform(game_state, status_source, info_type, information)
+        new_self = self.informed(game_state, status_source, info_type, information)
         if new_self == self:
             return game_state
 
@@ -450,6 +475,9 @@ class TalentEquipmentStatus(EquipmentStatus):
 class WeaponEquipmentStatus(EquipmentStatus):
     WEAPON_TYPE: ClassVar[WeaponType]
     BASE_DAMAGE_BOOST: ClassVar[int] = 1
+    PREPROCESSABLES: ClassVar[frozenset[Preprocessables]] = frozenset((
+        Preprocessables.DMG_AMOUNT_PLUS,
+    ))
 
     @override
     def _preprocess(
@@ -582,6 +610,9 @@ class FixedShieldStatus(_ShieldStatus, _UsageStatus):
     usages: int
     MAX_USAGES: ClassVar[int] = BIG_INT
     SHIELD_AMOUNT: ClassVar[int] = 0  # shield amount per stack
+    PREPROCESSABLES: ClassVar[frozenset[Preprocessables]] = frozenset((
+        Preprocessables.DMG_AMOUNT_MINUS,
+    ))
 
     def _triggering_condition(self, damage: eft.SpecificDamageEffect) -> bool:
         return True
@@ -620,6 +651,9 @@ class StackedShieldStatus(_ShieldStatus, _UsageStatus):
     usages: int
     MAX_USAGES: ClassVar[int] = BIG_INT
     SHIELD_AMOUNT: ClassVar[int] = 1  # shield amount per usage
+    PREPROCESSABLES: ClassVar[frozenset[Preprocessables]] = frozenset((
+        Preprocessables.DMG_AMOUNT_MINUS,
+    ))
 
     @override
     def _preprocess(
@@ -673,6 +707,10 @@ class _InfusionStatus(_UsageStatus):
     REACTABLE_SIGNALS: ClassVar[frozenset[TriggeringSignal]] = frozenset((
         TriggeringSignal.ROUND_END,
     ))
+    PREPROCESSABLES: ClassVar[frozenset[Preprocessables]] = frozenset((
+        Preprocessables.DMG_ELEMENT,
+        Preprocessables.DMG_AMOUNT_PLUS,
+    ))
 
     @override
     def _preprocess(
@@ -780,6 +818,9 @@ class DeathThisRoundStatus(PlayerHiddenStatus):
     REACTABLE_SIGNALS: ClassVar[frozenset[TriggeringSignal]] = frozenset((
         TriggeringSignal.ROUND_END,
     ))
+    INFORMABLES: ClassVar[frozenset[Informables]] = frozenset((
+        Informables.CHARACTER_DEATH,
+    ))
 
     @override
     def _inform(
@@ -862,6 +903,9 @@ class GamblersEarringsStatus(ArtifactEquipmentStatus):
     REACTABLE_SIGNALS: ClassVar[frozenset[TriggeringSignal]] = frozenset((
         TriggeringSignal.DEATH_EVENT,
     ))
+    INFORMABLES: ClassVar[frozenset[Informables]] = frozenset((
+        Informables.CHARACTER_DEATH,
+    ))
 
     def triggerable(self) -> bool:
         return self.triggered_num < self.MAX_TRIGGER_NUM and self.informed_num > 0
@@ -918,6 +962,9 @@ class GamblersEarringsStatus(ArtifactEquipmentStatus):
 class CatalyzingFieldStatus(CombatStatus):
     damage_boost: ClassVar[int] = 1
     usages: int = 2
+    PREPROCESSABLES: ClassVar[frozenset[Preprocessables]] = frozenset((
+        Preprocessables.DMG_AMOUNT_PLUS,
+    ))
 
     @override
     def _preprocess(
@@ -952,6 +999,9 @@ class CatalyzingFieldStatus(CombatStatus):
 @dataclass(frozen=True)
 class ChangingShiftsStatus(CombatStatus):
     COST_DEDUCTION: ClassVar[int] = 1
+    PREPROCESSABLES: ClassVar[frozenset[Preprocessables]] = frozenset((
+        Preprocessables.SWAP,
+    ))
 
     @override
     def _preprocess(
@@ -993,6 +1043,9 @@ class DendroCoreStatus(CombatStatus):
     """
     damage_boost: ClassVar[int] = 2
     usages: int = 1
+    PREPROCESSABLES: ClassVar[frozenset[Preprocessables]] = frozenset((
+        Preprocessables.DMG_AMOUNT_PLUS,
+    ))
 
     @override
     def _preprocess(
@@ -1035,6 +1088,9 @@ class FrozenStatus(CharacterStatus):
     REACTABLE_SIGNALS: ClassVar[frozenset[TriggeringSignal]] = frozenset((
         TriggeringSignal.ROUND_END,
     ))
+    PREPROCESSABLES: ClassVar[frozenset[Preprocessables]] = frozenset((
+        Preprocessables.DMG_AMOUNT_PLUS,
+    ))
 
     @override
     def _preprocess(
@@ -1067,6 +1123,10 @@ class FrozenStatus(CharacterStatus):
 
 @dataclass(frozen=True)
 class LeaveItToMeStatus(CombatStatus):
+    PREPROCESSABLES: ClassVar[frozenset[Preprocessables]] = frozenset((
+        Preprocessables.SWAP,
+    ))
+
     @override
     def _preprocess(
             self,
@@ -1108,6 +1168,9 @@ class JueyunGuobaStatus(CharacterStatus, _UsageStatus):
     REACTABLE_SIGNALS: ClassVar[frozenset[TriggeringSignal]] = frozenset((
         TriggeringSignal.ROUND_END,
     ))
+    PREPROCESSABLES: ClassVar[frozenset[Preprocessables]] = frozenset((
+        Preprocessables.DMG_AMOUNT_PLUS,
+    ))
 
     @override
     def _preprocess(
@@ -1164,6 +1227,9 @@ class MintyMeatRollsStatus(CharacterStatus, _UsageStatus):
     REACTABLE_SIGNALS: ClassVar[frozenset[TriggeringSignal]] = frozenset((
         TriggeringSignal.ROUND_END,
     ))
+    PREPROCESSABLES: ClassVar[frozenset[Preprocessables]] = frozenset((
+        Preprocessables.SKILL,
+    ))
 
     @override
     def _preprocess(
@@ -1229,6 +1295,9 @@ class NorthernSmokedChickenStatus(CharacterStatus):
     REACTABLE_SIGNALS: ClassVar[frozenset[TriggeringSignal]] = frozenset((
         TriggeringSignal.ROUND_END,
     ))
+    PREPROCESSABLES: ClassVar[frozenset[Preprocessables]] = frozenset((
+        Preprocessables.SKILL,
+    ))
 
     @override
     def _preprocess(
@@ -1290,6 +1359,9 @@ class AratakiIchibanStatus(TalentEquipmentStatus, _UsageStatus):
     REACTABLE_SIGNALS: ClassVar[frozenset[TriggeringSignal]] = frozenset((
         TriggeringSignal.ROUND_END,
     ))
+    INFORMABLES: ClassVar[frozenset[Informables]] = frozenset((
+        Informables.SKILL_USAGE,
+    ))
 
     @staticmethod
     def _auto_destroy() -> bool:
@@ -1341,6 +1413,9 @@ class RagingOniKing(CharacterStatus, _InfusionStatus):
         TriggeringSignal.COMBAT_ACTION,
         TriggeringSignal.ROUND_END,
     ))
+    INFORMABLES: ClassVar[frozenset[Informables]] = frozenset((
+        Informables.SKILL_USAGE,
+    ))
 
     @override
     def _inform(
@@ -1382,6 +1457,10 @@ class SuperlativeSuperstrengthStatus(CharacterStatus, _UsageStatus):
     DAMAGE_BOOST: ClassVar[int] = 1
     TALENT_DAMAGE_BOOST: ClassVar[int] = 1
     COST_DEDUCTION: ClassVar[int] = 1
+    PREPROCESSABLES: ClassVar[frozenset[Preprocessables]] = frozenset((
+        Preprocessables.SKILL,
+        Preprocessables.DMG_AMOUNT_PLUS,
+    ))
 
     @override
     def _preprocess(
@@ -1568,6 +1647,13 @@ class MidareRanzanStatus(CharacterStatus):
     REACTABLE_SIGNALS: ClassVar[frozenset[TriggeringSignal]] = frozenset((
         TriggeringSignal.COMBAT_ACTION,
     ))
+    INFORMABLES: ClassVar[frozenset[Informables]] = frozenset((
+        Informables.SKILL_USAGE,
+    ))
+    PREPROCESSABLES: ClassVar[frozenset[Preprocessables]] = frozenset((
+        Preprocessables.DMG_ELEMENT,
+        Preprocessables.DMG_AMOUNT_PLUS,
+    ))
 
     @override
     def _inform(
@@ -1664,6 +1750,9 @@ class _PoeticsOfFuubutsuElementStatus(CombatStatus, _UsageStatus):
     _ELEM: Element
     _DMG_BOOST: ClassVar[int] = 1
     _BOOSTABLE_ELEMS: ClassVar[frozenset[Element]] = Reaction.SWIRL.value.reaction_elems[0]
+    PREPROCESSABLES: ClassVar[frozenset[Preprocessables]] = frozenset((
+        Preprocessables.DMG_AMOUNT_PLUS,
+    ))
 
     @override
     def _preprocess(
@@ -1761,6 +1850,9 @@ class ColdBloodedStrikeStatus(TalentEquipmentStatus):
         TriggeringSignal.COMBAT_ACTION,
         TriggeringSignal.ROUND_END,
     ))
+    INFORMABLES: ClassVar[frozenset[Informables]] = frozenset((
+        Informables.SKILL_USAGE,
+    ))
 
     @override
     def _inform(
@@ -1856,6 +1948,10 @@ class ExplosiveSparkStatus(CharacterStatus, _UsageStatus):
     MAX_USAGES: ClassVar[int] = 2
     DAMAGE_BOOST: ClassVar[int] = 1
     COST_DEDUCTION: ClassVar[int] = 1
+    PREPROCESSABLES: ClassVar[frozenset[Preprocessables]] = frozenset((
+        Preprocessables.SKILL,
+        Preprocessables.DMG_AMOUNT_PLUS,
+    ))
 
     @override
     def _preprocess(
@@ -1913,6 +2009,9 @@ class SparksnSplash(CombatStatus, _UsageStatus):
     REACTABLE_SIGNALS: ClassVar[frozenset[TriggeringSignal]] = frozenset((
         TriggeringSignal.COMBAT_ACTION,
     ))
+    INFORMABLES: ClassVar[frozenset[Informables]] = frozenset((
+        Informables.SKILL_USAGE,
+    ))
 
     @override
     def _inform(
@@ -1965,6 +2064,10 @@ class SparksnSplash(CombatStatus, _UsageStatus):
 
 @dataclass(frozen=True)
 class IllusoryBubbleStatus(CombatStatus):
+    PREPROCESSABLES: ClassVar[frozenset[Preprocessables]] = frozenset((
+        Preprocessables.DMG_AMOUNT_MUL,
+    ))
+
     @override
     def _preprocess(
             self,
@@ -1989,6 +2092,9 @@ class IllusoryTorrentStatus(HiddenStatus):
     REACTABLE_SIGNALS: ClassVar[frozenset[TriggeringSignal]] = frozenset((
         TriggeringSignal.ROUND_END,
     ))
+    PREPROCESSABLES: ClassVar[frozenset[Preprocessables]] = frozenset((
+        Preprocessables.SWAP,
+    ))
 
     @override
     def _preprocess(
@@ -2025,6 +2131,9 @@ class IllusoryTorrentStatus(HiddenStatus):
 @dataclass(frozen=True)
 class ProphecyOfSubmersionStatus(TalentEquipmentStatus):
     DMG_BOOST: ClassVar[int] = 2
+    PREPROCESSABLES: ClassVar[frozenset[Preprocessables]] = frozenset((
+        Preprocessables.DMG_AMOUNT_PLUS,
+    ))
 
     @override
     def _preprocess(
@@ -2066,6 +2175,9 @@ class StreamingSurgeStatus(TalentEquipmentStatus):
 @dataclass(frozen=True, kw_only=True)
 class KeenSightStatus(TalentEquipmentStatus):
     COST_DEDUCTION: ClassVar[int] = 1
+    PREPROCESSABLES: ClassVar[frozenset[Preprocessables]] = frozenset((
+        Preprocessables.SKILL,
+    ))
 
     @override
     def _preprocess(
@@ -2104,6 +2216,12 @@ class VijnanaSuffusionStatus(CharacterStatus, _UsageStatus):
     REACTABLE_SIGNALS: ClassVar[frozenset[TriggeringSignal]] = frozenset((
         TriggeringSignal.COMBAT_ACTION,
     ))
+    INFORMABLES: ClassVar[frozenset[Informables]] = frozenset((
+        Informables.DMG_DELT,
+    ))
+    PREPROCESSABLES: ClassVar[frozenset[Preprocessables]] = frozenset((
+        Preprocessables.DMG_ELEMENT,
+    ))
 
     @override
     def _inform(
@@ -2205,6 +2323,9 @@ class RainbowBladeworkStatus(CombatStatus, _UsageStatus):
     REACTABLE_SIGNALS: ClassVar[frozenset[TriggeringSignal]] = frozenset((
         TriggeringSignal.COMBAT_ACTION,
     ))
+    INFORMABLES: ClassVar[frozenset[Informables]] = frozenset((
+        Informables.SKILL_USAGE,
+    ))
 
     @override
     def _inform(
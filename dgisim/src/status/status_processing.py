@@ -1,5 +1,5 @@
 from __future__ import annotations
-from typing import Callable, TYPE_CHECKING
+from typing import Callable, Iterator, TypeVar, TYPE_CHECKING
 
 from ..effect import effect as eft
 from ..status import status as stt
@@ -15,9 +15,14 @@ from .enums import Preprocessables, Informables
 
 if TYPE_CHECKING:
     from ..card.card import Card
+    from ..status.statuses import Statuses
     from ..state.game_state import GameState
+    from ..state.player_state import PlayerState
+
+_StatusesT = TypeVar("_StatusesT", bound="Statuses")
 
 __all__ = [
+    "BatchedStatusProcessing",
     "StatusProcessing",
 ]
 
@@ -48,22 +53,21 @@ class StatusProcessing:
         return game_state
 
     @staticmethod
-    def loop_one_player_all_statuses(
-            game_state: GameState,
+    def player_statuses_in_order(
+            player: PlayerState,
             pid: Pid,
-            f: Callable[[GameState, stt.Status, StaticTarget], GameState]
-    ) -> GameState:
+    ) -> list[tuple[stt.Status, StaticTarget]]:
         """
-        Perform f on all statuses of player pid in order
-        f(game_state, status, status_source) -> game_state
+        Returns all statuses of player (as player pid) with their sources, in the
+        order they should be processed
         """
-        player = game_state.get_player(pid)
+        statuses_in_order: list[tuple[stt.Status, StaticTarget]] = []
 
         # characters first
         characters = player.get_characters()
         ordered_characters = characters.get_character_in_activity_order()
         for character in ordered_characters:
-            # get character's private statuses and add triggerStatusEffect to global effect_stack
+            # get character's private statuses
             statuses = character.get_all_statuses_ordered_flattened()
             character_id = character.get_id()
             target = StaticTarget(
@@ -72,7 +76,7 @@ class StatusProcessing:
                 character_id
             )
             for status in statuses:
-                game_state = f(game_state, status, target)
+                statuses_in_order.append((status, target))
 
         # hidden status
         hidden_statuses = player.get_hidden_statuses()
@@ -82,7 +86,7 @@ class StatusProcessing:
             -1,  # not used
         )
         for status in hidden_statuses:
-            game_state = f(game_state, status, target)
+            statuses_in_order.append((status, target))
 
         # combat status
         combat_statuses = player.get_combat_statuses()
@@ -92,7 +96,7 @@ class StatusProcessing:
             -1,  # not used
         )
         for status in combat_statuses:
-            game_state = f(game_state, status, target)
+            statuses_in_order.append((status, target))
 
         # summons
         summons = player.get_summons()
@@ -102,7 +106,7 @@ class StatusProcessing:
             -1,
         )
         for summon in summons:
-            game_state = f(game_state, summon, target)
+            statuses_in_order.append((summon, target))
 
         # supports
         supports = player.get_supports()
@@ -112,8 +116,23 @@ class StatusProcessing:
                 Zone.SUPPORTS,
                 support.sid,
             )
-            game_state = f(game_state, support, target)
+            statuses_in_order.append((support, target))
+
+        return statuses_in_order
 
+    @staticmethod
+    def loop_one_player_all_statuses(
+            game_state: GameState,
+            pid: Pid,
+            f: Callable[[GameState, stt.Status, StaticTarget], GameState]
+    ) -> GameState:
+        """
+        Perform f on all statuses of player pid in order
+        f(game_state, status, status_source) -> game_state
+        """
+        player = game_state.get_player(pid)
+        for status, target in StatusProcessing.player_statuses_in_order(player, pid):
+            game_state = f(game_state, status, target)
         return game_state
 
     @staticmethod
@@ -131,39 +150,60 @@ class StatusProcessing:
         return game_state
 
     @staticmethod
-    def trigger_all_statuses_effects(
-            game_state: GameState, pid: Pid, signal: TriggeringSignal
-    ) -> list[eft.Effect]:
+    def _loop_all_reactors(
+            game_state: GameState,
+            pid: Pid,
+            signal: TriggeringSignal | Preprocessables | Informables,
+            f: Callable[[GameState, stt.Status, StaticTarget], GameState]
+    ) -> GameState:
         """
-        Takes the current game_state, trigger all statuses in order of player pid
-        Returns the triggering effects in order (first to last)
+        Same as loop_all_statuses() but only statuses reacting to signal are visited
         """
-        effects: list[eft.Effect] = []
+        for player_pid in (pid, pid.other()):
+            reactors = game_state.get_player(player_pid).signal_reactors(player_pid, signal)
+            for status, target in reactors:
+                game_state = f(game_state, status, target)
+        return game_state
 
-        def f(game_state: GameState, status: stt.Status, target: StaticTarget) -> GameState:
-            nonlocal effects
-            if signal not in status.REACTABLE_SIGNALS:
-                return game_state
+    @staticmethod
+    def _trigger_status_effect(
+            status: stt.Status, target: StaticTarget, signal: TriggeringSignal
+    ) -> None | eft.Effect:
+        if isinstance(status, stt.PersonalStatus):
+            return eft.TriggerStatusEffect(target, type(status), signal)
 
-            if isinstance(status, stt.PersonalStatus):
-                effects.append(eft.TriggerStatusEffect(target, type(status), signal))
+        elif isinstance(status, stt.PlayerHiddenStatus):
+            return eft.TriggerHiddenStatusEffect(target.pid, type(status), signal)
 
-            elif isinstance(status, stt.PlayerHiddenStatus):
-                effects.append(eft.TriggerHiddenStatusEffect(target.pid, type(status), signal))
+        elif isinstance(status, stt.CombatStatus):
+            return eft.TriggerCombatStatusEffect(target.pid, type(status), signal)
 
-            elif isinstance(status, stt.CombatStatus):
-                effects.append(eft.TriggerCombatStatusEffect(target.pid, type(status), signal))
+        elif isinstance(status, sm.Summon):
+            return eft.TriggerSummonEffect(target.pid, type(status), signal)
 
-            elif isinstance(status, sm.Summon):
-                effects.append(eft.TriggerSummonEffect(target.pid, type(status), signal))
+        elif isinstance(status, sp.Support):
+            return eft.TriggerSupportEffect(target.pid, type(status), status.sid, signal)
 
-            elif isinstance(status, sp.Support):
-                effects.append(eft.TriggerSupportEffect(
-                    target.pid, type(status), status.sid, signal))
+        return None  # pragma: no cover
 
-            return game_state
+    @staticmethod
+    def trigger_all_statuses_effects(
+            game_state: GameState, pid: Pid, signal: TriggeringSignal
+    ) -> list[eft.Effect]:
+        """
+        Takes the current game_state, trigger all statuses in order of player pid
+        Returns the triggering effects in order (first to last)
 
-        StatusProcessing.loop_all_statuses(game_state, pid, f)
+        Only the statuses reacting to signal are visited, through the signal index
+        of each player. (see PlayerState.signal_reactors())
+        """
+        effects: list[eft.Effect] = []
+        for player_pid in (pid, pid.other()):
+            reactors = game_state.get_player(player_pid).signal_reactors(player_pid, signal)
+            for status, target in reactors:
+                effect = StatusProcessing._trigger_status_effect(status, target, signal)
+                if effect is not None:
+                    effects.append(effect)
         return effects
 
     @staticmethod
@@ -271,7 +311,7 @@ class StatusProcessing:
 
             return game_state
 
-        game_state = StatusProcessing.loop_all_statuses(game_state, pid, f)
+        game_state = StatusProcessing._loop_all_reactors(game_state, pid, pp_type, f)
         return game_state, item
 
     @staticmethod
@@ -289,5 +329,156 @@ class StatusProcessing:
                 info,
             )
 
-        game_state = StatusProcessing.loop_all_statuses(game_state, pid, f)
+        game_state = StatusProcessing._loop_all_reactors(game_state, pid, info_type, f)
         return game_state
+
+
+class BatchedStatusProcessing:
+    """
+    Runs several preprocess and inform passes over the statuses of both players
+    without rebuilding the game state after each status update.
+
+    The latest version of every status touched is kept here and later passes see
+    these versions; commit() then writes all of them to the game state at once.
+
+    The game state passed to the statuses during the passes doesn't reflect the
+    pending updates, so this should only be used when the statuses involved don't
+    read each other's changes from the game state. (e.g. within one damage, see
+    SpecificDamageEffect.VERIFY_BATCHED_STATUSES to check it)
+    """
+
+    def __init__(self, game_state: GameState, pid: Pid) -> None:
+        self._players = (
+            (pid, game_state.get_player(pid)),
+            (pid.other(), game_state.get_player(pid.other())),
+        )
+        # (source, status type) -> (original status, latest status or None if removed)
+        self._updates: dict[
+            tuple[StaticTarget, type[stt.Status]],
+            tuple[stt.Status, None | stt.Status],
+        ] = {}
+
+    def _reactors(
+            self, signal: Preprocessables | Informables
+    ) -> Iterator[tuple[stt.Status, StaticTarget]]:
+        """ the latest versions of the statuses reacting to signal, in processing order """
+        for player_pid, player in self._players:
+            for status, target in player.signal_reactors(player_pid, signal):
+                update = self._updates.get((target, type(status)))
+                if update is not None:
+                    latest = update[1]
+                    if latest is None:
+                        continue
+                    status = latest
+                yield status, target
+
+    def _record(
+            self, target: StaticTarget, status: stt.Status, new_status: None | stt.Status
+    ) -> None:
+        key = (target, type(status))
+        original = self._updates[key][0] if key in self._updates else status
+        self._updates[key] = (original, new_status)
+
+    def preprocess(
+            self,
+            game_state: GameState,
+            pp_type: Preprocessables,
+            item: PreprocessableEvent,
+    ) -> PreprocessableEvent:
+        for status, target in self._reactors(pp_type):
+            item, new_status = status.preprocess(game_state, target, item, pp_type)
+            if new_status is None or new_status != status:
+                assert new_status is None or type(status) == type(new_status)
+                self._record(target, status, new_status)
+        return item
+
+    def inform(
+            self,
+            game_state: GameState,
+            info_type: Informables,
+            info: InformableEvent,
+    ) -> None:
+        for status, target in self._reactors(info_type):
+            new_status = status.informed(game_state, target, info_type, info)
+            if new_status != status:
+                assert type(status) == type(new_status)
+                self._record(target, status, new_status)
+
+    def commit(self, game_state: GameState) -> GameState:
+        """ Returns game_state with all the status updates applied """
+        changes = [
+            (target, original, latest)
+            for (target, _), (original, latest) in self._updates.items()
+            if latest is None or latest != original
+        ]
+        if not changes:
+            return game_state
+        factory = game_state.factory()
+        for pid in (Pid.P1, Pid.P2):
+            player_changes = [change for change in changes if change[0].pid is pid]
+            if not player_changes:
+                continue
+            player = game_state.get_player(pid)
+            characters = player.get_characters()
+            hidden_statuses = player.get_hidden_statuses()
+            combat_statuses = player.get_combat_statuses()
+            summons = player.get_summons()
+            supports = player.get_supports()
+            for target, original, latest in player_changes:
+                if target.zone is Zone.CHARACTERS:
+                    assert isinstance(target.id, int)
+                    character = characters.get_by_id(target.id)
+                    if character is None:  # pragma: no cover
+                        continue
+                    if isinstance(original, stt.HiddenStatus):
+                        character = character.factory().f_hiddens(
+                            lambda ss: _updated_statuses(ss, original, latest)
+                        ).build()
+                    elif isinstance(original, stt.EquipmentStatus):
+                        character = character.factory().f_equipments(
+                            lambda ss: _updated_statuses(ss, original, latest)
+                        ).build()
+                    elif isinstance(original, stt.CharacterStatus):
+                        character = character.factory().f_character_statuses(
+                            lambda ss: _updated_statuses(ss, original, latest)
+                        ).build()
+                    else:  # pragma: no cover
+                        raise Exception("Not Reached")
+                    characters = characters.factory().character(character).build()
+                elif target.zone is Zone.HIDDEN_STATUSES:
+                    hidden_statuses = _updated_statuses(hidden_statuses, original, latest)
+                elif target.zone is Zone.COMBAT_STATUSES:
+                    combat_statuses = _updated_statuses(combat_statuses, original, latest)
+                elif target.zone is Zone.SUMMONS:
+                    assert isinstance(original, sm.Summon)
+                    if latest is None:
+                        summons = summons.remove_summon(type(original))
+                    else:
+                        assert isinstance(latest, sm.Summon)
+                        summons = summons.update_summon(latest, override=True)
+                elif target.zone is Zone.SUPPORTS:
+                    assert isinstance(original, sp.Support)
+                    if latest is None:
+                        supports = supports.remove_by_sid(original.sid)
+                    else:
+                        assert isinstance(latest, sp.Support)
+                        supports = supports.update_support(latest, override=True)
+            factory.player(
+                pid,
+                player.factory()
+                .characters(characters)
+                .hidden_statuses(hidden_statuses)
+                .combat_statuses(combat_statuses)
+                .summons(summons)
+                .supports(supports)
+                .build()
+            )
+        return factory.build()
+
+
+def _updated_statuses(
+        statuses: _StatusesT, original: stt.Status, latest: None | stt.Status
+) -> _StatusesT:
+    if latest is None:
+        return statuses.remove(type(original))
+    return statuses.update_status(latest, override=True)
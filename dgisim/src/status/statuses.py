@@ -4,6 +4,7 @@ from typing_extensions import Self
 
 from ..status import status as stt
 
+from ..helper.fingerprint import fingerprint_of
 from ..helper.quality_of_life import just
 
 __all__ = [
@@ -18,9 +19,12 @@ class Statuses:
     """
     A container for easy statuses managing.
     """
+    __slots__ = ("_statuses", "_hash", "_fingerprint")
 
     def __init__(self, statuses: tuple[stt.Status, ...]):
         self._statuses = statuses
+        self._hash: None | int = None
+        self._fingerprint: None | int = None
 
     def update_status(self, incoming_status: stt.Status, override: bool = False) -> Self:
         """
@@ -76,10 +80,22 @@ class Statuses:
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, Statuses):  # pragma: no cover
             return False
-        return self is other or self._statuses == other._statuses
+        if self is other:
+            return True
+        if self._hash is not None and other._hash is not None and self._hash != other._hash:
+            return False
+        return self._statuses == other._statuses
 
     def __hash__(self) -> int:
-        return hash(self._statuses)
+        if self._hash is None:
+            self._hash = hash(self._statuses)
+        return self._hash
+
+    def fingerprint(self) -> int:
+        """ Stable 64-bit fingerprint, see GameState.fingerprint() """
+        if self._fingerprint is None:
+            self._fingerprint = fingerprint_of(self._statuses)
+        return self._fingerprint
 
     def __str__(self) -> str:
         return '[' + ', '.join(map(str, self._statuses)) + ']'
@@ -92,6 +108,7 @@ class Statuses:
 
 
 class EquipmentStatuses(Statuses):
+    __slots__ = ()
     _CATEGORIES = (stt.TalentEquipmentStatus, stt.WeaponEquipmentStatus,
                    stt.ArtifactEquipmentStatus)
 
@@ -142,6 +142,9 @@ class _ConvertableAnemoSummon(_DestroyOnNumSummon):
         TriggeringSignal.COMBAT_ACTION,
         TriggeringSignal.END_ROUND_CHECK_OUT,
     ))
+    INFORMABLES: ClassVar[frozenset[Informables]] = frozenset((
+        Informables.DMG_DELT,
+    ))
 
     def _convertable(self) -> bool:
         return self.curr_elem is Element.ANEMO
@@ -273,6 +276,9 @@ class ChainsOfWardingThunderSummon(_DmgPerRoundSummon):
             TriggeringSignal.ROUND_END,
         )
     )
+    PREPROCESSABLES: ClassVar[frozenset[Preprocessables]] = frozenset((
+        Preprocessables.SWAP,
+    ))
 
     @override
     def _preprocess(
@@ -423,6 +429,10 @@ class UshiSummon(_DestoryOnEndNumSummon, stt.FixedShieldStatus):
         TriggeringSignal.END_ROUND_CHECK_OUT,
         TriggeringSignal.POST_DMG,
     ))
+    INFORMABLES: ClassVar[frozenset[Informables]] = frozenset((
+        Informables.DMG_DELT,
+        Informables.CHARACTER_DEATH,
+    ))
 
     @override
     @staticmethod
@@ -1,6 +1,7 @@
 from __future__ import annotations
 from typing import Iterator, Optional, TYPE_CHECKING, Union
 
+from ..helper.fingerprint import combine_fingerprints, fingerprint_of
 from ..helper.quality_of_life import just
 
 if TYPE_CHECKING:
@@ -15,10 +16,14 @@ class Summons:
     """
     A container for easy summons managing.
     """
+    __slots__ = ("_summons", "_max_num", "_hash", "_fingerprint")
+
     def __init__(self, summons: tuple[Summon, ...], max_num: int):
         assert len(summons) <= max_num
         self._summons = summons
         self._max_num = max_num
+        self._hash: None | int = None
+        self._fingerprint: None | int = None
 
     def get_summons(self) -> tuple[Summon, ...]:
         return self._summons
@@ -81,16 +86,31 @@ class Summons:
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, type(self)):
             return False
-        return self is other or (
+        if self is other:
+            return True
+        if self._hash is not None and other._hash is not None and self._hash != other._hash:
+            return False
+        return (
             self._summons == other._summons
             and self._max_num == other._max_num
         )
 
     def __hash__(self) -> int:
-        return hash((
-            self._summons,
-            self._max_num,
-        ))
+        if self._hash is None:
+            self._hash = hash((
+                self._summons,
+                self._max_num,
+            ))
+        return self._hash
+
+    def fingerprint(self) -> int:
+        """ Stable 64-bit fingerprint, see GameState.fingerprint() """
+        if self._fingerprint is None:
+            self._fingerprint = combine_fingerprints(
+                fingerprint_of(self._max_num),
+                map(fingerprint_of, self._summons),
+            )
+        return self._fingerprint
 
     def dict_str(self) -> dict:
         return dict(
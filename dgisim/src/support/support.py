@@ -65,6 +65,9 @@ class XudongSupport(Support):
     REACTABLE_SIGNALS: ClassVar[frozenset[TriggeringSignal]] = frozenset((
         TriggeringSignal.ROUND_END,
     ))
+    PREPROCESSABLES: ClassVar[frozenset[Preprocessables]] = frozenset((
+        Preprocessables.CARD,
+    ))
 
     @override
     def _preprocess(
@@ -107,6 +110,10 @@ class XudongSupport(Support):
 
 @dataclass(frozen=True, kw_only=True)
 class KnightsOfFavoniusLibrarySupport(Support):
+    PREPROCESSABLES: ClassVar[frozenset[Preprocessables]] = frozenset((
+        Preprocessables.ROLL_CHANCES,
+    ))
+
     @override
     def _preprocess(
             self,
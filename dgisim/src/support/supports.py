@@ -1,6 +1,7 @@
 from __future__ import annotations
 from typing import Iterator
 
+from ..helper.fingerprint import combine_fingerprints, fingerprint_of
 from ..helper.quality_of_life import just
 from .support import Support
 
@@ -12,10 +13,14 @@ class Supports:
     """
     A container for easy supports managing.
     """
+    __slots__ = ("_supports", "_max_num", "_hash", "_fingerprint")
+
     def __init__(self, supports: tuple[Support, ...], max_num: int):
         assert len(supports) <= max_num
         self._supports = supports
         self._max_num = max_num
+        self._hash: None | int = None
+        self._fingerprint: None | int = None
 
     def get_supports(self) -> tuple[Support, ...]:
         return self._supports
@@ -120,16 +125,31 @@ class Supports:
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, type(self)):
             return False
-        return self is other or (
+        if self is other:
+            return True
+        if self._hash is not None and other._hash is not None and self._hash != other._hash:
+            return False
+        return (
             self._supports == other._supports
             and self._max_num == other._max_num
         )
 
     def __hash__(self) -> int:
-        return hash((
-            self._supports,
-            self._max_num,
-        ))
+        if self._hash is None:
+            self._hash = hash((
+                self._supports,
+                self._max_num,
+            ))
+        return self._hash
+
+    def fingerprint(self) -> int:
+        """ Stable 64-bit fingerprint, see GameState.fingerprint() """
+        if self._fingerprint is None:
+            self._fingerprint = combine_fingerprints(
+                fingerprint_of(self._max_num),
+                map(fingerprint_of, self._supports),
+            )
+        return self._fingerprint
 
     def dict_str(self) -> dict:
         return dict(
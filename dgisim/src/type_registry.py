@@ -0,0 +1,131 @@
+"""
+This file contains the registry assigning dense integer ids to the types of
+cards, characters, statuses, summons and supports.
+
+The ids are stable across processes (types are sorted by name) and only change
+when the set of types of the mode changes, which is detectable by the version
+stamp of the registry.
+"""
+from __future__ import annotations
+from types import ModuleType
+from typing import Any, Generic, Iterator, TypeVar, TYPE_CHECKING
+
+from .helper.fingerprint import zobrist_key
+
+if TYPE_CHECKING:
+    from .card.card import Card
+    from .character.character import Character
+    from .mode import Mode
+    from .status.status import Status
+    from .summon.summon import Summon
+    from .support.support import Support
+
+__all__ = [
+    "TypeIndex",
+    "TypeRegistry",
+]
+
+_T = TypeVar("_T")
+
+
+class TypeIndex(Generic[_T]):
+    """
+    A fixed set of types, each with a dense id in range(len(self)).
+    """
+    __slots__ = ("_types", "_ids")
+
+    def __init__(self, types: frozenset[type[_T]]) -> None:
+        self._types: tuple[type[_T], ...] = tuple(sorted(
+            types,
+            key=lambda t: (t.__module__, t.__qualname__),
+        ))
+        self._ids: dict[type[_T], int] = {
+            t: i
+            for i, t in enumerate(self._types)
+        }
+
+    def id_of(self, t: type[_T]) -> int:
+        """ raises KeyError if t is not indexed """
+        return self._ids[t]
+
+    def type_of(self, id: int) -> type[_T]:
+        return self._types[id]
+
+    def types(self) -> tuple[type[_T], ...]:
+        return self._types
+
+    def __contains__(self, t: object) -> bool:
+        return t in self._ids
+
+    def __iter__(self) -> Iterator[type[_T]]:
+        return iter(self._types)
+
+    def __len__(self) -> int:
+        return len(self._types)
+
+
+def _types_defined_in(module: ModuleType, base: type[_T]) -> frozenset[type[_T]]:
+    return frozenset(
+        obj
+        for obj in vars(module).values()
+        if isinstance(obj, type)
+        and issubclass(obj, base)
+        and obj.__module__ == module.__name__
+    )
+
+
+class TypeRegistry:
+    """
+    The type indices of a mode, get it with Mode.type_registry().
+
+    Cards and characters are the ones of the mode, statuses, summons and
+    supports are all the ones defined in the corresponding modules.
+    """
+    __slots__ = ("cards", "characters", "statuses", "summons", "supports", "version")
+
+    _REGISTRIES: dict[type[Mode], TypeRegistry] = {}
+
+    def __init__(
+            self,
+            cards: frozenset[type[Card]],
+            characters: frozenset[type[Character]],
+            statuses: frozenset[type[Status]],
+            summons: frozenset[type[Summon]],
+            supports: frozenset[type[Support]],
+    ) -> None:
+        self.cards: TypeIndex[Card] = TypeIndex(cards)
+        self.characters: TypeIndex[Character] = TypeIndex(characters)
+        self.statuses: TypeIndex[Status] = TypeIndex(statuses)
+        self.summons: TypeIndex[Summon] = TypeIndex(summons)
+        self.supports: TypeIndex[Support] = TypeIndex(supports)
+        indices: tuple[tuple[str, TypeIndex[Any]], ...] = (
+            ("cards", self.cards),
+            ("characters", self.characters),
+            ("statuses", self.statuses),
+            ("summons", self.summons),
+            ("supports", self.supports),
+        )
+        #: stable 64-bit stamp of all the ids of this registry
+        self.version: int = zobrist_key(*(
+            part
+            for category, index in indices
+            for part in (category, *(t.__qualname__ for t in index))
+        ))
+
+    @classmethod
+    def of_mode(cls, mode: Mode) -> TypeRegistry:
+        """ the registry is built once per mode type and shared afterwards """
+        registry = cls._REGISTRIES.get(type(mode))
+        if registry is None:
+            from .status import status as stt
+            from .summon import summon as sm
+            from .support import support as sp
+            registry = cls(
+                cards=mode.all_cards(),
+                characters=mode.all_chars(),
+                statuses=_types_defined_in(stt, stt.Status),
+                summons=_types_defined_in(sm, sm.Summon),
+                supports=_types_defined_in(sp, sp.Support),
+            )
+            cls._REGISTRIES[type(mode)] = registry
+        return registry
@@ -0,0 +1,54 @@
+import unittest
+
+from dgisim.src.action.action import CardsSelectAction, DicesSelectAction
+from dgisim.src.action.action_generator_generator import *
+from dgisim.src.card.card import Starsigns, SweetMadame
+from dgisim.src.card.cards import Cards
+from dgisim.src.dices import ActualDices
+from dgisim.src.element import Element
+from dgisim.src.state.enums import Pid
+from dgisim.tests.helpers.game_state_templates import ACTION_TEMPLATE
+
+
+class TestActionGeneratorGenerator(unittest.TestCase):
+    def test_distinct_dices_selection(self):
+        game_state = ACTION_TEMPLATE.factory().f_player1(
+            lambda p: p.factory().dices(ActualDices({Element.PYRO: 2, Element.CRYO: 1})).build()
+        ).build()
+        action_generator = DicesSelectionActGenGenerator.action_generator(game_state, Pid.P1)
+        assert action_generator is not None
+        choices = action_generator.distinct_choices()
+        self.assertEqual(len(choices), 6)
+        self.assertEqual(len(set(dices for dices, _ in choices)), 6)
+        self.assertEqual(sum(num for _, num in choices), 2 ** 3)
+        self.assertIn((ActualDices({Element.PYRO: 1}), 2), choices)
+        for dices, _ in choices:
+            action = action_generator.choose(dices).generate_action()
+            self.assertIsInstance(action, DicesSelectAction)
+
+    def test_distinct_cards_selection(self):
+        game_state = ACTION_TEMPLATE.factory().f_player1(
+            lambda p: p.factory().hand_cards(Cards({Starsigns: 3, SweetMadame: 1})).build()
+        ).build()
+        action_generator = CardsSelectionActGenGenerator.action_generator(game_state, Pid.P1)
+        assert action_generator is not None
+        choices = action_generator.distinct_choices()
+        self.assertEqual(len(choices), 4 * 2)
+        self.assertEqual(sum(num for _, num in choices), 2 ** 4)
+        self.assertIn((Cards({Starsigns: 2, SweetMadame: 1}), 3), choices)
+        for cards, _ in choices:
+            action = action_generator.choose(cards).generate_action()
+            self.assertIsInstance(action, CardsSelectAction)
+
+    def test_distinct_cards_to_play(self):
+        game_state = ACTION_TEMPLATE.factory().f_player1(
+            lambda p: p.factory().hand_cards(Cards({Starsigns: 2})).build()
+        ).build()
+        action_generator = CardActGenGenerator.action_generator(game_state, Pid.P1)
+        assert action_generator is not None
+        self.assertEqual(action_generator.distinct_choices(), ((Starsigns, 2),))
+
+    def test_distinct_choices_unavailable(self):
+        action_generator = ACTION_TEMPLATE.action_generator(Pid.P1)
+        assert action_generator is not None
+        self.assertRaises(NotImplementedError, action_generator.distinct_choices)
@@ -0,0 +1,113 @@
+import unittest
+
+import numpy as np
+
+from dgisim.src.action.action import *
+from dgisim.src.action.action_space import ActionSpace
+from dgisim.src.agents import RandomAgent
+from dgisim.src.card.card import Starsigns
+from dgisim.src.card.cards import Cards
+from dgisim.src.dices import ActualDices
+from dgisim.src.element import Element
+from dgisim.src.env import VecEnv
+from dgisim.src.game_state_machine import GameStateMachine
+from dgisim.src.mode import DefaultMode
+from dgisim.src.state.enums import Pid
+from dgisim.src.state.game_state import GameState
+from dgisim.tests.helpers.game_state_templates import ACTION_TEMPLATE
+
+
+def _decision_states(seed: int) -> list[GameState]:
+    state_machine = GameStateMachine(
+        GameState.from_default(seed=seed), RandomAgent(seed), RandomAgent(seed + 1)
+    )
+    while not state_machine.game_end():
+        state_machine.one_step()
+    return [
+        game_state
+        for game_state in state_machine.get_history()
+        if not game_state.game_end() and game_state.waiting_for() is not None
+    ]
+
+
+class TestActionSpace(unittest.TestCase):
+    def test_layout(self):
+        space = DefaultMode().action_space()
+        self.assertIs(space, ActionSpace.of_mode(DefaultMode()))
+        start = 0
+        for segment in space.segments:
+            self.assertEqual(segment.start, start)
+            start = segment.stop
+        self.assertEqual(space.size, start)
+        self.assertEqual(space.segment("end_round").size, 1)
+        self.assertEqual(ActionSpace(DefaultMode()).version, space.version)
+
+    def test_index_of(self):
+        space = DefaultMode().action_space()
+        game_state = ACTION_TEMPLATE.factory().f_player1(
+            lambda p: p.factory().hand_cards(Cards({Starsigns: 1})).dices(
+                ActualDices({Element.OMNI: 2, Element.PYRO: 3})
+            ).build()
+        ).build()
+        end_round = space.index_of(EndRoundAction(), game_state, Pid.P1)
+        self.assertEqual(end_round, space.segment("end_round").start)
+
+        dices_select = space.segment("dices_select").start
+        self.assertEqual(
+            space.index_of(DicesSelectAction(selected_dices=ActualDices({})), game_state, Pid.P1),
+            dices_select,
+        )
+        all_pyro = space.index_of(
+            DicesSelectAction(selected_dices=ActualDices({Element.PYRO: 3})), game_state, Pid.P1
+        )
+        assert all_pyro is not None
+        self.assertGreater(all_pyro, dices_select)
+        # rerolling only some of the PYRO dices is outside the space
+        self.assertIsNone(space.index_of(
+            DicesSelectAction(selected_dices=ActualDices({Element.PYRO: 2})), game_state, Pid.P1
+        ))
+
+        char_ids = [char.get_id() for char in game_state.get_player1().get_characters()]
+        swaps = [
+            space.index_of(
+                SwapAction(char_id=char_id, instruction=DiceOnlyInstruction(dices=ActualDices({}))),
+                game_state,
+                Pid.P1,
+            )
+            for char_id in char_ids
+        ]
+        self.assertEqual(swaps, list(range(space.segment("swap").start, space.segment("swap").stop)))
+
+    def test_legal_indices(self):
+        space = DefaultMode().action_space()
+        for seed in range(3):
+            for game_state in _decision_states(seed):
+                pid = game_state.waiting_for()
+                assert pid is not None
+                indices = game_state.legal_action_indices(pid)
+                self.assertIs(game_state.legal_action_indices(pid), indices)
+                self.assertTrue(indices)
+                legal_actions = game_state.legal_actions(pid)
+                for index, action in indices.items():
+                    self.assertTrue(0 <= index < space.size)
+                    self.assertIn(action, legal_actions)
+                    self.assertIs(space.decode(index, game_state), action)
+                    self.assertEqual(space.index_of(action, game_state, pid), index)
+                illegal = next(i for i in range(space.size) if i not in indices)
+                self.assertRaises(ValueError, space.decode, illegal, game_state, pid)
+
+    def test_mask(self):
+        space = DefaultMode().action_space()
+        for game_state in _decision_states(5)[:50]:
+            pid = game_state.waiting_for()
+            assert pid is not None
+            mask = game_state.legal_action_mask(pid)
+            self.assertEqual(mask.shape, (space.size,))
+            self.assertEqual(sorted(np.flatnonzero(mask)), sorted(game_state.legal_action_indices(pid)))
+
+        with VecEnv(2, flat_actions=True) as env:
+            batch = env.reset(seeds=[0, 1])
+            for _ in range(30):
+                batch = env.step([int(np.flatnonzero(mask)[0]) for mask in batch.masks])
+                for mask, actions in zip(batch.masks, batch.legal_actions):
+                    self.assertTrue(0 < mask.sum() <= len(actions))
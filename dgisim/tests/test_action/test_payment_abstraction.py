@@ -0,0 +1,66 @@
+import unittest
+
+from dgisim.src.action.action import SkillAction
+from dgisim.src.action.enums import ActionType
+from dgisim.src.action.payment_abstraction import *
+from dgisim.src.character.enums import CharacterSkill
+from dgisim.src.dices import AbstractDices, ActualDices
+from dgisim.src.element import Element
+from dgisim.src.state.enums import Pid
+from dgisim.tests.helpers.game_state_templates import ACTION_TEMPLATE
+
+
+class TestPaymentAbstraction(unittest.TestCase):
+    def test_canonical_payments(self):
+        dices = ActualDices({
+            Element.OMNI: 1,
+            Element.PYRO: 2,
+            Element.CRYO: 1,
+            Element.DENDRO: 1,
+            Element.GEO: 1,
+        })
+        char_elems = frozenset({Element.PYRO, Element.HYDRO})
+        requirement = AbstractDices({Element.ANY: 2})
+        payments = canonical_payments(dices, requirement, char_elems)
+        self.assertEqual(len(dices.minimal_payments(requirement, char_elems)), 11)
+        self.assertEqual(len(payments), 5)
+        self.assertEqual(
+            len(set(payment_class(payment, char_elems) for payment in payments)),
+            len(payments),
+        )
+        for payment in payments:
+            self.assertTrue(payment.just_satisfy(requirement))
+            self.assertTrue((dices - payment).is_legal())
+        # the cheapest class comes first
+        self.assertEqual(payments[0].num_dices(), 2)
+        self.assertEqual(payments[0][Element.OMNI], 0)
+        self.assertEqual(payments[0][Element.PYRO], 0)
+
+        requirement = AbstractDices({Element.OMNI: 2})
+        self.assertEqual(
+            set(canonical_payments(dices, requirement, char_elems)),
+            {
+                ActualDices({Element.PYRO: 2}),
+                ActualDices({Element.OMNI: 1, Element.PYRO: 1}),
+                ActualDices({Element.OMNI: 1, Element.DENDRO: 1}),
+            },
+        )
+
+    def test_abstract_choices(self):
+        game_state = ACTION_TEMPLATE
+        action_generator = game_state.action_generator(Pid.P1)
+        assert action_generator is not None
+        self.assertEqual(abstract_choices(action_generator), action_generator.choices())
+        action_generator = action_generator.choose(ActionType.CAST_SKILL)
+        action_generator = action_generator.choose(CharacterSkill.NORMAL_ATTACK)
+        choices = abstract_choices(action_generator)
+        self.assertIsInstance(action_generator.choices(), AbstractDices)
+        assert isinstance(choices, tuple)
+        self.assertGreater(len(choices), 0)
+        for payment in choices:
+            assert isinstance(payment, ActualDices)
+            filled_generator = action_generator.choose(payment)
+            self.assertTrue(filled_generator.filled())
+            action = filled_generator.generate_action()
+            self.assertIsInstance(action, SkillAction)
+            self.assertIsNotNone(game_state.action_step(Pid.P1, action))
@@ -0,0 +1,132 @@
+import gc
+import unittest
+from concurrent.futures import Future, ProcessPoolExecutor
+from unittest.mock import patch
+
+from dgisim.src.agents import RandomAgent
+from dgisim.src.batch import *
+from dgisim.src.card.card import *
+from dgisim.src.character.character import *
+from dgisim.src.deck import FrozenDeck
+from dgisim.src.helper.hashable_dict import HashableDict
+from dgisim.src.state.enums import Pid
+
+_DECK = FrozenDeck(
+    chars=(Keqing, Kaeya, AratakiItto),
+    cards=HashableDict({
+        ThunderingPenance: 2,
+        ColdBloodedStrike: 2,
+        AratakiIchiban: 2,
+        RavenBow: 2,
+        MagicGuide: 1,
+        WhiteIronGreatsword: 1,
+        WhiteTassel: 2,
+        TravelersHandySword: 2,
+        Xudong: 2,
+        KnightsOfFavoniusLibrary: 2,
+        IHaventLostYet: 2,
+        JueyunGuoba: 2,
+        LotusFlowerCrisp: 2,
+        TeyvatFriedEgg: 2,
+        Starsigns: 2,
+        LeaveItToMe: 2,
+    }),
+)
+
+
+class TestBatch(unittest.TestCase):
+    def test_run_batch(self):
+        results = list(run_batch(
+            [(_DECK, _DECK)], RandomAgent, RandomAgent, 3, seed=1, workers=1, chunk_size=2,
+        ))
+        self.assertEqual(sorted(result.game for result in results), [0, 1, 2])
+        self.assertEqual(len(set(result.seed for result in results)), 3)
+        for result in results:
+            self.assertFalse(result.crashed(), result.error)
+            self.assertGreater(result.rounds, 0)
+
+        # games are reproducible from the batch seed or the game seed
+        self.assertEqual(results, list(run_batch(
+            [(_DECK, _DECK)], RandomAgent, RandomAgent, 3, seed=1, workers=1, chunk_size=3,
+        )))
+        self.assertEqual(
+            play_game(results[1].seed, RandomAgent, RandomAgent, (_DECK, _DECK), game=1),
+            results[1],
+        )
+
+    def test_run_batch_in_workers(self):
+        results = list(run_batch(None, RandomAgent, RandomAgent, 2, seed=1, workers=2, chunk_size=1))
+        self.assertEqual(
+            sorted(results, key=lambda result: result.game),
+            list(run_batch(None, RandomAgent, RandomAgent, 2, seed=1, workers=1)),
+        )
+
+    def test_run_batch_stopped_early(self):
+        futures: list[Future] = []
+
+        class RecordingExecutor(ProcessPoolExecutor):
+            def submit(self, *args, **kwargs):
+                future = super().submit(*args, **kwargs)
+                futures.append(future)
+                return future
+
+        with patch("dgisim.src.batch.ProcessPoolExecutor", RecordingExecutor):
+            results = run_batch(None, RandomAgent, RandomAgent, 200, seed=1, workers=2, chunk_size=1)
+            next(results)
+            results.close()
+        self.assertEqual(len(futures), 200)
+        self.assertTrue(all(future.done() for future in futures))
+        # only the games already started were played
+        self.assertGreater(sum(future.cancelled() for future in futures), 100)
+
+    def test_failed_setup_is_a_crash(self):
+        def broken_agent(seed: int) -> RandomAgent:
+            raise ValueError("no agent")
+
+        results = list(run_batch(None, RandomAgent, broken_agent, 2, workers=1))
+        self.assertEqual(len(results), 2)
+        for result in results:
+            assert result.error is not None
+            self.assertIn("no agent", result.error)
+            self.assertIsNone(result.winner)
+
+    def test_worker_pool(self):
+        with WorkerPool(workers=2) as pool:
+            self.assertEqual(pool.num_workers(), 2)
+            self.assertEqual(gc.get_freeze_count(), 0)
+            # a batch stopped early doesn't hold up the next ones
+            stopped = pool.run_batch(None, RandomAgent, RandomAgent, 200, seed=1, chunk_size=1)
+            next(stopped)
+            stopped.close()
+            for seed in range(2):
+                results = sorted(
+                    pool.run_batch(None, RandomAgent, RandomAgent, 2, seed=seed, chunk_size=1),
+                    key=lambda result: result.game,
+                )
+                self.assertEqual(
+                    results,
+                    list(run_batch(None, RandomAgent, RandomAgent, 2, seed=seed, workers=1)),
+                )
+
+    def test_batch_summary(self):
+        def result(winner, error=None):
+            return GameResult(
+                deck_pair=0, game=0, seed=0, winner=winner, rounds=4,
+                damage_dealt=(10, 20), error=error,
+            )
+        summary = BatchSummary.of(
+            [result(Pid.P1)] * 6 + [result(Pid.P2)] * 2 + [result(None)] * 2
+            + [result(None, error="Traceback")]
+        )
+        self.assertEqual(summary.games, 11)
+        self.assertEqual(summary.finished(), 10)
+        self.assertEqual(summary.crashes, 1)
+        self.assertEqual(summary.draws, 2)
+        self.assertAlmostEqual(summary.win_rate(Pid.P1), 0.6)
+        self.assertAlmostEqual(summary.win_rate(Pid.P2), 0.2)
+        self.assertEqual(summary.mean_damage_dealt, (10, 20))
+        low, high = summary.confidence_interval(Pid.P1)
+        self.assertLess(low, 0.6)
+        self.assertGreater(high, 0.6)
+        self.assertAlmostEqual(low, 0.3127, places=3)
+        self.assertAlmostEqual(high, 0.8318, places=3)
@@ -62,3 +62,51 @@ class TestCards(unittest.TestCase):
         self.assertEqual(d[CardB], 1)
         self.assertEqual(d[CardC], 5)
         self.assertEqual(len(d), 2)
+
+    def test_pick_random_cards(self):
+        cards = Cards({CardA: 3, CardB: 1, OmniCard: 2})
+        left, picked = cards.pick_random_cards(4)
+        self.assertEqual(picked.num_cards(), 4)
+        self.assertEqual(left.num_cards(), 2)
+        self.assertEqual(left + picked, cards)
+        self.assertEqual(hash(left + picked), hash(cards))
+        left, picked = cards.pick_random_cards(10)
+        self.assertEqual(picked, cards)
+        self.assertTrue(left.empty())
+
+    def test_add_and_remove(self):
+        cards = Cards({CardA: 1}).add(CardC).add(CardC)
+        self.assertEqual(cards, Cards({CardA: 1, CardC: 2}))
+        self.assertEqual(cards.num_cards(), 3)
+        self.assertEqual(cards.remove(CardC).remove_all(CardA), Cards({CardC: 1}))
+        self.assertEqual(cards.remove_all(CardC).remove(CardA), Cards.from_empty())
+        self.assertEqual(set(cards), {CardA, CardC})
+
+    def test_pickle(self):
+        import pickle
+        cards = Cards({CardA: 1, OmniCard: 2})
+        self.assertEqual(pickle.loads(pickle.dumps(cards)), cards)
+
+    def test_order_independent_of_first_seen(self):
+        import random
+
+        class CardZ(Card):
+            pass
+
+        class CardY(Card):
+            pass
+
+        # CardZ gets its id first, but CardY sorts first
+        Cards({CardZ: 1})
+        cards = Cards({CardY: 1, CardZ: 1})
+        self.assertEqual(list(cards), [CardY, CardZ])
+        self.assertEqual(list(cards.to_dict()), [CardY, CardZ])
+
+        # the order is computed once per size until a new type is seen
+        from dgisim.src.card.cards import _INDEX
+        size = _INDEX.id_of(CardY) + 1
+        self.assertIs(_INDEX.ordered_ids(size), _INDEX.ordered_ids(size))
+
+        pos = random.Random(0).sample(range(2), k=1)[0]
+        _, picked = cards.pick_random_cards(1, random.Random(0))
+        self.assertEqual(list(picked), [[CardY, CardZ][pos]])
@@ -29,6 +29,21 @@ class TestDices(unittest.TestCase):
         dices = Dices({})
         self.assertNotEqual(dices, "dices")
 
+    def test_arithmetic(self):
+        dices = ActualDices({Element.PYRO: 2, Element.OMNI: 1})
+        self.assertEqual(dices, ActualDices({Element.PYRO: 2, Element.OMNI: 1, Element.GEO: 0}))
+        added = dices + {Element.GEO: 3}
+        self.assertIsInstance(added, ActualDices)
+        self.assertEqual(added.num_dices(), 6)
+        self.assertEqual(added - dices, ActualDices({Element.GEO: 3}))
+        self.assertFalse((dices - {Element.GEO: 1}).is_legal())
+        self.assertFalse(ActualDices({Element.ANY: 1}).is_legal())
+        self.assertEqual(
+            ActualDices({Element.ANY: 1, Element.GEO: -1, Element.PYRO: 1}).validify(),
+            ActualDices({Element.PYRO: 1}),
+        )
+        self.assertEqual(tuple(added.elems()), (Element.OMNI, Element.PYRO, Element.GEO))
+
     def test_to_dict(self):
         random_actual_dices = ActualDices.from_random(8)
         _dices = random_actual_dices._dices
@@ -192,6 +207,42 @@ class TestDices(unittest.TestCase):
                               Element.HYDRO: 1, Element.DENDRO: 3})
         self.assertIsNone(payment.basically_satisfy(requirement))
 
+    def test_minimal_payments(self):
+        payment = ActualDices({Element.OMNI: 1, Element.PYRO: 2, Element.GEO: 1})
+        self.assertEqual(
+            payment.minimal_payments(AbstractDices({Element.PYRO: 2})),
+            (
+                ActualDices({Element.PYRO: 2}),
+                ActualDices({Element.PYRO: 1, Element.OMNI: 1}),
+            ),
+        )
+
+        payment = ActualDices({Element.OMNI: 1, Element.PYRO: 1, Element.GEO: 1})
+        self.assertEqual(
+            payment.minimal_payments(
+                AbstractDices({Element.ANY: 2}),
+                priority_elems=frozenset({Element.PYRO}),
+            ),
+            (
+                ActualDices({Element.PYRO: 1, Element.GEO: 1}),
+                ActualDices({Element.GEO: 1, Element.OMNI: 1}),
+                ActualDices({Element.PYRO: 1, Element.OMNI: 1}),
+            ),
+        )
+        self.assertEqual(payment.minimal_payments(AbstractDices({Element.OMNI: 2})), (
+            ActualDices({Element.PYRO: 1, Element.OMNI: 1}),
+            ActualDices({Element.GEO: 1, Element.OMNI: 1}),
+        ))
+        self.assertEqual(payment.minimal_payments(AbstractDices({Element.ANY: 4})), ())
+
+        # every basic payment is one of the minimal payments
+        requirement = AbstractDices({Element.CRYO: 1, Element.ANY: 2})
+        payment = ActualDices({Element.CRYO: 2, Element.ANEMO: 1, Element.OMNI: 2})
+        self.assertIn(
+            payment.basically_satisfy(requirement),
+            payment.minimal_payments(requirement),
+        )
+
     def test_ordered_actual_dices(self):
         dices = ActualDices({
             Element.HYDRO: 1,
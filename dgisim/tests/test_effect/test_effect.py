@@ -1,10 +1,15 @@
 import unittest
 
+from dgisim.src.agents import RandomAgent
 from dgisim.src.effect.effect import *
 from dgisim.src.effect.effect_stack import EffectStack
 from dgisim.src.effect.enums import Zone
-from dgisim.src.effect.structs import StaticTarget
+from dgisim.src.effect.structs import DamageType, StaticTarget
+from dgisim.src.element import Element
+from dgisim.src.game_state_machine import GameStateMachine
 from dgisim.src.state.enums import Pid, Act
+from dgisim.src.state.game_state import GameState
+from dgisim.src.status.status import CatalyzingFieldStatus, CrystallizeStatus
 from dgisim.tests.helpers.game_state_templates import *
 
 
@@ -171,3 +176,42 @@ class TestEffect(unittest.TestCase):
         c = game_state.get_player1().get_characters().get_character(1)
         assert c is not None
         self.assertEqual(c.get_energy(), 0)
+
+    def test_specific_damage_effect_with_statuses(self):
+        # the boost of P1 and the shield of P2 are both used up by one damage
+        game_state = ACTION_TEMPLATE.factory().f_player1(
+            lambda p: p.factory().f_combat_statuses(
+                lambda ss: ss.update_status(CatalyzingFieldStatus(usages=1))
+            ).build()
+        ).f_player2(
+            lambda p: p.factory().f_combat_statuses(
+                lambda ss: ss.update_status(CrystallizeStatus(usages=1))
+            ).build()
+        ).f_effect_stack(
+            lambda es: es.push_one(SpecificDamageEffect(
+                source=StaticTarget(Pid.P1, Zone.CHARACTERS, 1),
+                target=StaticTarget(Pid.P2, Zone.CHARACTERS, 1),
+                element=Element.ELECTRO,
+                damage=3,
+                damage_type=DamageType(elemental_skill=True),
+            ))
+        ).build()
+        target_before = game_state.get_player2().get_characters().just_get_character(1)
+        game_state = game_state.step()
+        target_after = game_state.get_player2().get_characters().just_get_character(1)
+        self.assertEqual(target_before.get_hp() - target_after.get_hp(), 3)
+        self.assertNotIn(CatalyzingFieldStatus, game_state.get_player1().get_combat_statuses())
+        self.assertNotIn(CrystallizeStatus, game_state.get_player2().get_combat_statuses())
+
+    def test_batched_statuses_match_status_by_status(self):
+        verify = SpecificDamageEffect.VERIFY_BATCHED_STATUSES
+        SpecificDamageEffect.VERIFY_BATCHED_STATUSES = True
+        try:
+            for seed in range(10):
+                state_machine = GameStateMachine(
+                    GameState.from_default(seed=seed), RandomAgent(seed), RandomAgent(seed + 1),
+                )
+                while not state_machine.game_end():
+                    state_machine.one_step()
+        finally:
+            SpecificDamageEffect.VERIFY_BATCHED_STATUSES = verify
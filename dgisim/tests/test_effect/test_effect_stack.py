@@ -97,3 +97,28 @@ class TestEffectStack(unittest.TestCase):
         x.add(effect_stack_a1)
         x.add(effect_stack_a2)
         self.assertEqual(len(x), 1)
+
+    def test_structural_sharing(self):
+        base = self.BASE_EFFECT_STACK
+        stack_a = base.push_one(IdEffect(id=3))
+        stack_b = base.push_many_fl((IdEffect(id=3), IdEffect(id=4)))
+        popped_a, effect_a = stack_a.pop()
+        self.assertEqual(effect_a.id, 3)  # type: ignore
+        self.assertEqual(popped_a, base)
+        self.assertEqual(len(base), 2)
+        self.assertEqual(len(stack_b), 4)
+        self.assertEqual(stack_b.peek().id, 3)  # type: ignore
+        self.assertEqual(base.peek().id, 2)  # type: ignore
+        self.assertEqual(
+            stack_b,
+            EffectStack((IdEffect(id=1), IdEffect(id=2), IdEffect(id=4), IdEffect(id=3))),
+        )
+        self.assertEqual(hash(popped_a), hash(base))
+        self.assertNotEqual(stack_a, stack_b)
+
+    def test_empty(self):
+        effect_stack = EffectStack(())
+        self.assertTrue(effect_stack.is_empty())
+        self.assertEqual(effect_stack, EffectStack(()).push_one(Effect()).pop()[0])
+        self.assertEqual(hash(effect_stack), hash(EffectStack(())))
+        self.assertEqual(effect_stack.dict_str(), {})
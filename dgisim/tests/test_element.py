@@ -33,3 +33,17 @@ class TestElement(unittest.TestCase):
         self.assertNotEqual(aura1, aura3)
         self.assertNotEqual(hash(aura1), hash(aura3))
         self.assertNotEqual(aura1, "aura1")
+
+        # react()
+        aura = ElementalAura.from_default().add(Element.DENDRO).add(Element.CRYO)
+        reaction, new_aura = aura.react(Element.PYRO)
+        self.assertEqual(reaction, ReactionDetail(Reaction.MELT, Element.CRYO, Element.PYRO))
+        self.assertEqual(new_aura, ElementalAura.from_default().add(Element.DENDRO))
+        reaction, new_aura = ElementalAura.from_default().react(Element.HYDRO)
+        self.assertIsNone(reaction)
+        self.assertIn(Element.HYDRO, new_aura)
+        reaction, new_aura = aura.react(Element.PHYSICAL)
+        self.assertIsNone(reaction)
+        self.assertIs(new_aura, aura)
+        self.assertEqual(aura, ElementalAura({Element.CRYO: True, Element.DENDRO: True}))
+        self.assertNotEqual(aura.fingerprint(), aura3.fingerprint())
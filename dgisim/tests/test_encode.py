@@ -0,0 +1,91 @@
+import pickle
+import unittest
+
+import numpy as np
+
+from dgisim.src.agents import RandomAgent
+from dgisim.src.encode import *
+from dgisim.src.env import VecEnv
+from dgisim.src.game_state_machine import GameStateMachine
+from dgisim.src.mode import DefaultMode
+from dgisim.src.state.enums import Pid
+from dgisim.src.state.game_state import GameState
+
+
+def _some_states() -> list[GameState]:
+    state_machine = GameStateMachine(GameState.from_default(seed=3), RandomAgent(1), RandomAgent(2))
+    while not state_machine.game_end():
+        state_machine.one_step()
+    history = state_machine.get_history()
+    return list(history[::max(1, len(history) // 20)])
+
+
+class TestObservationEncoder(unittest.TestCase):
+    def test_layout(self):
+        encoder = ObservationEncoder()
+        start = 0
+        for segment in encoder.segments:
+            self.assertEqual(segment.start, start)
+            start = segment.stop
+        self.assertEqual(encoder.size, start)
+        self.assertEqual(len({segment.name for segment in encoder.segments}), len(encoder.segments))
+
+        registry = DefaultMode().type_registry()
+        self.assertEqual(encoder.segment("self.hand_cards").size, len(registry.cards) + 1)
+        self.assertEqual(encoder.segment("oppo.char2.statuses").size, len(registry.statuses) + 1)
+        self.assertRaises(KeyError, encoder.segment, "self.char3.hp")
+
+        copy = pickle.loads(pickle.dumps(encoder))
+        self.assertEqual(copy.version, encoder.version)
+        self.assertEqual(copy.segments, encoder.segments)
+
+    def test_features(self):
+        encoder = ObservationEncoder()
+        for game_state in _some_states():
+            for pid in (Pid.P1, Pid.P2):
+                features = encoder.encode_list(game_state, pid)
+                self.assertEqual(len(features), encoder.size)
+
+                def seg(name: str) -> list[float]:
+                    segment = encoder.segment(name)
+                    return features[segment.start:segment.stop]
+
+                self.assertEqual(seg("round"), [game_state.get_round()])
+                for prefix, player in (
+                        ("self", game_state.get_player(pid)),
+                        ("oppo", game_state.get_other_player(pid)),
+                ):
+                    for i, char in enumerate(player.get_characters()):
+                        self.assertEqual(seg(f"{prefix}.char{i}.hp"), [char.get_hp()])
+                        self.assertEqual(seg(f"{prefix}.char{i}.alive"), [float(char.get_alive())])
+                        self.assertEqual(sum(seg(f"{prefix}.char{i}.type")), 1)
+                    self.assertEqual(sum(seg(f"{prefix}.dices")), player.get_dices().num_dices())
+                    self.assertEqual(
+                        sum(seg(f"{prefix}.hand_cards")), player.get_hand_cards().num_cards()
+                    )
+
+                # the opponent's hand is hidden
+                hand = seg("oppo.hand_cards")
+                self.assertFalse(any(hand[:-1]))
+                # encoding the perspective view is the same
+                self.assertEqual(
+                    encoder.encode_list(game_state.prespective_view(pid), pid), features
+                )
+
+    def test_encode_batch(self):
+        encoder = ObservationEncoder()
+        game_states = _some_states()
+        pids = [Pid.P1 if i % 2 == 0 else Pid.P2 for i in range(len(game_states))]
+        buffer = encoder.new_buffer(len(game_states) + 2)
+        buffer[:] = 7
+        out = encoder.encode_batch(game_states, pids, out=buffer)
+        self.assertIs(out, buffer)
+        self.assertEqual(out.dtype, np.float32)
+        for row, (game_state, pid) in enumerate(zip(game_states, pids)):
+            self.assertEqual(out[row].tolist(), encoder.encode_list(game_state, pid))
+            self.assertEqual(encoder(game_state, pid).tolist(), out[row].tolist())
+        self.assertTrue((out[len(game_states):] == 7).all())
+
+        with VecEnv(2, observe=encoder) as env:
+            batch = env.reset(seeds=[0, 1])
+            self.assertEqual(batch.observations[0].shape, (encoder.size,))
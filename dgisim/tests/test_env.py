@@ -0,0 +1,93 @@
+import random
+import unittest
+
+from dgisim.src.action.action import DiceOnlyInstruction, EndRoundAction, PlayerAction, SkillAction
+from dgisim.src.character.enums import CharacterSkill
+from dgisim.src.dices import ActualDices
+from dgisim.src.env import *
+from dgisim.src.state.enums import Pid
+from dgisim.src.state.game_state import GameState
+
+
+def _play(env: VecEnv, num_steps: int) -> list[tuple]:
+    rand = random.Random(0)
+    batch = env.reset(seeds=range(env.num_envs()))
+    log: list[tuple] = []
+    for _ in range(num_steps):
+        batch = env.step([rand.randrange(len(actions)) for actions in batch.legal_actions])
+        log.append((
+            tuple(batch.players),
+            tuple(batch.legal_actions),
+            tuple(batch.rewards),
+            tuple(batch.dones),
+            tuple(batch.winners),
+        ))
+    return log
+
+
+class TestVecEnv(unittest.TestCase):
+    def test_in_process(self):
+        with VecEnv(3) as env:
+            batch = env.reset(seeds=[1, 2, 3])
+            self.assertEqual(len(batch.observations), 3)
+            for obs, pid, actions, mask in zip(
+                    batch.observations, batch.players, batch.legal_actions, batch.masks
+            ):
+                self.assertIsInstance(obs, GameState)
+                self.assertIs(obs.waiting_for(), pid)
+                self.assertEqual(obs.legal_actions(pid), actions)
+                self.assertEqual(len(mask), len(actions))
+            self.assertEqual(batch.rewards, [(0.0, 0.0)] * 3)
+            self.assertEqual(batch.dones, [False] * 3)
+
+            # same seeds, same games
+            self.assertEqual(env.reset(seeds=[1, 2, 3]).observations, batch.observations)
+
+    def test_auto_reset(self):
+        with VecEnv(2) as env:
+            batch = env.reset(seeds=[4, 5])
+            num_done = 0
+            for _ in range(10000):
+                batch = env.step([
+                    actions.index(EndRoundAction()) if EndRoundAction() in actions else 0
+                    for actions in batch.legal_actions
+                ])
+                for done, winner, reward in zip(batch.dones, batch.winners, batch.rewards):
+                    if done:
+                        num_done += 1
+                        self.assertEqual(sum(reward), 0.0)
+                        if winner is not None:
+                            self.assertEqual(reward[winner is Pid.P2], 1.0)
+                    else:
+                        self.assertEqual(reward, (0.0, 0.0))
+                if num_done >= 2:
+                    break
+            self.assertGreaterEqual(num_done, 2)
+
+    def test_subprocess_matches_in_process(self):
+        with VecEnv(3) as env:
+            expected = _play(env, 20)
+        with VecEnv(3, workers=2) as env:
+            self.assertEqual(_play(env, 20), expected)
+
+    def test_illegal_actions(self):
+        with VecEnv(3) as env:
+            env.reset(seeds=[1, 2, 3])
+            expected = env.step([0] * 3)
+        for workers in (0, 2):
+            with VecEnv(3, workers=workers) as env:
+                batch = env.reset(seeds=[1, 2, 3])
+                illegal_actions: list[list[int | PlayerAction]] = [
+                    [0, 0, len(batch.legal_actions[2])],
+                    [0, -1, 0],
+                    # not in the card select phase
+                    [SkillAction(
+                        skill=CharacterSkill.NORMAL_ATTACK,
+                        instruction=DiceOnlyInstruction(dices=ActualDices({})),
+                    ), 0, 0],
+                ]
+                for actions in illegal_actions:
+                    with self.assertRaises(ValueError):
+                        env.step(actions)
+                # no environment was stepped, and no reply was left behind
+                self.assertEqual(env.step([0] * 3), expected)
@@ -1,9 +1,21 @@
 import unittest
 import random
+from unittest.mock import patch
 
 from dgisim.src.mode import DefaultMode
 from dgisim.src.state.game_state import GameState
 from dgisim.src.state.player_state import PlayerState
+from dgisim.src.action.action import *
+from dgisim.src.agents import RandomAgent
+from dgisim.src.card.card import Starsigns
+from dgisim.src.card.cards import Cards
+from dgisim.src.character.enums import CharacterSkill
+from dgisim.src.dices import ActualDices
+from dgisim.src.element import Element
+from dgisim.src.helper.quality_of_life import just
+from dgisim.src.state.enums import Pid
+from dgisim.tests.helpers.game_state_templates import ACTION_TEMPLATE
+from dgisim.tests.helpers.quality_of_life import auto_step
 
 
 class TestGameState(unittest.TestCase):
@@ -30,3 +42,167 @@ class TestGameState(unittest.TestCase):
         self.assertEqual(game_state1, game_state2)
         self.assertEqual(hash(game_state1), hash(game_state2))
         self.assertNotEqual(game_state1, "game_state1")
+
+    def test_cached_hash(self):
+        game_state = GameState.from_default()
+        h = hash(game_state)
+        self.assertEqual(game_state._hash, h)
+        self.assertEqual(hash(game_state), h)
+
+        # states differing deep in the tree are told apart after hashing
+        other_state = game_state.factory().f_player1(
+            lambda p: p.factory().f_characters(
+                lambda cs: cs.factory().active_character_id(2).build()
+            ).build()
+        ).build()
+        self.assertNotEqual(hash(other_state), h)
+        self.assertNotEqual(game_state, other_state)
+        self.assertEqual(other_state, other_state.factory().build())
+
+    def test_lazy_checkers(self):
+        game_state = GameState.from_default()
+        self.assertIsNone(game_state._card_checker)
+        checker = game_state.card_checker()
+        self.assertIs(game_state.card_checker(), checker)
+        self.assertFalse(hasattr(game_state, "__dict__"))
+
+    def test_memorized_costs(self):
+        card = Starsigns
+        game_state = ACTION_TEMPLATE.factory().f_player1(
+            lambda p: p.factory().hand_cards(Cards({card: 1})).build()
+        ).build()
+        cost = card.preprocessed_dice_cost(game_state, Pid.P1)
+        self.assertIs(card.preprocessed_dice_cost(game_state, Pid.P1), cost)
+        self.assertEqual(card._preprocessed_dice_cost(game_state, Pid.P1), cost)
+        self.assertEqual(
+            game_state.card_checker().strictly_usable(Pid.P1, card),
+            card.strictly_usable(game_state, Pid.P1),
+        )
+
+        skill_checker = game_state.skill_checker()
+        usable = skill_checker.usable(Pid.P1, 1, CharacterSkill.NORMAL_ATTACK)
+        self.assertIsNotNone(usable)
+        self.assertIs(skill_checker.usable(Pid.P1, 1, CharacterSkill.NORMAL_ATTACK), usable)
+
+        swap_checker = game_state.swap_checker()
+        details = swap_checker.swap_details(Pid.P1, 2)
+        self.assertIsNotNone(details)
+        self.assertIs(swap_checker.swap_details(Pid.P1, 2), details)
+        self.assertIsNone(swap_checker.swap_details(Pid.P1, 1))
+
+    def test_advance_to_decision(self):
+        game_state = GameState.from_default()
+        random.seed(7)
+        decision_state = game_state.advance_to_decision()
+        random.seed(7)
+        self.assertEqual(decision_state, auto_step(game_state))
+        random.seed()
+
+        game_state = just(ACTION_TEMPLATE.action_step(Pid.P1, SkillAction(
+            skill=CharacterSkill.ELEMENTAL_SKILL1,
+            instruction=DiceOnlyInstruction(dices=ActualDices({Element.OMNI: 3})),
+        )))
+        trace: list = []
+        decision_state = game_state.advance_to_decision(trace)
+        self.assertEqual(decision_state, auto_step(game_state))
+        self.assertIsNotNone(decision_state.waiting_for())
+        self.assertGreater(len(trace), 0)
+
+        # already at a decision point
+        self.assertIs(decision_state.advance_to_decision(), decision_state)
+
+    def test_legal_actions(self):
+        game_state = ACTION_TEMPLATE
+        actions = game_state.legal_actions(Pid.P1)
+        self.assertIs(game_state.legal_actions(Pid.P1), actions)
+        self.assertEqual(game_state.legal_actions(Pid.P2), ())
+        self.assertEqual(len(set(actions)), len(actions))
+        self.assertIn(EndRoundAction(), actions)
+        self.assertIn(SkillAction(
+            skill=CharacterSkill.ELEMENTAL_SKILL1,
+            instruction=DiceOnlyInstruction(dices=ActualDices({Element.HYDRO: 3})),
+        ), actions)
+        self.assertEqual(
+            set(action.char_id for action in actions if isinstance(action, SwapAction)),
+            {2, 3},
+        )
+        for action in actions:
+            self.assertIsNotNone(game_state.action_step(Pid.P1, action))
+
+    def test_legal_actions_at_game_end(self):
+        game_state = ACTION_TEMPLATE.factory().f_phase(
+            lambda mode: mode.game_end_phase()
+        ).build()
+        self.assertTrue(game_state.game_end())
+        for pid in Pid:
+            self.assertEqual(game_state.legal_actions(pid), ())
+            self.assertEqual(game_state.legal_action_indices(pid), {})
+            self.assertFalse(game_state.legal_action_mask(pid).any())
+
+    def test_trusted_action_step(self):
+        verify = GameState.VERIFY_TRUSTED_ACTIONS
+        GameState.VERIFY_TRUSTED_ACTIONS = True
+        try:
+            random.seed(16)
+            for _ in range(3):
+                game_state = GameState.from_default()
+                while not game_state.game_end():
+                    pid = game_state.waiting_for()
+                    if pid is None:
+                        game_state = game_state.step()
+                        continue
+                    action = random.choice(game_state.legal_actions(pid))
+                    new_game_state = game_state.action_step(pid, action, trusted=True)
+                    assert new_game_state is not None
+                    game_state = new_game_state
+        finally:
+            GameState.VERIFY_TRUSTED_ACTIONS = verify
+
+    def test_trusted_action_step_checks_rng(self):
+        phase_type = type(ACTION_TEMPLATE.get_phase())
+        step_trusted_action = phase_type.step_trusted_action
+
+        def skewed(phase, game_state, pid, action):
+            new_game_state = just(step_trusted_action(phase, game_state, pid, action))
+            return new_game_state.factory().rng(new_game_state.get_rng().next()).build()
+
+        verify = GameState.VERIFY_TRUSTED_ACTIONS
+        GameState.VERIFY_TRUSTED_ACTIONS = True
+        try:
+            with patch.object(phase_type, "step_trusted_action", skewed):
+                with self.assertRaises(AssertionError):
+                    ACTION_TEMPLATE.action_step(Pid.P1, EndRoundAction(), trusted=True)
+        finally:
+            GameState.VERIFY_TRUSTED_ACTIONS = verify
+
+    def test_prespective_view_hides_rng(self):
+        game_state = GameState.from_default(seed=1)
+        view = game_state.prespective_view(Pid.P1)
+        self.assertNotEqual(view.get_rng(), game_state.get_rng())
+        # the stream of the view doesn't depend on the real one
+        self.assertEqual(
+            view.get_rng(),
+            GameState.from_default(seed=2).prespective_view(Pid.P1).get_rng(),
+        )
+
+    def test_seeded_game(self):
+        def play(seed: int) -> list[GameState]:
+            game_state = GameState.from_default(seed=seed)
+            agent = RandomAgent(seed=seed)
+            history = [game_state]
+            while not game_state.game_end():
+                pid = game_state.waiting_for()
+                if pid is None:
+                    game_state = game_state.step()
+                else:
+                    game_state = just(game_state.action_step(
+                        pid, agent.choose_action(history, pid)
+                    ))
+                history.append(game_state)
+            return history
+
+        history = play(2)
+        random.seed(3)  # the global random module doesn't interfere
+        self.assertEqual(play(2), history)
+        self.assertEqual(history[-1].get_rng(), play(2)[-1].get_rng())
+        self.assertNotEqual(play(5), history)
@@ -144,6 +144,29 @@ class TestGameStateMachine(unittest.TestCase):
         self.assertTrue(state_machine.game_end())
         self.assertIsNone(state_machine.get_winner())
 
+    def test_perspective_history(self):
+        state_machine = GameStateMachine(
+            self._initial_state,
+            LazyAgent(),
+            LazyAgent(),
+        )
+        state_machine.auto_step()
+        state_machine.one_step()
+        state_machine.auto_step()
+        history = state_machine.get_history()
+        views = state_machine.get_perspective_history(Pid.P1)
+        self.assertEqual(len(views), len(history))
+        self.assertIs(state_machine.get_perspective_history(Pid.P1)[0], views[0])
+        for game_state, view in zip(history, views):
+            self.assertEqual(view, game_state.prespective_view(Pid.P1))
+            self.assertEqual(view.get_player1(), game_state.get_player1())
+        # hidden opponent is shared while the opponent doesn't change
+        for (prev_state, state), (prev_view, view) in zip(
+                zip(history, history[1:]), zip(views, views[1:])
+        ):
+            if prev_state.get_player2() is state.get_player2():
+                self.assertIs(prev_view.get_player2(), view.get_player2())
+
     def test_random_agents_not_break_game(self):
         from dgisim.src.mode import AllOmniMode
         mode = AllOmniMode()
@@ -0,0 +1,91 @@
+import os
+import subprocess
+import sys
+import unittest
+
+from dgisim.src.card.cards import Cards
+from dgisim.src.effect.effect import SwapCharacterEffect
+from dgisim.src.effect.structs import StaticTarget
+from dgisim.src.effect.enums import Zone
+from dgisim.src.helper.fingerprint import fingerprint_of
+from dgisim.src.state.enums import Pid
+from dgisim.src.state.game_state import GameState
+from dgisim.tests.helpers.game_state_templates import ACTION_TEMPLATE
+
+_STABLE_STATE_SCRIPT = """
+from dgisim.src.card.cards import Cards
+from dgisim.tests.helpers.game_state_templates import ACTION_TEMPLATE
+no_cards = lambda p: p.factory().hand_cards(Cards({})).deck_cards(Cards({})).build()
+game_state = ACTION_TEMPLATE.factory().f_player1(no_cards).f_player2(no_cards).build()
+print(game_state.fingerprint())
+"""
+
+
+def _fresh_fingerprint(game_state: GameState) -> int:
+    """ fingerprint computed from scratch without any inherited value """
+    return GameState(
+        mode=game_state.get_mode(),
+        phase=game_state.get_phase(),
+        round=game_state.get_round(),
+        active_player_id=game_state.get_active_player_id(),
+        player1=game_state.get_player1().factory().build(),
+        player2=game_state.get_player2().factory().build(),
+        effect_stack=game_state.get_effect_stack(),
+    ).fingerprint()
+
+
+class TestFingerprint(unittest.TestCase):
+    def test_stable_across_processes(self):
+        fingerprints = set()
+        for seed in ("1", "2"):
+            env = dict(os.environ, PYTHONHASHSEED=seed)
+            result = subprocess.run(
+                [sys.executable, "-c", _STABLE_STATE_SCRIPT],
+                env=env,
+                capture_output=True,
+                text=True,
+                check=True,
+            )
+            fingerprints.add(int(result.stdout))
+        self.assertEqual(len(fingerprints), 1)
+
+    def test_incremental_fingerprint(self):
+        base_state = ACTION_TEMPLATE
+        base_fp = base_state.fingerprint()
+
+        # unchanged state inherits the same fingerprint
+        self.assertEqual(base_state.factory().build()._fingerprint, base_fp)
+
+        new_state = base_state.factory().f_player1(
+            lambda p: p.factory().hand_cards(Cards({})).build()
+        ).f_effect_stack(
+            lambda es: es.push_one(SwapCharacterEffect(
+                StaticTarget(Pid.P1, Zone.CHARACTERS, 2)
+            ))
+        ).round(5).build()
+        self.assertIsNotNone(new_state._fingerprint)
+        self.assertNotEqual(new_state.fingerprint(), base_fp)
+        self.assertEqual(new_state.fingerprint(), _fresh_fingerprint(new_state))
+
+        # reverting the changes reverts the fingerprint
+        reverted_state = new_state.factory().player1(
+            base_state.get_player1()
+        ).effect_stack(
+            base_state.get_effect_stack()
+        ).round(base_state.get_round()).build()
+        self.assertEqual(reverted_state.fingerprint(), base_fp)
+
+    def test_players_are_distinguished(self):
+        player_a = ACTION_TEMPLATE.get_player1()
+        player_b = player_a.factory().f_characters(
+            lambda cs: cs.factory().active_character_id(2).build()
+        ).build()
+        state_ab = ACTION_TEMPLATE.factory().player1(player_a).player2(player_b).build()
+        state_ba = ACTION_TEMPLATE.factory().player1(player_b).player2(player_a).build()
+        self.assertNotEqual(state_ab.fingerprint(), state_ba.fingerprint())
+
+    def test_fingerprint_of_values(self):
+        self.assertEqual(fingerprint_of((1, "a")), fingerprint_of((1, "a")))
+        self.assertNotEqual(fingerprint_of((1, "a")), fingerprint_of(("a", 1)))
+        self.assertEqual(fingerprint_of({1: 2, 3: 4}), fingerprint_of({3: 4, 1: 2}))
+        self.assertNotEqual(fingerprint_of(True), fingerprint_of(1))
@@ -44,3 +44,12 @@ class TestQualityOfLife(unittest.TestCase):
         self.assertEqual(just(x, y), y)
         x = 10
         self.assertEqual(just(x, y), x)
+
+    def test_weighted_sub_multisets(self):
+        subs = list(weighted_sub_multisets((("a", 2), ("b", 1))))
+        self.assertEqual(len(subs), 6)
+        self.assertIn(({"a": 1, "b": 1}, 2), subs)
+        self.assertIn(({"a": 2, "b": 0}, 1), subs)
+        # the weights count the 2 ** 3 picks of the distinguishable copies
+        self.assertEqual(sum(num for _, num in subs), 8)
+        self.assertEqual(list(weighted_sub_multisets(())), [({}, 1)])
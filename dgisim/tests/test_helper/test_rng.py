@@ -0,0 +1,36 @@
+import pickle
+import random
+import unittest
+
+from dgisim.src.helper.rng import Rng, random_or_global
+
+
+class TestRng(unittest.TestCase):
+    def test_deterministic_stream(self):
+        rng = Rng.from_seed(42)
+        self.assertEqual(rng, Rng.from_seed(42))
+        self.assertNotEqual(rng, Rng.from_seed(43))
+        self.assertEqual(rng.value(), Rng.from_seed(42).value())
+        self.assertNotEqual(rng.value(), rng.next().value())
+        self.assertEqual(rng.next(), rng.next())
+        self.assertEqual(rng.random().random(), rng.random().random())
+
+    def test_split(self):
+        rng = Rng.from_seed(42)
+        streams = [rng.split(i) for i in range(8)]
+        self.assertEqual(streams[0], rng.split(0))
+        self.assertEqual(len(set(stream.value() for stream in streams)), 8)
+        self.assertNotEqual(rng.split(0), rng.next().split(0))
+
+    def test_pickle(self):
+        rng = Rng.from_seed(42).next()
+        self.assertEqual(pickle.loads(pickle.dumps(rng)), rng)
+
+    def test_random_or_global(self):
+        rand = random.Random(7)
+        self.assertIs(random_or_global(rand), rand)
+        random.seed(7)
+        expected = random.random()
+        random.seed(7)
+        self.assertEqual(random_or_global(None).random(), expected)
+        random.seed()
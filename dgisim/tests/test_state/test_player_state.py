@@ -4,8 +4,13 @@ from dgisim.src.card.card import *
 from dgisim.src.card.cards import Cards
 from dgisim.src.character.character import *
 from dgisim.src.character.characters import Characters
+from dgisim.src.effect.enums import TriggeringSignal
 from dgisim.src.mode import DefaultMode
+from dgisim.src.state.enums import Pid
 from dgisim.src.state.player_state import PlayerState
+from dgisim.src.status.status import CatalyzingFieldStatus
+from dgisim.src.status.status_processing import StatusProcessing
+from dgisim.src.summon.summon import AutumnWhirlwindSummon, OceanicMimicFrogSummon
 from dgisim.src.support.support import Support
 
 class SupportA(Support):
@@ -62,3 +67,24 @@ class TestPlayerState(unittest.TestCase):
         self.assertNotEqual(player_state1, player_state3)
         self.assertNotEqual(hash(player_state1), hash(player_state3))
         self.assertNotEqual(player_state1, "player_state3")
+
+    def test_signal_reactors(self):
+        player_state = PlayerState.example_player(DefaultMode()).factory().f_summons(
+            lambda sms: sms.update_summon(AutumnWhirlwindSummon()).update_summon(
+                OceanicMimicFrogSummon()
+            )
+        ).f_combat_statuses(
+            lambda cstts: cstts.update_status(CatalyzingFieldStatus())
+        ).build()
+        for pid in (Pid.P1, Pid.P2):
+            statuses_in_order = StatusProcessing.player_statuses_in_order(player_state, pid)
+            for signal in TriggeringSignal:
+                self.assertEqual(
+                    player_state.signal_reactors(pid, signal),
+                    tuple(
+                        (status, target)
+                        for status, target in statuses_in_order
+                        if signal in status.REACTABLE_SIGNALS
+                    )
+                )
+        self.assertTrue(player_state.signal_reactors(Pid.P1, TriggeringSignal.END_ROUND_CHECK_OUT))
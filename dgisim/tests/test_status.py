@@ -1,4 +1,5 @@
 import unittest
+from dataclasses import dataclass
 
 from dgisim.src.action.action import *
 from dgisim.src.agents import PuppetAgent
@@ -88,3 +89,27 @@ class TestStatus(unittest.TestCase):
         assert isinstance(status, MushroomPizzaStatus)
         self.assertEqual(character.get_hp(), 3)
         self.assertEqual(status.usages, 1)
+
+    def testHandledKindsDeclared(self):
+        from dgisim.src.status.enums import Informables, Preprocessables
+
+        with self.assertRaises(TypeError):
+            class UndeclaredPreprocessStatus(Status):
+                def _preprocess(self, game_state, status_source, item, signal):
+                    return item, self
+
+        with self.assertRaises(TypeError):
+            class UndeclaredInformStatus(Status):
+                def _inform(self, game_state, status_source, info_type, information):
+                    return self
+
+        class DeclaredStatus(Status):
+            PREPROCESSABLES = frozenset((Preprocessables.SKILL,))
+            INFORMABLES = frozenset((Informables.DMG_DELT,))
+
+            def _preprocess(self, game_state, status_source, item, signal):
+                return item, self
+
+            def _inform(self, game_state, status_source, info_type, information):
+                return self
+
@@ -0,0 +1,47 @@
+import unittest
+from typing import Any
+
+from dgisim.src.card.card import Card
+from dgisim.src.card.cards_set import default_cards
+from dgisim.src.mode import AllOmniMode, DefaultMode
+from dgisim.src.status.status import CrystallizeStatus
+from dgisim.src.summon.summon import BurningFlameSummon
+from dgisim.src.type_registry import TypeIndex, TypeRegistry
+
+
+class TestTypeRegistry(unittest.TestCase):
+    def test_ids(self):
+        registry = DefaultMode().type_registry()
+        self.assertIs(registry, DefaultMode().type_registry())
+        self.assertEqual(frozenset(registry.cards), default_cards())
+        indices: tuple[TypeIndex[Any], ...] = (
+            registry.cards,
+            registry.characters,
+            registry.statuses,
+            registry.summons,
+            registry.supports,
+        )
+        for index in indices:
+            self.assertEqual(
+                [index.id_of(index.type_of(i)) for i in range(len(index))],
+                list(range(len(index))),
+            )
+        self.assertIn(CrystallizeStatus, registry.statuses)
+        self.assertIn(BurningFlameSummon, registry.summons)
+        self.assertNotIn(Card, registry.cards)
+        self.assertRaises(KeyError, lambda: registry.cards.id_of(Card))
+
+    def test_version(self):
+        registry = DefaultMode().type_registry()
+        omni_registry = AllOmniMode().type_registry()
+        self.assertIsNot(registry, omni_registry)
+        self.assertEqual(registry.version, omni_registry.version)
+
+        smaller_registry = TypeRegistry(
+            cards=frozenset(list(registry.cards)[1:]),
+            characters=frozenset(registry.characters),
+            statuses=frozenset(registry.statuses),
+            summons=frozenset(registry.summons),
+            supports=frozenset(registry.supports),
+        )
+        self.assertNotEqual(registry.version, smaller_registry.version)